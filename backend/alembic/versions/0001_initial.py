@@ -0,0 +1,206 @@
+"""initial schema
+
+처음 배포된 스키마 (기존에 Base.metadata.create_all로 만든 DB와 같음)
+기존 DB는 이 리비전으로 stamp 후 upgrade: alembic stamp 0001 && alembic upgrade head
+
+Revision ID: 0001
+Revises: 
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0001'
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# BIGINT PK - SQLite는 INTEGER PRIMARY KEY여야 자동증가 (app/db/database.py BigIntPK와 같음)
+BigIntPK = sa.BigInteger().with_variant(sa.Integer(), "sqlite")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('GROUPT',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(length=50), nullable=False),
+    sa.Column('description', sa.String(length=255), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_GROUPT_id'), 'GROUPT', ['id'], unique=False)
+    op.create_index(op.f('ix_GROUPT_name'), 'GROUPT', ['name'], unique=True)
+    op.create_table('cities',
+    sa.Column('id', BigIntPK, autoincrement=True, nullable=False),
+    sa.Column('city_name', sa.String(length=255), nullable=True),
+    sa.Column('ko_name', sa.String(length=100), nullable=False),
+    sa.Column('country', sa.String(length=100), nullable=False),
+    sa.Column('ko_country', sa.String(length=100), nullable=False),
+    sa.Column('lat', sa.Float(), nullable=True),
+    sa.Column('lon', sa.Float(), nullable=True),
+    sa.Column('is_domestic', sa.Boolean(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_cities_id'), 'cities', ['id'], unique=False)
+    op.create_table('travel_types',
+    sa.Column('id', BigIntPK, autoincrement=True, nullable=False),
+    sa.Column('type_name', sa.String(length=255), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_travel_types_id'), 'travel_types', ['id'], unique=False)
+    op.create_table('weather',
+    sa.Column('id', BigIntPK, autoincrement=True, nullable=False),
+    sa.Column('weather_info', sa.TEXT(), nullable=True),
+    sa.Column('date', sa.DateTime(timezone=True), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_weather_id'), 'weather', ['id'], unique=False)
+    op.create_table('city_weathers',
+    sa.Column('city_id', sa.BigInteger(), nullable=False),
+    sa.Column('weather_id', sa.BigInteger(), nullable=False),
+    sa.ForeignKeyConstraint(['city_id'], ['cities.id'], ),
+    sa.ForeignKeyConstraint(['weather_id'], ['weather.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('city_id', 'weather_id')
+    )
+    op.create_table('places',
+    sa.Column('id', BigIntPK, autoincrement=True, nullable=False),
+    sa.Column('city_id', sa.BigInteger(), nullable=False),
+    sa.Column('place_name', sa.String(length=255), nullable=True),
+    sa.Column('type_id', sa.BigInteger(), nullable=False),
+    sa.Column('place_intro', sa.String(length=4000), nullable=True),
+    sa.Column('is_popular', sa.Boolean(), nullable=True),
+    sa.ForeignKeyConstraint(['city_id'], ['cities.id'], ),
+    sa.ForeignKeyConstraint(['type_id'], ['travel_types.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_places_id'), 'places', ['id'], unique=False)
+    op.create_table('users',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('username', sa.String(length=50), nullable=False),
+    sa.Column('email', sa.String(length=100), nullable=False),
+    sa.Column('password', sa.String(length=255), nullable=False),
+    sa.Column('group_id', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['group_id'], ['GROUPT.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('email')
+    )
+    op.create_table('trip',
+    sa.Column('id', BigIntPK, autoincrement=True, nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('title', sa.String(length=100), nullable=False),
+    sa.Column('start_date', sa.DateTime(), nullable=False),
+    sa.Column('end_date', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_trip_id'), 'trip', ['id'], unique=False)
+    op.create_table('checklist_item',
+    sa.Column('id', BigIntPK, autoincrement=True, nullable=False),
+    sa.Column('trip_id', sa.BigInteger(), nullable=True),
+    sa.Column('item_name', sa.String(length=255), nullable=False),
+    sa.Column('is_checked', sa.Boolean(), nullable=False),
+    sa.ForeignKeyConstraint(['trip_id'], ['trip.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_checklist_item_id'), 'checklist_item', ['id'], unique=False)
+    op.create_table('review',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('trip_id', sa.BigInteger(), nullable=False),
+    sa.Column('city_id', sa.BigInteger(), nullable=False),
+    sa.Column('title', sa.String(length=255), nullable=False),
+    sa.Column('content', sa.Text(), nullable=False),
+    sa.Column('rating', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.TIMESTAMP(), server_default=sa.func.current_timestamp(), nullable=True),
+    sa.ForeignKeyConstraint(['city_id'], ['cities.id'], ),
+    sa.ForeignKeyConstraint(['trip_id'], ['trip.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_review_id'), 'review', ['id'], unique=False)
+    op.create_table('trip_cities',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('start_date', sa.DateTime(), nullable=False),
+    sa.Column('end_date', sa.DateTime(), nullable=False),
+    sa.Column('trip_id', sa.BigInteger(), nullable=False),
+    sa.Column('city_id', sa.BigInteger(), nullable=False),
+    sa.ForeignKeyConstraint(['city_id'], ['cities.id'], ),
+    sa.ForeignKeyConstraint(['trip_id'], ['trip.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_trip_cities_id'), 'trip_cities', ['id'], unique=False)
+    op.create_table('trip_day',
+    sa.Column('id', BigIntPK, autoincrement=True, nullable=False),
+    sa.Column('trip_id', sa.BigInteger(), nullable=False),
+    sa.Column('day_sequence', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['trip_id'], ['trip.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_trip_day_id'), 'trip_day', ['id'], unique=False)
+    op.create_table('comments',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('review_id', sa.Integer(), nullable=False),
+    sa.Column('content', sa.Text(), nullable=False),
+    sa.Column('created_at', sa.TIMESTAMP(), server_default=sa.func.current_timestamp(), nullable=True),
+    sa.ForeignKeyConstraint(['review_id'], ['review.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_comments_id'), 'comments', ['id'], unique=False)
+    op.create_table('likes',
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('review_id', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['review_id'], ['review.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('user_id', 'review_id')
+    )
+    op.create_table('photos',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('review_id', sa.Integer(), nullable=False),
+    sa.Column('filename', sa.String(length=255), nullable=False),
+    sa.Column('data', sa.LargeBinary().with_variant(mysql.LONGBLOB(), 'mysql'), nullable=False),
+    sa.Column('content_type', sa.String(length=50), nullable=False),
+    sa.Column('created_at', sa.TIMESTAMP(), server_default=sa.func.current_timestamp(), nullable=True),
+    sa.ForeignKeyConstraint(['review_id'], ['review.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_photos_id'), 'photos', ['id'], unique=False)
+    op.create_table('schedule',
+    sa.Column('id', BigIntPK, autoincrement=True, nullable=False),
+    sa.Column('trip_day_id', sa.BigInteger(), nullable=True),
+    sa.Column('place_id', sa.BigInteger(), nullable=True),
+    sa.Column('schedule_content', sa.String(length=500), nullable=True),
+    sa.Column('start_time', sa.Time(), nullable=True),
+    sa.Column('end_time', sa.Time(), nullable=True),
+    sa.Column('schedule_datetime', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['place_id'], ['places.id'], ),
+    sa.ForeignKeyConstraint(['trip_day_id'], ['trip_day.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_schedule_id'), 'schedule', ['id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('schedule')
+    op.drop_table('photos')
+    op.drop_table('likes')
+    op.drop_table('comments')
+    op.drop_table('trip_day')
+    op.drop_table('trip_cities')
+    op.drop_table('review')
+    op.drop_table('checklist_item')
+    op.drop_table('trip')
+    op.drop_table('users')
+    op.drop_table('places')
+    op.drop_table('city_weathers')
+    op.drop_table('weather')
+    op.drop_table('travel_types')
+    op.drop_table('cities')
+    op.drop_table('GROUPT')
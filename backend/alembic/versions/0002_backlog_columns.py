@@ -0,0 +1,203 @@
+"""columns and indexes added after the initial schema
+
+README의 'DB 수정사항' DDL을 마이그레이션으로 옮김
+(리뷰 like_count/피드 인덱스/전문검색, 사진 blob store, 날씨 payload, 도시 upsert 키, 일정 position)
+README DDL을 이미 직접 반영한 DB도 있으므로 없는 것만 추가
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 10:10:00.000000
+
+"""
+from typing import Sequence, Union
+import logging
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0002'
+down_revision: Union[str, Sequence[str], None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+logger = logging.getLogger("alembic.runtime.migration")
+
+# SQLite 전문검색 - review를 원본으로 하는 FTS5 외부 컨텐츠 테이블 + 동기화 트리거 (app/db/model/review.py와 같음)
+SQLITE_FTS_STATEMENTS = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS review_fts USING fts5("
+    "title, content, content='review', content_rowid='id', tokenize='trigram')",
+    "CREATE TRIGGER IF NOT EXISTS review_fts_ai AFTER INSERT ON review BEGIN "
+    "INSERT INTO review_fts(rowid, title, content) VALUES (new.id, new.title, new.content); END",
+    "CREATE TRIGGER IF NOT EXISTS review_fts_ad AFTER DELETE ON review BEGIN "
+    "INSERT INTO review_fts(review_fts, rowid, title, content) VALUES ('delete', old.id, old.title, old.content); END",
+    "CREATE TRIGGER IF NOT EXISTS review_fts_au AFTER UPDATE OF title, content ON review BEGIN "
+    "INSERT INTO review_fts(review_fts, rowid, title, content) VALUES ('delete', old.id, old.title, old.content); "
+    "INSERT INTO review_fts(rowid, title, content) VALUES (new.id, new.title, new.content); END",
+    # 기존 리뷰 색인
+    "INSERT INTO review_fts(review_fts) VALUES ('rebuild')",
+)
+
+
+#매번 새로 만들어야 앞 단계에서 바뀐 내용이 보임 (Inspector는 조회 결과를 캐시)
+def _inspector():
+    return sa.inspect(op.get_bind())
+
+
+def _columns(table: str) -> dict:
+    return {column["name"]: column for column in _inspector().get_columns(table)}
+
+
+def _has_index(table: str, name: str) -> bool:
+    inspector = _inspector()
+    names = {index["name"] for index in inspector.get_indexes(table)}
+    names |= {constraint["name"] for constraint in inspector.get_unique_constraints(table)}
+    return name in names
+
+
+def _has_foreign_key(table: str, column: str) -> bool:
+    return any(fk["constrained_columns"] == [column] for fk in _inspector().get_foreign_keys(table))
+
+
+#이전 xlsx 일괄추가는 같은 도시를 여러 번 넣을 수 있었음 - 유니크 제약을 만들기 전에 중복 정리
+#(city_name, country)마다 가장 작은 id만 남기고, cities를 참조하는 행은 남긴 id로 옮긴 뒤 나머지 삭제
+def _dedupe_cities() -> None:
+    bind = op.get_bind()
+    duplicates = bind.execute(sa.text(
+        "SELECT c.id, k.keep_id FROM cities c JOIN ("
+        "SELECT city_name, country, MIN(id) AS keep_id FROM cities "
+        "WHERE city_name IS NOT NULL AND country IS NOT NULL "
+        "GROUP BY city_name, country HAVING COUNT(*) > 1) k "
+        "ON c.city_name = k.city_name AND c.country = k.country AND c.id <> k.keep_id "
+        "ORDER BY c.id")).all()
+    if not duplicates:
+        return
+
+    inspector = _inspector()
+    references = []
+    for table in inspector.get_table_names():
+        primary_key = inspector.get_pk_constraint(table)["constrained_columns"]
+        for fk in inspector.get_foreign_keys(table):
+            if fk["referred_table"] == "cities" and len(fk["constrained_columns"]) == 1:
+                column = fk["constrained_columns"][0]
+                others = [name for name in primary_key if name != column] if column in primary_key else []
+                references.append((table, column, others))
+
+    for duplicate_id, keep_id in duplicates:
+        params = {"duplicate_id": duplicate_id, "keep_id": keep_id}
+        for table, column, others in references:
+            if others:
+                # 복합 기본키(city_weathers) - 남길 도시에 이미 있는 행은 옮기면 키가 겹치므로 삭제
+                # (MySQL은 같은 테이블을 서브쿼리에서 바로 읽을 수 없어 파생 테이블로 감쌈)
+                keys = ", ".join(others)
+                op.execute(sa.text(
+                    f"DELETE FROM {table} WHERE {column} = :duplicate_id AND ({keys}) IN "
+                    f"(SELECT {keys} FROM (SELECT {keys} FROM {table} WHERE {column} = :keep_id) AS kept)"
+                ).bindparams(**params))
+            op.execute(sa.text(f"UPDATE {table} SET {column} = :keep_id WHERE {column} = :duplicate_id")
+                       .bindparams(**params))
+        op.execute(sa.text("DELETE FROM cities WHERE id = :duplicate_id").bindparams(duplicate_id=duplicate_id))
+
+    logger.warning("merged %d duplicate cities into the lowest id per (city_name, country): %s",
+                   len(duplicates), ", ".join(f"{duplicate_id}->{keep_id}" for duplicate_id, keep_id in duplicates))
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    dialect = op.get_bind().dialect.name
+
+    # 리뷰 좋아요 수 비정규화 컬럼 + 기존 좋아요 수 반영
+    if "like_count" not in _columns("review"):
+        op.add_column("review", sa.Column("like_count", sa.Integer(), server_default="0", nullable=False))
+        op.execute("UPDATE review SET like_count = "
+                   "(SELECT COUNT(*) FROM likes WHERE likes.review_id = review.id)")
+
+    # 리뷰/댓글 커서 페이지네이션용 복합 인덱스
+    if not _has_index("review", "ix_review_created_at_id"):
+        op.create_index("ix_review_created_at_id", "review", ["created_at", "id"])
+    if not _has_index("comments", "ix_comments_review_id_created_at_id"):
+        op.create_index("ix_comments_review_id_created_at_id", "comments", ["review_id", "created_at", "id"])
+
+    # 리뷰 전문검색 (MySQL: ngram FULLTEXT / SQLite: FTS5)
+    if dialect == "mysql":
+        if not _has_index("review", "ft_review_title_content"):
+            op.execute("ALTER TABLE review ADD FULLTEXT INDEX ft_review_title_content (title, content) WITH PARSER ngram")
+    elif dialect == "sqlite":
+        for statement in SQLITE_FTS_STATEMENTS:
+            op.execute(statement)
+
+    # 사진 blob store - data는 이전 사진만 값이 있음
+    photo_columns = _columns("photos")
+    with op.batch_alter_table("photos") as batch:
+        if not photo_columns["data"]["nullable"]:
+            batch.alter_column("data", existing_type=sa.LargeBinary().with_variant(mysql.LONGBLOB(), "mysql"),
+                               nullable=True)
+        if "sha256" not in photo_columns:
+            batch.add_column(sa.Column("sha256", sa.String(length=64), nullable=True))
+        if "size" not in photo_columns:
+            batch.add_column(sa.Column("size", sa.Integer(), nullable=True))
+    if not _has_index("photos", "ix_photos_sha256"):
+        op.create_index("ix_photos_sha256", "photos", ["sha256"])
+
+    # 날씨 - zlib 압축 payload, 도시별 최신 날씨 인덱스
+    weather_columns = _columns("weather")
+    with op.batch_alter_table("weather") as batch:
+        if "city_id" not in weather_columns:
+            batch.add_column(sa.Column("city_id", sa.BigInteger(), nullable=True))
+        if "payload" not in weather_columns:
+            batch.add_column(sa.Column("payload", sa.LargeBinary().with_variant(mysql.MEDIUMBLOB(), "mysql"),
+                                       nullable=True))
+    if not _has_foreign_key("weather", "city_id"):
+        with op.batch_alter_table("weather") as batch:
+            batch.create_foreign_key("fk_weather_city_id", "cities", ["city_id"], ["id"], ondelete="CASCADE")
+    if not _has_index("weather", "ix_weather_city_id_date"):
+        op.create_index("ix_weather_city_id_date", "weather", ["city_id", "date"])
+
+    # 도시 - 이름 검색 인덱스, 일괄추가 upsert 키
+    if not _has_index("cities", "ix_cities_city_name"):
+        op.create_index("ix_cities_city_name", "cities", ["city_name"])
+    if not _has_index("cities", "uq_cities_city_name_country"):
+        _dedupe_cities()
+        with op.batch_alter_table("cities") as batch:
+            batch.create_unique_constraint("uq_cities_city_name_country", ["city_name", "country"])
+
+    # 세부 일정 표시 순서
+    if "position" not in _columns("schedule"):
+        op.add_column("schedule", sa.Column("position", sa.Integer(), server_default="0", nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    dialect = op.get_bind().dialect.name
+
+    op.drop_column("schedule", "position")
+
+    with op.batch_alter_table("cities") as batch:
+        batch.drop_constraint("uq_cities_city_name_country", type_="unique")
+    op.drop_index("ix_cities_city_name", table_name="cities")
+
+    op.drop_index("ix_weather_city_id_date", table_name="weather")
+    with op.batch_alter_table("weather") as batch:
+        batch.drop_constraint("fk_weather_city_id", type_="foreignkey")
+        batch.drop_column("payload")
+        batch.drop_column("city_id")
+
+    op.drop_index("ix_photos_sha256", table_name="photos")
+    with op.batch_alter_table("photos") as batch:
+        batch.drop_column("size")
+        batch.drop_column("sha256")
+        batch.alter_column("data", existing_type=sa.LargeBinary().with_variant(mysql.LONGBLOB(), "mysql"),
+                           nullable=False)
+
+    if dialect == "mysql":
+        op.execute("ALTER TABLE review DROP INDEX ft_review_title_content")
+    elif dialect == "sqlite":
+        for trigger in ("review_fts_ai", "review_fts_ad", "review_fts_au"):
+            op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        op.execute("DROP TABLE IF EXISTS review_fts")
+
+    op.drop_index("ix_comments_review_id_created_at_id", table_name="comments")
+    op.drop_index("ix_review_created_at_id", table_name="review")
+    op.drop_column("review", "like_count")
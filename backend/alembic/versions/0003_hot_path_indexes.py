@@ -0,0 +1,68 @@
+"""hot-path composite indexes
+
+자주 쓰는 조회 조건용 인덱스
+- trip(user_id, start_date): 사용자 여행 목록/요약, 다가오는 여행
+- likes(review_id), photos(review_id): 리뷰별 좋아요 수/사진 (likes PK는 user_id가 앞)
+- city_weathers(weather_id): 오래된 날씨 삭제 (PK (city_id, weather_id)는 city_id 조회만 처리)
+- trip_cities(trip_id, start_date), trip_day(trip_id, day_sequence),
+  schedule(trip_day_id, position), checklist_item(trip_id): 여행 전체 조회/요약/일정 일괄 수정
+review(created_at, id), comments(review_id, created_at, id), cities(city_name)는 0002에서 추가
+
+MySQL은 온라인 DDL(ALGORITHM=INPLACE, LOCK=NONE)로 만들어 생성 중에도 읽기/쓰기가 막히지 않음
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18 10:20:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0003'
+down_revision: Union[str, Sequence[str], None] = '0002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (인덱스 이름, 테이블, 컬럼) - 모두 첫 컬럼이 외래키
+INDEXES = (
+    ("ix_trip_user_id_start_date", "trip", ["user_id", "start_date"]),
+    ("ix_likes_review_id", "likes", ["review_id"]),
+    ("ix_photos_review_id", "photos", ["review_id"]),
+    ("ix_city_weathers_weather_id", "city_weathers", ["weather_id"]),
+    ("ix_trip_cities_trip_id_start_date", "trip_cities", ["trip_id", "start_date"]),
+    ("ix_trip_day_trip_id_day_sequence", "trip_day", ["trip_id", "day_sequence"]),
+    ("ix_schedule_trip_day_id_position", "schedule", ["trip_day_id", "position"]),
+    ("ix_checklist_item_trip_id", "checklist_item", ["trip_id"]),
+)
+
+
+def _has_index(table: str, name: str) -> bool:
+    return name in {index["name"] for index in sa.inspect(op.get_bind()).get_indexes(table)}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    mysql = op.get_bind().dialect.name == "mysql"
+    for name, table, columns in INDEXES:
+        if _has_index(table, name):
+            continue
+        if mysql:
+            op.execute(f"CREATE INDEX {name} ON {table} ({', '.join(columns)}) ALGORITHM=INPLACE LOCK=NONE")
+        else:
+            op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    mysql = op.get_bind().dialect.name == "mysql"
+    for name, table, columns in reversed(INDEXES):
+        if mysql:
+            # InnoDB는 외래키 컬럼에 인덱스가 있어야 하므로 외래키용 인덱스를 같이 만들면서 삭제
+            op.execute(f"ALTER TABLE {table} ADD INDEX fk_{table}_{columns[0]} ({columns[0]}), "
+                       f"DROP INDEX {name}, ALGORITHM=INPLACE, LOCK=NONE")
+        else:
+            op.drop_index(name, table_name=table)
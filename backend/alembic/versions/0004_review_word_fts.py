@@ -0,0 +1,55 @@
+"""SQLite word-prefix FTS table for short review search terms
+
+SQLite(로컬/테스트) 리뷰 검색용 review_fts_word (unicode61 토크나이저) + 동기화 트리거
+trigram(review_fts)은 3글자 미만 검색어를 인덱스로 찾지 못하므로 한글 2글자 검색어는 단어 접두어로 검색
+MySQL은 ngram FULLTEXT 인덱스가 2글자 검색어도 처리하므로 변경 없음
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18 12:40:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0004'
+down_revision: Union[str, Sequence[str], None] = '0003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# app/db/model/review.py sqlite_fts_statements("review_fts_word", "unicode61")와 같음
+SQLITE_WORD_FTS_STATEMENTS = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS review_fts_word USING fts5("
+    "title, content, content='review', content_rowid='id', tokenize='unicode61')",
+    "CREATE TRIGGER IF NOT EXISTS review_fts_word_ai AFTER INSERT ON review BEGIN "
+    "INSERT INTO review_fts_word(rowid, title, content) VALUES (new.id, new.title, new.content); END",
+    "CREATE TRIGGER IF NOT EXISTS review_fts_word_ad AFTER DELETE ON review BEGIN "
+    "INSERT INTO review_fts_word(review_fts_word, rowid, title, content) "
+    "VALUES ('delete', old.id, old.title, old.content); END",
+    "CREATE TRIGGER IF NOT EXISTS review_fts_word_au AFTER UPDATE OF title, content ON review BEGIN "
+    "INSERT INTO review_fts_word(review_fts_word, rowid, title, content) "
+    "VALUES ('delete', old.id, old.title, old.content); "
+    "INSERT INTO review_fts_word(rowid, title, content) VALUES (new.id, new.title, new.content); END",
+    # 기존 리뷰 색인
+    "INSERT INTO review_fts_word(review_fts_word) VALUES ('rebuild')",
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name != "sqlite":
+        return
+    for statement in SQLITE_WORD_FTS_STATEMENTS:
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != "sqlite":
+        return
+    for trigger in ("review_fts_word_ai", "review_fts_word_ad", "review_fts_word_au"):
+        op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+    op.execute("DROP TABLE IF EXISTS review_fts_word")
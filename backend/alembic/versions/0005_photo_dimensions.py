@@ -0,0 +1,39 @@
+"""photo width/height
+
+photos.width/height - 원본 이미지 표시 크기(px, EXIF 회전 반영)
+사진 전송시 축소본이 생성 예정인지 원본을 열지 않고 판단하기 위해 업로드/이전할 때 저장
+기존 사진은 NULL - python migrate_photo_blobs.py --dimensions 로 채움
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18 14:10:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0005'
+down_revision: Union[str, Sequence[str], None] = '0004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    columns = {column["name"] for column in sa.inspect(op.get_bind()).get_columns("photos")}
+    with op.batch_alter_table("photos") as batch:
+        if "width" not in columns:
+            batch.add_column(sa.Column("width", sa.Integer(), nullable=True))
+        if "height" not in columns:
+            batch.add_column(sa.Column("height", sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("photos") as batch:
+        batch.drop_column("height")
+        batch.drop_column("width")
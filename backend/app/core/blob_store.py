@@ -0,0 +1,115 @@
+#사진 파일 저장소 (content-addressed blob store)
+#파일 내용의 SHA-256을 키로 저장 - 같은 사진은 한 번만 저장되고, DB(photos)에는 해시와 메타데이터만 남김
+#저장소 종류는 settings.blob_store_backend로 선택 (현재 local 파일시스템만 구현)
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from typing import BinaryIO, Iterator, Optional
+
+from app.core.settings import settings
+
+
+class BlobStore:
+    #data를 저장하고 SHA-256 키 반환 (이미 있으면 다시 쓰지 않음)
+    def put(self, data: bytes) -> str:
+        raise NotImplementedError
+
+    def open(self, key: str) -> BinaryIO:
+        raise NotImplementedError
+
+    def exists(self, key: str) -> bool:
+        raise NotImplementedError
+
+    def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    #저장된 모든 키 (미사용 파일 정리용)
+    def keys(self) -> Iterator[str]:
+        raise NotImplementedError
+
+    #로컬 파일 경로 - 파일시스템 저장소만 반환, 나머지는 None (FileResponse로 바로 전송할 때 사용)
+    def local_path(self, key: str) -> Optional[Path]:
+        return None
+
+    #축소본(썸네일) 경로 - 원본 옆에 <key>.w<width>.<ext>로 저장 (app/core/derivatives.py)
+    def derivative_path(self, key: str, width: int, ext: str) -> Optional[Path]:
+        return None
+
+    #원본 옆에 두는 상태 표시 파일 경로 - <key>.<name> (축소본 생성 실패 표시 등)
+    def marker_path(self, key: str, name: str) -> Optional[Path]:
+        return None
+
+
+class LocalBlobStore(BlobStore):
+    def __init__(self, root: str | Path):
+        self.root = Path(root)
+
+    #ab/cd/abcd... 형태로 2단계 디렉터리 분산 (한 디렉터리에 파일이 몰리지 않게)
+    def _path(self, key: str) -> Path:
+        if len(key) != 64 or any(c not in "0123456789abcdef" for c in key):
+            raise ValueError(f"invalid blob key: {key!r}")
+        return self.root / key[:2] / key[2:4] / key
+
+    def put(self, data: bytes) -> str:
+        key = hashlib.sha256(data).hexdigest()
+        path = self._path(key)
+        if path.exists():
+            return key
+        path.parent.mkdir(parents=True, exist_ok=True)
+        #임시파일에 다 쓴 뒤 rename - 쓰는 도중의 파일이 노출되지 않음
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as tmp:
+                tmp.write(data)
+                tmp.flush()
+                os.fsync(tmp.fileno())
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        return key
+
+    def open(self, key: str) -> BinaryIO:
+        return open(self._path(key), "rb")
+
+    def exists(self, key: str) -> bool:
+        return self._path(key).exists()
+
+    def delete(self, key: str) -> None:
+        path = self._path(key)
+        path.unlink(missing_ok=True)
+        #축소본(<key>.w<width>.<ext>)과 상태 표시 파일(<key>.<name>)도 같이 삭제
+        for sibling in path.parent.glob(f"{key}.*"):
+            sibling.unlink(missing_ok=True)
+
+    def keys(self) -> Iterator[str]:
+        if not self.root.exists():
+            return
+        for path in self.root.glob("??/??/*"):
+            if path.is_file() and len(path.name) == 64:
+                yield path.name
+
+    def local_path(self, key: str) -> Optional[Path]:
+        return self._path(key)
+
+    def derivative_path(self, key: str, width: int, ext: str) -> Optional[Path]:
+        path = self._path(key)
+        return path.with_name(f"{key}.w{width}.{ext}")
+
+    def marker_path(self, key: str, name: str) -> Optional[Path]:
+        return self._path(key).with_name(f"{key}.{name}")
+
+
+_blob_store: Optional[BlobStore] = None
+
+
+def get_blob_store() -> BlobStore:
+    global _blob_store
+    if _blob_store is None:
+        if settings.blob_store_backend == "local":
+            _blob_store = LocalBlobStore(settings.blob_store_root)
+        else:
+            raise RuntimeError(f"지원하지 않는 blob_store_backend: {settings.blob_store_backend}")
+    return _blob_store
@@ -0,0 +1,84 @@
+#프로세스 메모리 캐시
+# - TTLCache   : 최대 개수(LRU) + 만료시간(TTL) 캐시
+# - SingleFlight: 같은 키에 대한 동시 요청 중 하나만 실제로 실행하고 나머지는 그 결과를 기다림
+#워커(프로세스)마다 따로 가지므로 DB 캐시 앞단의 보조 캐시로만 사용
+#이벤트 루프 한 곳에서만 쓰는 것을 전제로 하므로 락을 쓰지 않음
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable, Optional
+
+
+class TTLCache:
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    #없거나 만료되었으면 None
+    def get(self, key: Hashable) -> Optional[Any]:
+        item = self._data.get(key)
+        if item is None:
+            return None
+        expires_at, value = item
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    #ttl을 주면 기본 ttl 대신 사용 (남은 유효시간이 더 짧은 값 등)
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+        if ttl <= 0:
+            self._data.pop(key, None)
+            return
+        self._data[key] = (time.monotonic() + ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False) #가장 오래 안 쓴 항목부터 제거
+
+    def delete(self, key: Hashable) -> None:
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class SingleFlight:
+    def __init__(self):
+        self._calls: dict[Hashable, asyncio.Future] = {}
+
+    #key에 대해 실행 중인 호출이 있으면 그 결과를 기다리고, 없으면 fn()을 실행
+    #먼저 실행한 요청이 취소되면 기다리던 요청 중 하나가 다시 실행
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        while True:
+            future = self._calls.get(key)
+            if future is None:
+                break
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if future.cancelled():
+                    continue
+                raise
+
+        future = asyncio.get_running_loop().create_future()
+        self._calls[key] = future
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as exc:
+            future.set_exception(exc)
+            future.exception() #기다리는 요청이 없을 때 'exception was never retrieved' 경고 방지
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            self._calls.pop(key, None)
@@ -0,0 +1,136 @@
+#도시 목록 일괄 추가 (xlsx / csv)
+#파일을 한 번에 메모리에 올리지 않고 행 단위로 읽어 batch_size개씩 upsert - (city_name, country)가 같으면 갱신
+#같은 파일을 다시 넣어도 중복이 생기지 않으므로 여러 번 실행해도 안전
+#파일 읽기(openpyxl/csv)는 블로킹 작업이므로 배치 단위로 스레드풀에서 실행
+#사용: POST /cities/init (파일 업로드 또는 기본 cities_list_ko.xlsx), python import_cities.py <파일>
+import codecs
+import csv
+import logging
+import time
+import zipfile
+import zlib
+from itertools import islice
+from typing import IO, Callable, Iterator, Optional
+
+from starlette.concurrency import run_in_threadpool
+
+from app.core.settings import BASE_DIR
+from app.db.crud import crud_city
+from app.db.database import AsyncsessionLocal
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CITY_FILE = BASE_DIR / "cities_list_ko.xlsx"
+#파일 컬럼명 -> City 컬럼
+COLUMNS = {"name": "city_name", "lat": "lat", "lon": "lon",
+           "country": "country", "ko_name": "ko_name", "ko_country": "ko_country"}
+REQUIRED = ("city_name", "country", "ko_name", "ko_country")
+
+
+#파일 형식 오류(손상/잘린 파일, 잘못된 인코딩)는 모두 ValueError로 바꿔 올림 - 파일/행 위치를 메시지에 포함
+#(POST /cities/init에서 400으로 응답)
+
+#xlsx - read_only 모드는 행을 하나씩 읽음, data_only는 수식 대신 저장된 값 사용
+def read_xlsx_rows(source: str | IO[bytes]) -> Iterator[dict]:
+    from openpyxl import load_workbook
+    from openpyxl.utils.exceptions import InvalidFileException
+
+    try:
+        workbook = load_workbook(source, read_only=True, data_only=True)
+    except (zipfile.BadZipFile, InvalidFileException, KeyError, EOFError, zlib.error) as e:
+        raise ValueError(f"xlsx 파일을 열 수 없습니다 ({type(e).__name__}: {e})") from e
+    line = 1
+    try:
+        rows = workbook.active.iter_rows(values_only=True)
+        header = [str(name).strip() if name is not None else None for name in next(rows, ())]
+        for line, values in enumerate(rows, start=2):
+            if all(value is None for value in values):
+                continue #빈 행
+            yield dict(zip(header, values))
+    except (zipfile.BadZipFile, KeyError, EOFError, zlib.error) as e:
+        raise ValueError(f"xlsx 파일 {line}행 근처를 읽을 수 없습니다 ({type(e).__name__}: {e})") from e
+    finally:
+        workbook.close()
+
+
+#csv - 첫 행은 헤더 (utf-8, BOM 허용)
+def read_csv_rows(source: str | IO[bytes]) -> Iterator[dict]:
+    if isinstance(source, str):
+        with open(source, newline="", encoding="utf-8-sig") as file:
+            yield from _csv_rows(file)
+    else:
+        yield from _csv_rows(codecs.iterdecode(source, "utf-8-sig"))
+
+
+def _csv_rows(lines) -> Iterator[dict]:
+    reader = csv.DictReader(lines)
+    try:
+        yield from reader
+    except (csv.Error, UnicodeDecodeError) as e:
+        raise ValueError(f"csv 파일 {reader.line_num + 1}행을 읽을 수 없습니다 ({type(e).__name__}: {e})") from e
+
+
+def read_rows(source: str | IO[bytes], filename: str) -> Iterator[dict]:
+    if filename.lower().endswith(".csv"):
+        return read_csv_rows(source)
+    return read_xlsx_rows(source)
+
+
+def _float(value) -> Optional[float]:
+    if value is None or value == "":
+        return None
+    return float(value)
+
+
+#파일 한 행 -> City 컬럼 dict, 필수값이 없으면 None
+def normalize_row(row: dict) -> Optional[dict]:
+    city = {}
+    for source, column in COLUMNS.items():
+        value = row.get(source)
+        if isinstance(value, str):
+            value = value.strip()
+        city[column] = value if value != "" else None
+    if any(city[column] is None for column in REQUIRED):
+        return None
+    try:
+        city["lat"] = _float(city["lat"])
+        city["lon"] = _float(city["lon"])
+    except (TypeError, ValueError):
+        return None
+    return city
+
+
+def _next_batch(rows: Iterator[dict], size: int) -> list[dict]:
+    return list(islice(rows, size))
+
+
+async def import_cities(rows: Iterator[dict],
+                        batch_size: int = 1000,
+                        progress: Optional[Callable[[dict], None]] = None) -> dict:
+    started = time.perf_counter()
+    stats = {"read": 0, "upserted": 0, "skipped": 0, "batches": 0}
+    while True:
+        raw = await run_in_threadpool(_next_batch, rows, batch_size)
+        if not raw:
+            break
+        batch = {}
+        for row in raw:
+            city = normalize_row(row)
+            if city is None:
+                stats["skipped"] += 1
+                continue
+            #같은 배치 안의 중복은 마지막 행 기준 (한 INSERT 안에서 같은 키가 두 번 나오지 않게)
+            batch[(city["city_name"], city["country"])] = city
+        if batch:
+            async with AsyncsessionLocal() as db:
+                await crud_city.upsert_cities(db, list(batch.values()))
+                await db.commit()
+        stats["read"] += len(raw)
+        stats["upserted"] += len(batch)
+        stats["batches"] += 1
+        stats["elapsed"] = round(time.perf_counter() - started, 3)
+        logger.info("city import: %s", stats)
+        if progress:
+            progress(dict(stats))
+    stats["elapsed"] = round(time.perf_counter() - started, 3)
+    return stats
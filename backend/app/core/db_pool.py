@@ -0,0 +1,153 @@
+#DB 연결 풀 설정/관측
+# - pool_options(): Settings의 풀 크기/overflow/대기 timeout/recycle/pre-ping을 create_async_engine 인자로 변환
+# - InstrumentedPool: 연결을 빌려올 때(checkout)까지 기다린 시간을 잰다 (풀이 다 차면 pool_timeout까지 대기)
+# - 풀 이벤트(checkout/checkin/connect/invalidate)로 사용 중인 연결 수, overflow, 누적 횟수를 센다
+#/internal/db/pool 에서 조회 - 워커 수 x (pool_size + max_overflow)가 MySQL max_connections를 넘지 않게 맞출 때 참고
+#워커(프로세스)마다 따로 집계, 이벤트 루프 한 곳에서만 쓰는 것을 전제로 하므로 락을 쓰지 않음
+import time
+from collections import deque
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.core.settings import settings
+
+#대기시간 백분위 계산에 쓰는 최근 표본 수
+WAIT_SAMPLES = 1000
+
+
+class PoolStats:
+    def __init__(self, samples: int = WAIT_SAMPLES):
+        self.samples = samples
+        self.reset()
+
+    def reset(self):
+        self.checkouts = 0      # 연결을 빌려간 횟수
+        self.checkins = 0       # 돌려준 횟수
+        self.connects = 0       # 새로 맺은 DB 연결 수 (recycle/pre-ping 실패 후 재연결 포함)
+        self.invalidations = 0  # 끊겨서 버린 연결 수
+        self.timeouts = 0       # pool_timeout 안에 연결을 못 빌린 횟수
+        self.in_use = 0
+        self.peak_in_use = 0
+        self.peak_overflow = 0
+        self.wait_count = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self._waits: deque[float] = deque(maxlen=self.samples)
+
+    def record_wait(self, seconds: float):
+        self.wait_count += 1
+        self.wait_total += seconds
+        self.wait_max = max(self.wait_max, seconds)
+        self._waits.append(seconds)
+
+    def record_checkout(self, overflow: int):
+        self.checkouts += 1
+        self.in_use += 1
+        self.peak_in_use = max(self.peak_in_use, self.in_use)
+        self.peak_overflow = max(self.peak_overflow, overflow)
+
+    def record_checkin(self):
+        self.checkins += 1
+        self.in_use = max(0, self.in_use - 1)
+
+    #최근 표본 기준 백분위(ms)
+    def wait_percentile_ms(self, percent: float) -> float:
+        if not self._waits:
+            return 0.0
+        ordered = sorted(self._waits)
+        index = min(len(ordered) - 1, int(len(ordered) * percent / 100))
+        return round(ordered[index] * 1000, 3)
+
+    def snapshot(self) -> dict:
+        return {
+            "checkouts": self.checkouts,
+            "checkins": self.checkins,
+            "connects": self.connects,
+            "invalidations": self.invalidations,
+            "timeouts": self.timeouts,
+            "in_use": self.in_use,
+            "peak_in_use": self.peak_in_use,
+            "peak_overflow": self.peak_overflow,
+            "checkout_wait_ms": {
+                "avg": round(self.wait_total / self.wait_count * 1000, 3) if self.wait_count else 0.0,
+                "p50": self.wait_percentile_ms(50),
+                "p95": self.wait_percentile_ms(95),
+                "p99": self.wait_percentile_ms(99),
+                "max": round(self.wait_max * 1000, 3),
+            },
+        }
+
+
+pool_stats = PoolStats()
+
+
+#connect()가 빈 연결을 기다리는(또는 새로 맺는) 시간을 잰다
+class InstrumentedPool(AsyncAdaptedQueuePool):
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            pool_stats.timeouts += 1
+            raise
+        finally:
+            pool_stats.record_wait(time.perf_counter() - started)
+
+
+#create_async_engine 풀 인자 - 메모리 SQLite는 연결 하나를 공유(StaticPool)하므로 기본값 사용
+def pool_options(database_url: str) -> dict:
+    url = make_url(database_url)
+    if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+        return {}
+    return {
+        "poolclass": InstrumentedPool,
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+    }
+
+
+#엔진의 풀 이벤트 등록 (dispose로 풀이 다시 만들어져도 유지됨)
+def instrument(engine: AsyncEngine):
+    sync_engine = engine.sync_engine
+
+    @event.listens_for(sync_engine, "connect")
+    def on_connect(dbapi_connection, connection_record):
+        pool_stats.connects += 1
+
+    @event.listens_for(sync_engine, "checkout")
+    def on_checkout(dbapi_connection, connection_record, connection_proxy):
+        pool = sync_engine.pool
+        pool_stats.record_checkout(max(0, pool.overflow()) if isinstance(pool, AsyncAdaptedQueuePool) else 0)
+
+    @event.listens_for(sync_engine, "checkin")
+    def on_checkin(dbapi_connection, connection_record):
+        pool_stats.record_checkin()
+
+    @event.listens_for(sync_engine, "invalidate")
+    def on_invalidate(dbapi_connection, connection_record, exception):
+        pool_stats.invalidations += 1
+
+
+#현재 풀 상태 + 누적 통계
+def stats(engine: AsyncEngine) -> dict:
+    pool = engine.sync_engine.pool
+    current = {"pool": type(pool).__name__, "status": pool.status()}
+    if isinstance(pool, AsyncAdaptedQueuePool):
+        current.update({
+            "pool_size": pool.size(),
+            "max_overflow": settings.db_max_overflow,
+            "capacity": pool.size() + max(settings.db_max_overflow, 0),  # 워커 하나가 열 수 있는 최대 연결 수
+            "checked_out": pool.checkedout(),
+            "idle": pool.checkedin(),
+            "overflow": max(0, pool.overflow()),  # 풀이 다 차기 전에는 음수로 세므로 0부터
+            "timeout": pool.timeout(),
+            "recycle": settings.db_pool_recycle,
+            "pre_ping": settings.db_pool_pre_ping,
+        })
+    return {**current, **pool_stats.snapshot()}
@@ -0,0 +1,153 @@
+#리뷰 사진 축소본(썸네일) 생성
+#업로드시 고정 너비(settings.photo_derivative_widths)의 WebP/JPEG 축소본을 프로세스 풀에서 만들어 원본 옆에 저장
+#이미지 디코딩/리사이즈는 CPU 작업이므로 이벤트 루프가 아닌 별도 프로세스에서 실행
+#프로세스 풀은 main.py lifespan에서 start_executor()/shutdown_executor()로 관리
+import asyncio
+import io
+import logging
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import Optional
+
+from app.core.blob_store import get_blob_store
+from app.core.settings import settings
+
+logger = logging.getLogger(__name__)
+
+MEDIA_TYPES = {"webp": "image/webp", "jpeg": "image/jpeg"}
+#축소본 생성이 실패했거나 건너뛴 원본 표시 (<key>.derivatives-failed) - 다시 예약하면 지움
+FAILED_MARKER = "derivatives-failed"
+
+_executor: Optional[ProcessPoolExecutor] = None
+_pending: set[asyncio.Future] = set()
+
+
+#프로세스 풀에서 실행되는 함수 (pickle 가능하도록 모듈 최상위에 두고 경로만 주고받음)
+#원본보다 작은 너비만 생성, 생성한 너비 목록 반환
+def generate_derivatives(original_path: str, targets: list[tuple[int, str]], fmt: str, quality: int) -> list[int]:
+    from PIL import Image, ImageOps
+
+    created = []
+    with Image.open(original_path) as image:
+        image = ImageOps.exif_transpose(image)
+        for width, out_path in sorted(targets, reverse=True):
+            if width >= image.width or os.path.exists(out_path):
+                continue
+            height = max(1, round(image.height * width / image.width))
+            resized = image.resize((width, height), Image.Resampling.LANCZOS)
+            if fmt == "jpeg" and resized.mode not in ("RGB", "L"):
+                resized = resized.convert("RGB")
+            #임시파일에 저장 후 rename - 만들어지는 도중의 파일이 전송되지 않게
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(out_path), prefix=".tmp-")
+            try:
+                with os.fdopen(fd, "wb") as tmp:
+                    resized.save(tmp, format=fmt.upper(), quality=quality)
+                os.replace(tmp_path, out_path)
+            except BaseException:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+            created.append(width)
+    return created
+
+
+def start_executor():
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(max_workers=settings.photo_derivative_workers)
+
+
+def shutdown_executor():
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+
+def _targets(key: str) -> list[tuple[int, str]]:
+    store = get_blob_store()
+    ext = settings.photo_derivative_format
+    return [(width, str(store.derivative_path(key, width, ext)))
+            for width in settings.photo_derivative_widths]
+
+
+#업로드/이전할 때 원본의 (너비, 높이) - EXIF 회전을 반영한 표시 크기 (generate_derivatives와 같은 기준)
+#이미지 헤더만 읽으므로 디코딩하지 않음 - 이미지가 아니면 None
+def image_size(data: bytes) -> Optional[tuple[int, int]]:
+    from PIL import Image, UnidentifiedImageError
+
+    try:
+        with Image.open(io.BytesIO(data)) as image:
+            width, height = image.size
+            if image.getexif().get(0x0112) in (5, 6, 7, 8):  # 90도 회전 - 가로/세로가 바뀜
+                width, height = height, width
+    except (OSError, UnidentifiedImageError):
+        return None
+    return width, height
+
+
+def _set_failed(key: str, failed: bool):
+    path = get_blob_store().marker_path(key, FAILED_MARKER)
+    if path is None:
+        return
+    if failed:
+        path.touch()
+    else:
+        path.unlink(missing_ok=True)
+
+
+def _log_result(key: str, future: asyncio.Future):
+    _pending.discard(future)
+    if future.cancelled() or future.exception() is not None:
+        #실패/취소 표시 - 이 사진은 원본을 그대로 캐시하도록 (migrate_photo_blobs.py --derivatives로 다시 생성)
+        _set_failed(key, True)
+        if not future.cancelled():
+            logger.warning("photo derivative generation failed for %s: %s", key, future.exception())
+
+
+#축소본 생성 예약 (결과를 기다리지 않음) - 로컬 저장소가 아니면 건너뜀
+#프로세스 풀이 없으면 생성하지 않으므로 실패로 표시
+def schedule_derivatives(key: str) -> Optional[asyncio.Future]:
+    original = get_blob_store().local_path(key)
+    if original is None:
+        return None
+    if _executor is None:
+        _set_failed(key, True)
+        return None
+    _set_failed(key, False)
+    loop = asyncio.get_running_loop()
+    future = loop.run_in_executor(_executor, generate_derivatives, str(original), _targets(key),
+                                  settings.photo_derivative_format, settings.photo_derivative_quality)
+    _pending.add(future)
+    future.add_done_callback(partial(_log_result, key))
+    return future
+
+
+#요청 너비(size) 이상인 축소본 중 가장 작은 것 (파일, media_type, 너비) - 없으면 None (원본 전송)
+def pick_derivative(key: str, size: int) -> Optional[tuple[Path, str, int]]:
+    store = get_blob_store()
+    ext = settings.photo_derivative_format
+    for width in sorted(settings.photo_derivative_widths):
+        if width < size:
+            continue
+        path = store.derivative_path(key, width, ext)
+        if path is not None and path.exists():
+            return path, MEDIA_TYPES[ext], width
+        #원본이 이 너비보다 작으면 더 큰 축소본도 없음 / 아직 생성 전이면 원본 (derivative_pending으로 구분)
+        return None
+    return None
+
+
+#pick_derivative가 None일 때 - 축소본이 아직 생성 전인지 (True면 지금 보내는 원본은 임시 응답)
+#원본 너비(photos.width, 업로드시 저장)가 요청 너비에 해당하는 축소본보다 넓으면 생성 예정
+#이미지를 열지 않고 저장된 너비와 실패 표시 파일만 확인
+#너비를 모르거나(이미지가 아님/이전 사진) 로컬 저장소가 아니거나 생성이 실패했으면 축소본이 생기지 않으므로 False
+def derivative_pending(key: str, size: int, original_width: Optional[int]) -> bool:
+    widths = [width for width in sorted(settings.photo_derivative_widths) if width >= size]
+    if original_width is None or not widths or original_width <= widths[0]:
+        return False
+    marker = get_blob_store().marker_path(key, FAILED_MARKER)
+    return marker is not None and not marker.exists()
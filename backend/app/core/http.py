@@ -0,0 +1,131 @@
+#외부 API 호출용 공용 HTTP 클라이언트
+#요청마다 클라이언트를 만들면 매번 TCP/TLS 연결을 새로 맺으므로, 앱 전체에서 연결 풀(keep-alive, HTTP/2)을 공유
+# - 연결/읽기 타임아웃 명시
+# - 연결 오류/5xx/429는 지터(jitter)를 준 지수 백오프로 재시도
+# - 계속 실패하면 회로 차단기(circuit breaker)가 열려 일정 시간 외부 호출을 하지 않고 바로 UpstreamUnavailable
+#main.py lifespan에서 start_http_client()/close_http_client()로 관리
+import asyncio
+import logging
+import random
+import time
+from typing import Optional
+
+import httpx
+
+from app.core.settings import settings
+
+logger = logging.getLogger(__name__)
+
+#재시도할 응답 코드
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+
+#외부 API를 쓸 수 없음 (회로 열림 또는 재시도 모두 실패)
+class UpstreamUnavailable(Exception):
+    pass
+
+
+class CircuitBreaker:
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return "half-open"
+        return "open"
+
+    #호출해도 되는지 - 열린 뒤 reset_timeout이 지나면 시험 요청 하나만 허용 (그동안 다른 요청은 차단)
+    def allow(self) -> bool:
+        if self.opened_at is None:
+            return True
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            self.opened_at = time.monotonic()
+            return True
+        return False
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self.opened_at = None
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self.failures >= self.failure_threshold:
+            if self.opened_at is None:
+                logger.warning("circuit opened after %d failures", self.failures)
+            self.opened_at = time.monotonic()
+
+
+class ResilientClient:
+    def __init__(self, client: httpx.AsyncClient, breaker: CircuitBreaker, retries: int, backoff: float):
+        self.client = client
+        self.breaker = breaker
+        self.retries = retries
+        self.backoff = backoff
+
+    #GET - 재시도 대상이 아닌 응답(2xx, 4xx 등)은 그대로 반환
+    async def get(self, url: str, **kwargs) -> httpx.Response:
+        if not self.breaker.allow():
+            raise UpstreamUnavailable("circuit open")
+        error: Exception = UpstreamUnavailable("no attempt")
+        for attempt in range(self.retries + 1):
+            try:
+                response = await self.client.get(url, **kwargs)
+            except httpx.TransportError as exc:
+                error = exc
+            else:
+                if response.status_code not in RETRY_STATUS:
+                    self.breaker.record_success()
+                    return response
+                error = UpstreamUnavailable(f"status {response.status_code}")
+            if attempt < self.retries:
+                #full jitter: 0 ~ backoff * 2^attempt 사이 임의 대기 (여러 요청이 동시에 재시도하지 않게)
+                await asyncio.sleep(random.uniform(0, self.backoff * 2 ** attempt))
+        self.breaker.record_failure()
+        raise UpstreamUnavailable(repr(error)) from error
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        logger.warning("h2 package not installed, using HTTP/1.1")
+        return False
+    return True
+
+
+_client: Optional[ResilientClient] = None
+
+
+def start_http_client() -> ResilientClient:
+    global _client
+    if _client is None:
+        client = httpx.AsyncClient(
+            http2=settings.http_http2 and _http2_available(),
+            timeout=httpx.Timeout(settings.http_read_timeout, connect=settings.http_connect_timeout),
+            limits=httpx.Limits(max_connections=settings.http_max_connections,
+                                max_keepalive_connections=settings.http_max_keepalive),
+        )
+        breaker = CircuitBreaker(settings.http_breaker_failures, settings.http_breaker_reset)
+        _client = ResilientClient(client, breaker, settings.http_retries, settings.http_backoff)
+    return _client
+
+
+async def close_http_client() -> None:
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+#lifespan 밖(스크립트 등)에서 호출되면 처음 사용할 때 생성
+def get_http_client() -> ResilientClient:
+    return start_http_client()
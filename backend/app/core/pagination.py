@@ -0,0 +1,59 @@
+#커서(keyset) 페이지네이션
+#정렬키(created_at 등)와 id를 base64로 감싼 불투명 커서를 주고받는다
+#OFFSET처럼 앞 페이지 행을 읽고 버리지 않으므로 N번째 페이지도 첫 페이지와 비용이 같음
+import base64
+import json
+from datetime import datetime
+from fastapi import HTTPException, status
+from sqlalchemy import and_, or_
+
+#다음 페이지 커서를 내려주는 응답 헤더 (main.py CORS expose_headers에 등록)
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(sort_value: datetime, row_id: int) -> str:
+    raw = json.dumps([sort_value.isoformat(), row_id]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        sort_value, row_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(sort_value), int(row_id)
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="잘못된 커서입니다")
+
+
+#검색 결과용 커서 - 관련도 점수 구간(정수, app/db/crud/review_search.py score_bucket)과 id
+#실수 점수를 그대로 비교하면 쿼리마다 미세하게 달라진 값 때문에 행이 빠지거나 중복될 수 있어 정수만 주고받음
+def encode_rank_cursor(score_bucket: int, row_id: int) -> str:
+    raw = json.dumps([score_bucket, row_id]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_rank_cursor(cursor: str) -> tuple[int, int]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        score_bucket, row_id = json.loads(base64.urlsafe_b64decode(padded))
+        return int(score_bucket), int(row_id)
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="잘못된 커서입니다")
+
+
+#(sort_col, id_col) 기준으로 커서 다음 행만 고르는 조건
+#(sort_col, id_col) 복합 인덱스를 그대로 타도록 튜플 비교 대신 OR/AND로 풀어서 작성
+def keyset_filter(sort_col, id_col, sort_value, row_id: int, descending: bool = True):
+    if descending:
+        return or_(sort_col < sort_value,
+                   and_(sort_col == sort_value, id_col < row_id))
+    return or_(sort_col > sort_value,
+               and_(sort_col == sort_value, id_col > row_id))
+
+
+#가져온 행 수가 limit과 같으면 마지막 행 기준으로 다음 커서 생성, 아니면 마지막 페이지
+def next_cursor(rows: list, limit: int, sort_attr: str = "created_at", id_attr: str = "id") -> str | None:
+    if not rows or len(rows) < limit:
+        return None
+    last = rows[-1]
+    return encode_cursor(getattr(last, sort_attr), getattr(last, id_attr))
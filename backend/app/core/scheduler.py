@@ -0,0 +1,63 @@
+#앱 내부 주기 작업 스케줄러
+#main.py lifespan에서 scheduler.start()/stop() - 작업마다 asyncio task 하나가 interval 간격으로 반복 실행
+#작업이 실패해도 로그만 남기고 다음 주기에 다시 실행 (서버 요청 처리에는 영향 없음)
+#워커(프로세스)를 여러 개 띄우면 워커마다 실행되므로 작업은 여러 번 실행되어도 안전해야 함
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PeriodicJob:
+    name: str
+    interval: float                         # 초
+    func: Callable[[], Awaitable[Any]]
+    initial_delay: float = 0                # 서버 시작 후 첫 실행까지 대기(초)
+    last_run: Optional[float] = field(default=None, init=False)
+    last_result: Any = field(default=None, init=False)
+    last_error: Optional[str] = field(default=None, init=False)
+
+    async def run_forever(self):
+        await asyncio.sleep(self.initial_delay)
+        while True:
+            started = time.perf_counter()
+            try:
+                self.last_result = await self.func()
+                self.last_error = None
+                logger.info("job %s finished in %.1fs: %s", self.name, time.perf_counter() - started, self.last_result)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                self.last_error = repr(exc)
+                logger.exception("job %s failed", self.name)
+            self.last_run = time.time()
+            await asyncio.sleep(self.interval)
+
+
+class Scheduler:
+    def __init__(self):
+        self.jobs: dict[str, PeriodicJob] = {}
+        self._tasks: dict[str, asyncio.Task] = {}
+
+    def add(self, job: PeriodicJob) -> PeriodicJob:
+        self.jobs[job.name] = job
+        return job
+
+    def start(self):
+        for name, job in self.jobs.items():
+            if name not in self._tasks:
+                self._tasks[name] = asyncio.create_task(job.run_forever(), name=f"job:{name}")
+
+    async def stop(self):
+        tasks = list(self._tasks.values())
+        self._tasks.clear()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+scheduler = Scheduler()
@@ -1,11 +1,67 @@
 #비밀번호 암호화
+#bcrypt는 한 번에 수십 ms CPU를 쓰므로 async 핸들러에서는 전용 스레드풀에서 실행 (이벤트 루프가 멈추지 않게)
+#스레드 수(password_hash_workers)가 동시에 계산하는 개수의 상한 - 로그인이 몰리면 나머지는 대기
+#작업량(bcrypt_rounds)을 바꾸면 다음 로그인 때 새 rounds로 다시 해시해 저장 (verify_and_update)
+#관리/내부용 API 토큰 확인 (verify_internal_token)
+import asyncio
+import secrets
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+from fastapi import Header, HTTPException, status
 from passlib.context import CryptContext
 
+from app.core.settings import settings
+
+#min/max를 기본값과 같게 두어 rounds가 다른 기존 해시는 needs_update 대상이 됨
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto",
+                           bcrypt__default_rounds=settings.bcrypt_rounds,
+                           bcrypt__min_rounds=settings.bcrypt_rounds,
+                           bcrypt__max_rounds=settings.bcrypt_rounds)
+
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=settings.password_hash_workers,
+                                       thread_name_prefix="password-hash")
+    return _executor
+
+
+#main.py lifespan 종료시
+def shutdown_executor():
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 def hash_password(password: str) -> str:
     return pwd_context.hash(password)
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
\ No newline at end of file
+    return pwd_context.verify(plain_password, hashed_password)
+
+#(일치여부, 새 해시) - 해시 설정(rounds 등)이 바뀌었으면 새 해시, 아니면 None
+def verify_and_update_password(plain_password: str, hashed_password: str) -> tuple[bool, Optional[str]]:
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
+
+#async 핸들러용 - 전용 스레드풀에서 실행
+async def hash_password_async(password: str) -> str:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_executor(), hash_password, password)
+
+async def verify_and_update_password_async(plain_password: str, hashed_password: str) -> tuple[bool, Optional[str]]:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_executor(), verify_and_update_password, plain_password, hashed_password)
+
+
+#관리/내부용 API 의존성 - X-Internal-Token 헤더가 settings.internal_api_token과 같아야 함
+#토큰을 설정하지 않은 서버에서는 항상 거부
+async def verify_internal_token(x_internal_token: Optional[str] = Header(None)):
+    expected = settings.internal_api_token
+    if not expected or not x_internal_token or not secrets.compare_digest(x_internal_token, expected):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="내부 API 접근 권한이 없습니다")
@@ -1,6 +1,7 @@
 from pydantic_settings import BaseSettings
 from pydantic import Field
 from pathlib import Path
+from typing import Optional
 
 BASE_DIR = Path(__file__).resolve().parent.parent.parent
 ENV_PATH = BASE_DIR / ".env"
@@ -12,15 +13,75 @@ class Settings(BaseSettings):
     db_host: str = Field("localhost", alias="DB_HOST")
     db_port: str = Field("3306", alias="DB_PORT")
     db_name: str = Field(..., alias="DB_NAME")
+    # 설정시 MySQL 대신 사용할 DB URL (로컬/테스트용 예: sqlite+aiosqlite:///./planit.db)
+    database_url_override: Optional[str] = Field(None, alias="DATABASE_URL")
+    # 서버 시작시 없는 테이블 자동 생성 (로컬/테스트용) - 운영 DB 스키마는 alembic upgrade head로 관리
+    auto_create_tables: bool = Field(False, alias="AUTO_CREATE_TABLES")
+    # DB 연결 풀 (app/core/db_pool.py) - 워커당 최대 연결 수는 pool_size + max_overflow
+    # timeout: 빈 연결을 기다리는 최대 시간(초) / recycle: 이 시간(초)이 지난 연결은 새로 맺음 (MySQL wait_timeout보다 짧게, -1이면 끔)
+    # pre_ping: 빌려줄 때마다 연결이 살아있는지 확인 (끊긴 연결로 인한 오류 방지)
+    db_pool_size: int = Field(10, alias="DB_POOL_SIZE")
+    db_max_overflow: int = Field(10, alias="DB_MAX_OVERFLOW")
+    db_pool_timeout: float = Field(30.0, alias="DB_POOL_TIMEOUT")
+    db_pool_recycle: int = Field(1800, alias="DB_POOL_RECYCLE")
+    db_pool_pre_ping: bool = Field(True, alias="DB_POOL_PRE_PING")
     app_port: str = Field("8081", alias="APP_PORT")
     app_host: str = Field("localhost", alias="APP_HOST")
     # JWT settings
     secret_key: str = Field(..., alias="SECRET_KEY")
     algorithm: str = Field(..., alias="ALGORITHM")
     access_token_expire_minutes: int = Field(..., alias="ACCESS_TOKEN_EXPIRE_MINUTES")
+    # 비밀번호 해시 (app/core/security.py) - bcrypt 작업량(2^rounds) / 해시 계산 스레드 수
+    bcrypt_rounds: int = Field(12, alias="BCRYPT_ROUNDS")
+    password_hash_workers: int = Field(4, alias="PASSWORD_HASH_WORKERS")
+    # 인증 사용자 캐시 (get_current_user) - 사용자 수 / 유지시간(초)
+    user_cache_size: int = Field(10000, alias="USER_CACHE_SIZE")
+    user_cache_ttl: int = Field(300, alias="USER_CACHE_TTL")
+    # 관리/내부용 API(좋아요 수 보정, DB 풀 상태 등) 토큰 - X-Internal-Token 헤더로 전달, 설정하지 않으면 해당 API 사용 불가
+    internal_api_token: Optional[str] = Field(None, alias="INTERNAL_API_TOKEN")
+
+    # 사진 저장소 (app/core/blob_store.py)
+    blob_store_backend: str = Field("local", alias="BLOB_STORE_BACKEND")
+    blob_store_root: str = Field(str(BASE_DIR / "media" / "photos"), alias="BLOB_STORE_ROOT")
+    # 사진 축소본 (app/core/derivatives.py) - 너비 목록은 JSON 배열로 지정 (예: [320,640,1280])
+    photo_derivative_widths: list[int] = Field([320, 640, 1280], alias="PHOTO_DERIVATIVE_WIDTHS")
+    photo_derivative_format: str = Field("webp", alias="PHOTO_DERIVATIVE_FORMAT") # webp | jpeg
+    photo_derivative_quality: int = Field(80, alias="PHOTO_DERIVATIVE_QUALITY")
+    photo_derivative_workers: int = Field(2, alias="PHOTO_DERIVATIVE_WORKERS")
+    # 리뷰 피드 카드에 쓰는 사진 너비 (photo_url의 size 파라미터)
+    feed_photo_size: int = Field(640, alias="FEED_PHOTO_SIZE")
+
+    # 도시 자동완성 인덱스 재생성 주기(초) - 다른 워커에서 추가/삭제한 도시 반영
+    city_index_refresh_interval: int = Field(600, alias="CITY_INDEX_REFRESH_INTERVAL")
 
     #Openweather API
     openweather_api_key: str = Field(..., alias="openweather_api_key")
+    openweather_url: str = Field("https://api.openweathermap.org/data/3.0/onecall", alias="OPENWEATHER_URL")
+    # 외부 API 공용 HTTP 클라이언트 (app/core/http.py) - 타임아웃/재시도 백오프/차단기 reset은 초 단위
+    http_http2: bool = Field(True, alias="HTTP_HTTP2")
+    http_connect_timeout: float = Field(3.0, alias="HTTP_CONNECT_TIMEOUT")
+    http_read_timeout: float = Field(10.0, alias="HTTP_READ_TIMEOUT")
+    http_max_connections: int = Field(20, alias="HTTP_MAX_CONNECTIONS")
+    http_max_keepalive: int = Field(10, alias="HTTP_MAX_KEEPALIVE")
+    http_retries: int = Field(2, alias="HTTP_RETRIES")
+    http_backoff: float = Field(0.3, alias="HTTP_BACKOFF")
+    http_breaker_failures: int = Field(5, alias="HTTP_BREAKER_FAILURES")
+    http_breaker_reset: float = Field(30.0, alias="HTTP_BREAKER_RESET")
+    # 날씨 메모리 캐시 (app/services/weather.py) - 도시 수 / 최대 유지시간(초)
+    weather_cache_size: int = Field(1024, alias="WEATHER_CACHE_SIZE")
+    weather_cache_ttl: int = Field(1800, alias="WEATHER_CACHE_TTL")
+    # 다가오는 여행 도시 날씨 미리 조회 (app/core/scheduler.py 주기 작업)
+    # interval(초)마다 prefetch_days일 이내 시작하는 여행 도시 중 남은 유효시간이 lead(초) 미만인 날씨 갱신
+    weather_prefetch_enabled: bool = Field(True, alias="WEATHER_PREFETCH_ENABLED")
+    weather_prefetch_interval: int = Field(900, alias="WEATHER_PREFETCH_INTERVAL")
+    weather_prefetch_days: int = Field(7, alias="WEATHER_PREFETCH_DAYS")
+    weather_prefetch_lead: int = Field(1800, alias="WEATHER_PREFETCH_LEAD")
+    weather_prefetch_concurrency: int = Field(4, alias="WEATHER_PREFETCH_CONCURRENCY")
+    # 오래된 날씨 삭제 (주기 작업) - 보관일수 / 청크당 행 수 / 청크 사이 대기(초) / 실행 주기(초)
+    weather_retention_days: int = Field(30, alias="WEATHER_RETENTION_DAYS")
+    weather_retention_chunk: int = Field(1000, alias="WEATHER_RETENTION_CHUNK")
+    weather_retention_pause: float = Field(0.2, alias="WEATHER_RETENTION_PAUSE")
+    weather_retention_interval: int = Field(21600, alias="WEATHER_RETENTION_INTERVAL")
 
     class Config:
         env_file = ENV_PATH
@@ -34,6 +95,8 @@ class Settings(BaseSettings):
     
     @property
     def database_url(self) -> str:
+        if self.database_url_override:
+            return self.database_url_override
         return f'mysql+aiomysql://{self.tmp_db}'
     
     @property
@@ -1,4 +1,5 @@
 from .review import ReviewCrud, LikeCrud
+from .review_search import ReviewSearchCrud
 from .comment import CommentCrud
 from .photo import PhotoCrud
 from .weather import WeatherCrud
\ No newline at end of file
@@ -3,6 +3,7 @@ from app.db.model import Comment
 from app.db.schema.comment import CommentCreate, CommentUpdate, CommentRead
 from sqlalchemy import select, or_, desc, func
 from typing import Optional
+from app.core.pagination import decode_cursor, keyset_filter
 
 class CommentCrud:
     @staticmethod
@@ -23,22 +24,58 @@ class CommentCrud:
     async def get_id(db:AsyncSession, comment_id:int) -> Optional[Comment]:
         return await db.get(Comment, comment_id)
 
+    #cursor가 있으면 (created_at, id) 오름차순 keyset 페이지네이션, 없으면 기존 offset 방식
     @staticmethod
     async def get_all(db:AsyncSession,
                       review_id:int, 
                       search:Optional[str]=None,                     
                       limit:int=10,
-                      offset:int = 0
+                      offset:int = 0,
+                      cursor:Optional[str]=None
                       ):
         #데이터선택
-        query = select(Comment).where(Comment.review_id == review_id)
+        query = (select(Comment)
+                 .where(Comment.review_id == review_id)
+                 .order_by(Comment.created_at, Comment.id))
         
         #페이지네이션
-        query = query.limit(limit).offset(offset)
+        if cursor:
+            created_at, comment_id = decode_cursor(cursor)
+            query = query.where(keyset_filter(Comment.created_at, Comment.id,
+                                              created_at, comment_id, descending=False))
+        else:
+            query = query.offset(offset)
+        query = query.limit(limit)
 
         result = await db.execute(query)
         return result.scalars().all() #rows=result.scalars().all()
     
+    #리뷰별 앞쪽 댓글 N개 일괄 조회 - 피드용 {review_id: [Comment]}
+    #row_number() 윈도우 함수로 리뷰마다 created_at 순 상위 N개만 잘라서 한 번에 가져옴
+    @staticmethod
+    async def get_first_by_reviews(db:AsyncSession,
+                                   review_ids:list[int],
+                                   per_review:int=10) -> dict[int, list[Comment]]:
+        if not review_ids:
+            return {}
+        row_num = func.row_number().over(
+            partition_by=Comment.review_id,
+            order_by=(Comment.created_at, Comment.id)
+        ).label('row_num')
+        ranked = (select(Comment.id, row_num)
+                  .where(Comment.review_id.in_(review_ids))
+                  .subquery())
+        query = (select(Comment)
+                 .join(ranked, Comment.id == ranked.c.id)
+                 .where(ranked.c.row_num <= per_review)
+                 .order_by(Comment.review_id, Comment.created_at, Comment.id))
+        result = await db.execute(query)
+
+        comments: dict[int, list[Comment]] = {}
+        for comment in result.scalars().all():
+            comments.setdefault(comment.review_id, []).append(comment)
+        return comments
+
     #Update(review_id)
     @staticmethod
     async def update_by_id(db:AsyncSession, comment:CommentUpdate, comment_id:int, user_id:int) -> Optional[Comment]:
@@ -1,5 +1,6 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
+from sqlalchemy.dialects import mysql, postgresql, sqlite
 from typing import List, Optional
 from app.db.model.cities import City
 from app.db.schema.cities import CityCreate
@@ -8,8 +9,7 @@ from app.db.schema.cities import CityCreate
 async def create_city(db: AsyncSession, city: CityCreate) -> City:
     db_city = City(**city.model_dump())
     db.add(db_city)
-    await db.commit()
-    await db.refresh(db_city)
+    await db.flush()
     return db_city
 
 # 도시 조회(Read)
@@ -32,5 +32,24 @@ async def delete_city(db: AsyncSession, city_id: int) -> Optional[City]:
     db_city = await get_city(db, city_id)
     if db_city:
         await db.delete(db_city)
-        await db.commit()
-    return db_city
\ No newline at end of file
+        await db.flush()
+    return db_city
+
+# 도시 일괄 upsert - (city_name, country) 유니크 키가 같으면 좌표/한글명 갱신, 없으면 추가
+# rows: City 컬럼 dict 목록 (여러 행을 INSERT 한 번으로 처리, 커밋은 호출하는 쪽에서)
+UPSERT_UPDATE_COLUMNS = ("lat", "lon", "ko_name", "ko_country")
+
+async def upsert_cities(db: AsyncSession, rows: List[dict]) -> None:
+    if not rows:
+        return
+    dialect = db.bind.dialect.name
+    if dialect == "mysql":
+        stmt = mysql.insert(City).values(rows)
+        stmt = stmt.on_duplicate_key_update({column: stmt.inserted[column] for column in UPSERT_UPDATE_COLUMNS})
+    else:
+        insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+        stmt = insert(City).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["city_name", "country"],
+            set_={column: stmt.excluded[column] for column in UPSERT_UPDATE_COLUMNS})
+    await db.execute(stmt)
@@ -8,8 +8,7 @@ from app.db.schema.places import PlaceCreate
 async def create_place(db: AsyncSession, place: PlaceCreate) -> Place:
     db_place = Place(**place.model_dump())
     db.add(db_place)
-    await db.commit()
-    await db.refresh(db_place)
+    await db.flush()
     return db_place
 
 # 장소 조회(Read)
@@ -32,5 +31,5 @@ async def delete_place(db: AsyncSession, place_id: int) -> Optional[Place]:
     db_place = await get_place(db, place_id)
     if db_place:
         await db.delete(db_place)
-        await db.commit()
+        await db.flush()
     return db_place
\ No newline at end of file
@@ -1,9 +1,14 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
+from sqlalchemy import insert, update, delete, func, case, desc
 from sqlalchemy.orm import selectinload
 from typing import List, Optional
+from datetime import date
+
+from app.core.pagination import decode_cursor, keyset_filter
 
 from app.db.model.trip import Trip
+from app.db.model.cities import City
 from app.db.model.trip_day import TripDay
 from app.db.model.trip_city import TripCity
 from app.db.model.schedule import Schedule
@@ -19,8 +24,7 @@ from app.db.schema.checklist_item import ChecklistItemCreate, ChecklistItemUpdat
 async def create_trip(db: AsyncSession, trip: TripCreate) -> Trip:
     db_trip = Trip(**trip.model_dump())
     db.add(db_trip)
-    await db.commit()
-    await db.refresh(db_trip)
+    await db.flush()
     return db_trip
 
 # 여행 조회(Read)
@@ -46,17 +50,95 @@ async def get_trips_by_user(db: AsyncSession, user_id: int) -> List[Trip]:
     result = await db.execute(stmt)
     return result.scalars().all()
 
+# 사용자 여행 요약 목록 (홈 화면용) - 관계를 로드하지 않고 상관 서브쿼리로 한 번에 집계
+# period: upcoming(종료일이 오늘 이후, 가까운 순) / past(종료일이 오늘 이전, 최근 순) / all(최근 순)
+# cursor: (start_date, id) keyset 페이지네이션
+async def get_trip_summaries(db: AsyncSession, user_id: int, period: str, today: date,
+                             limit: int = 20, cursor: Optional[str] = None) -> List:
+    first_city_name = (select(func.coalesce(City.ko_name, City.city_name))
+                       .join(TripCity, TripCity.city_id == City.id)
+                       .where(TripCity.trip_id == Trip.id)
+                       .order_by(TripCity.start_date, TripCity.id)
+                       .limit(1)
+                       .scalar_subquery())
+    day_count = (select(func.count(TripDay.id))
+                 .where(TripDay.trip_id == Trip.id)
+                 .scalar_subquery())
+    checklist_total = (select(func.count(ChecklistItem.id))
+                       .where(ChecklistItem.trip_id == Trip.id)
+                       .scalar_subquery())
+    checklist_checked = (select(func.coalesce(func.sum(case((ChecklistItem.is_checked, 1), else_=0)), 0))
+                         .where(ChecklistItem.trip_id == Trip.id)
+                         .scalar_subquery())
+
+    stmt = select(Trip.id, Trip.title, Trip.start_date, Trip.end_date,
+                  first_city_name.label("first_city_name"),
+                  day_count.label("day_count"),
+                  checklist_total.label("checklist_total"),
+                  checklist_checked.label("checklist_checked")).where(Trip.user_id == user_id)
+
+    ends_on = func.coalesce(Trip.end_date, Trip.start_date)
+    ascending = period == "upcoming"
+    if period == "upcoming":
+        stmt = stmt.where(ends_on >= today)
+    elif period == "past":
+        stmt = stmt.where(ends_on < today)
+
+    if cursor:
+        start_date, trip_id = decode_cursor(cursor)
+        stmt = stmt.where(keyset_filter(Trip.start_date, Trip.id, start_date, trip_id, descending=not ascending))
+    if ascending:
+        stmt = stmt.order_by(Trip.start_date, Trip.id)
+    else:
+        stmt = stmt.order_by(desc(Trip.start_date), desc(Trip.id))
+
+    result = await db.execute(stmt.limit(limit))
+    return result.all()
+
 # 11/2 추가(나영일)
+# populate_existing : 같은 세션에서 방금 생성/수정한 Trip도 관계(City 포함)를 다시 채움
 async def get_trip_with_relations(db: AsyncSession, trip_id: int) -> Optional[Trip]:
 
     # Trip을 가져올 때, 'trip_cities'와 'trip_day'를 Eager Loading으로 함께 가져온다.
     stmt = select(Trip).where(Trip.id == trip_id).options(
         selectinload(Trip.trip_cities).selectinload(TripCity.city), # TripCity와 그 안의 City까지 Join
         selectinload(Trip.trip_day) # TripDay Join
+    ).execution_options(populate_existing=True)
+    result = await db.execute(stmt)
+    return result.scalars().first()
+
+# 여행 전체 조회 : Trip + 도시 + 일자 + 세부 일정(장소) + 체크리스트
+# 관계마다 selectinload 한 번씩 - 일자/일정 수와 관계없이 쿼리 7번으로 고정
+async def get_trip_full(db: AsyncSession, trip_id: int) -> Optional[Trip]:
+    stmt = select(Trip).where(Trip.id == trip_id).options(
+        selectinload(Trip.trip_cities).selectinload(TripCity.city),
+        selectinload(Trip.trip_day).selectinload(TripDay.schedule).selectinload(Schedule.place),
+        selectinload(Trip.checklist_item)
     )
     result = await db.execute(stmt)
     return result.scalars().first()
 
+# 다가오는 여행 조회 쿼리 (from_date 이후 시작, 시작일 오름차순)
+# user_id: 특정 사용자의 여행만 / until: until 이전에 시작하는 여행만
+# TripService.get_next_trip_with_city, 날씨 미리 조회(WeatherService.prefetch_upcoming)에서 같이 사용
+def upcoming_trips_stmt(from_date: date, user_id: Optional[int] = None, until: Optional[date] = None):
+    stmt = select(Trip).where(Trip.start_date >= from_date)
+    if user_id is not None:
+        stmt = stmt.where(Trip.user_id == user_id)
+    if until is not None:
+        stmt = stmt.where(Trip.start_date < until)
+    return stmt.order_by(Trip.start_date.asc())
+
+# 다가오는 여행들의 도시이름 (중복 제거)
+async def get_upcoming_city_names(db: AsyncSession, from_date: date, until: date) -> List[str]:
+    trip_ids = upcoming_trips_stmt(from_date, until=until).with_only_columns(Trip.id).order_by(None)
+    stmt = (select(City.city_name)
+            .join(TripCity, TripCity.city_id == City.id)
+            .where(TripCity.trip_id.in_(trip_ids), City.city_name.is_not(None))
+            .distinct())
+    result = await db.execute(stmt)
+    return list(result.scalars().all())
+
 async def get_trip_cities(db: AsyncSession, trip_id: int) -> List[TripCity]:
     # Trip에 속한 도시 목록만 반환한다.
     stmt = select(TripCity).where(
@@ -67,6 +149,38 @@ async def get_trip_cities(db: AsyncSession, trip_id: int) -> List[TripCity]:
     result = await db.execute(stmt)
     return result.scalars().all()
 
+# 여행의 TripCity (id, city_id, start_date, end_date) 목록 - 수정시 비교용 (객체를 만들지 않음)
+async def get_trip_city_rows(db: AsyncSession, trip_id: int) -> List[tuple]:
+    result = await db.execute(select(TripCity.id, TripCity.city_id, TripCity.start_date, TripCity.end_date)
+                              .where(TripCity.trip_id == trip_id)
+                              .order_by(TripCity.id))
+    return [tuple(row) for row in result.all()]
+
+# TripCity 변경분만 적용 : DELETE 한 번 + 기본키 기준 bulk UPDATE + bulk INSERT
+async def apply_trip_city_changes(db: AsyncSession, trip_id: int, deletes: List[int],
+                                  updates: List[dict], creates: List[dict]):
+    if deletes:
+        await db.execute(delete(TripCity)
+                         .where(TripCity.trip_id == trip_id, TripCity.id.in_(deletes))
+                         .execution_options(synchronize_session=False))
+    if updates:
+        await db.execute(update(TripCity), updates)
+    if creates:
+        await db.execute(insert(TripCity), creates)
+
+# 여행 기간이 바뀌었을 때 TripDay 뒤쪽만 조정
+# 줄어들면 day_sequence > new_days 인 일자(와 그 세부 일정)를 삭제, 늘어나면 old_days+1 ~ new_days 일자를 bulk INSERT
+async def resize_trip_days(db: AsyncSession, trip_id: int, old_days: int, new_days: int):
+    if new_days < old_days:
+        removed = select(TripDay.id).where(TripDay.trip_id == trip_id, TripDay.day_sequence > new_days)
+        await db.execute(delete(Schedule).where(Schedule.trip_day_id.in_(removed))
+                         .execution_options(synchronize_session=False))
+        await db.execute(delete(TripDay).where(TripDay.trip_id == trip_id, TripDay.day_sequence > new_days)
+                         .execution_options(synchronize_session=False))
+    elif new_days > old_days:
+        await db.execute(insert(TripDay), [{"trip_id": trip_id, "day_sequence": i}
+                                           for i in range(old_days + 1, new_days + 1)])
+
 # 여행 수정(Update)
 async def update_trip(db: AsyncSession, trip_id: int, trip_update: TripUpdate) -> Optional[Trip]:
     db_trip = await get_trip(db, trip_id)
@@ -75,8 +189,7 @@ async def update_trip(db: AsyncSession, trip_id: int, trip_update: TripUpdate) -
         update_data = trip_update.model_dump(exclude_unset=True)
         for key, value in update_data.items():
             setattr(db_trip, key, value)
-        await db.commit()
-        await db.refresh(db_trip)
+        await db.flush()
     return db_trip
     
 # 여행 삭제(Delete)
@@ -84,7 +197,7 @@ async def delete_trip(db: AsyncSession, trip_id: int) -> Optional[Trip]:
     db_trip = await get_trip(db, trip_id)
     if db_trip:
         await db.delete(db_trip)
-        await db.commit()
+        await db.flush()
     return db_trip
 
 
@@ -94,8 +207,7 @@ async def delete_trip(db: AsyncSession, trip_id: int) -> Optional[Trip]:
 async def create_trip_day(db: AsyncSession, trip_day: TripDayCreate) -> TripDay:
     db_trip_day = TripDay(**trip_day.model_dump())
     db.add(db_trip_day)
-    await db.commit()
-    await db.refresh(db_trip_day)
+    await db.flush()
     return db_trip_day
 
 # 일자별 여행 계획 조회(Read)
@@ -114,8 +226,7 @@ async def get_trip_days_by_trip(db: AsyncSession, trip_id: int) -> List[TripDay]
 async def create_schedule(db: AsyncSession, schedule: ScheduleCreate) -> Schedule:
     db_schedule = Schedule(**schedule.model_dump())
     db.add(db_schedule)
-    await db.commit()
-    await db.refresh(db_schedule)
+    await db.flush()
     return db_schedule
 
 # 세부 일정 조회(Read)
@@ -123,11 +234,40 @@ async def get_schedule(db: AsyncSession, schedule_id: int) -> Optional[Schedule]
     result = await db.execute(select(Schedule).filter(Schedule.id == schedule_id))
     return result.scalars().first()
 
-# 특정 일자별 여행 계획의 모든 세부 일정 조회(Read)
+# 특정 일자별 여행 계획의 모든 세부 일정 조회(Read) - 표시 순서(position)대로
 async def get_schedules_by_trip_day(db: AsyncSession, trip_day_id: int) -> List[Schedule]:
-    result = await db.execute(select(Schedule).filter(Schedule.trip_day_id == trip_day_id))
+    result = await db.execute(select(Schedule).filter(Schedule.trip_day_id == trip_day_id)
+                              .order_by(Schedule.position, Schedule.id))
     return result.scalars().all()
 
+# 일자의 세부 일정 (id, position) 목록 - 일괄 수정 검증용 (객체를 만들지 않음)
+async def get_schedule_positions(db: AsyncSession, trip_day_id: int) -> List[tuple[int, int]]:
+    result = await db.execute(select(Schedule.id, Schedule.position)
+                              .where(Schedule.trip_day_id == trip_day_id)
+                              .order_by(Schedule.position, Schedule.id))
+    return [tuple(row) for row in result.all()]
+
+# 세부 일정 일괄 적용 : DELETE 한 번 + 기본키 기준 bulk UPDATE + bulk INSERT
+# updates: [{"id": .., 바꿀 컬럼: 값}], creates: [Schedule 컬럼: 값]
+async def apply_schedule_batch(db: AsyncSession, trip_day_id: int, deletes: List[int],
+                               updates: List[dict], creates: List[dict]):
+    if deletes:
+        await db.execute(delete(Schedule)
+                         .where(Schedule.trip_day_id == trip_day_id, Schedule.id.in_(deletes))
+                         .execution_options(synchronize_session=False))
+    if updates:
+        await db.execute(update(Schedule), updates)
+    if creates:
+        await db.execute(insert(Schedule), creates)
+
+# 일자 + 세부 일정(장소 포함) 조회
+async def get_trip_day_with_schedules(db: AsyncSession, trip_day_id: int) -> Optional[TripDay]:
+    stmt = select(TripDay).where(TripDay.id == trip_day_id).options(
+        selectinload(TripDay.schedule).selectinload(Schedule.place)
+    ).execution_options(populate_existing=True)
+    result = await db.execute(stmt)
+    return result.scalars().first()
+
 # 세부 일정 수정(Update)
 async def update_schedule(db: AsyncSession, schedule_id: int, schedule_update: ScheduleUpdate) -> Optional[Schedule]:
     db_schedule = await get_schedule(db, schedule_id)
@@ -135,8 +275,7 @@ async def update_schedule(db: AsyncSession, schedule_id: int, schedule_update: S
         update_data = schedule_update.model_dump(exclude_unset=True)
         for key, value in update_data.items():
             setattr(db_schedule, key, value)
-        await db.commit()
-        await db.refresh(db_schedule)
+        await db.flush()
     return db_schedule
 
 # 세부 일정 삭제(Delete)
@@ -144,7 +283,7 @@ async def delete_schedule(db: AsyncSession, schedule_id: int) -> Optional[Schedu
     db_schedule = await get_schedule(db, schedule_id)
     if db_schedule:
         await db.delete(db_schedule)
-        await db.commit()
+        await db.flush()
     return db_schedule
 
 
@@ -154,8 +293,7 @@ async def delete_schedule(db: AsyncSession, schedule_id: int) -> Optional[Schedu
 async def create_checklist_item(db: AsyncSession, checklist_item: ChecklistItemCreate) -> ChecklistItem:
     db_checklist_item = ChecklistItem(**checklist_item.model_dump())
     db.add(db_checklist_item)
-    await db.commit()
-    await db.refresh(db_checklist_item)
+    await db.flush()
     return db_checklist_item
 
 # 준비물 체크리스트 조회(Read)
@@ -175,8 +313,7 @@ async def update_checklist_item(db: AsyncSession, item_id: int, item_update: Che
         update_data = item_update.model_dump(exclude_unset=True)
         for key, value in update_data.items():
             setattr(db_checklist_item, key, value)
-        await db.commit()
-        await db.refresh(db_checklist_item)
+        await db.flush()
     return db_checklist_item
 
 # 준비물 체크리스트 삭제(Delete)
@@ -184,5 +321,5 @@ async def delete_checklist_item(db: AsyncSession, item_id: int) -> Optional[Chec
     db_checklist_item = await get_checklist_item(db, item_id)
     if db_checklist_item:
         await db.delete(db_checklist_item)
-        await db.commit()
+        await db.flush()
     return db_checklist_item
\ No newline at end of file
@@ -1,11 +1,19 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.db.model import Photo, Review
 from sqlalchemy import select, or_, desc, func
+from sqlalchemy.orm import load_only
 from typing import Optional
 
 
 #사진은 로컬폴더나, 외부환경(외부스토리지)에 저장
 
+#목록/단건 조회 공통 - 메타데이터 컬럼만 조회 (data 제외)
+def photo_meta_options():
+    return (
+        load_only(Photo.id, Photo.review_id, Photo.filename, Photo.content_type,
+                  Photo.sha256, Photo.size, Photo.width, Photo.height, Photo.created_at),
+    )
+
 
 class PhotoCrud:
     #photo_id조회 - 대표사진 하나 조회용 (review_id가 필요한가?)
@@ -13,37 +21,72 @@ class PhotoCrud:
     async def get_photo_id(db:AsyncSession,photo_id:int):
         return await db.get(Photo, photo_id)
 
+    #사진 메타데이터만 조회 - 단건 조회/원본 전송 전 ETag 비교용
+    @staticmethod
+    async def get_meta(db:AsyncSession, review_id:int, photo_id:int) -> Optional[Photo]:
+        query = (select(Photo)
+                 .where(Photo.id == photo_id, Photo.review_id == review_id)
+                 .options(*photo_meta_options()))
+        result = await db.execute(query)
+        return result.scalar_one_or_none()
+
+    #이전 방식(DB 저장) 사진의 바이트만 조회 - data를 읽는 유일한 경로 (원본 전송)
+    @staticmethod
+    async def get_data(db:AsyncSession, photo_id:int) -> Optional[bytes]:
+        result = await db.execute(select(Photo.data).where(Photo.id == photo_id))
+        return result.scalar_one_or_none()
+
+    #파일 자체는 blob store에 저장하고 여기에는 키(sha256)와 메타데이터만 기록
     @staticmethod
     async def create(db:AsyncSession,                      
                      review_id:int, 
                      filename:str,
-                     data:bytes,
-                     content_type:str):    
-        db_photo = Photo(review_id=review_id,filename=filename,data=data,content_type=content_type)
+                     sha256:str,
+                     size:int,
+                     content_type:str,
+                     width:Optional[int]=None,
+                     height:Optional[int]=None):    
+        db_photo = Photo(review_id=review_id,filename=filename,sha256=sha256,size=size,content_type=content_type,
+                         width=width,height=height)
         db.add(db_photo)
         await db.flush()
         return db_photo
     
     @staticmethod
     async def get_all(db:AsyncSession, review_id:int):
-        query = select(Photo).where(Photo.review_id==review_id)
+        query = (select(Photo)
+                 .where(Photo.review_id==review_id)
+                 .options(*photo_meta_options())
+                 .order_by(Photo.id))
         result = await db.execute(query)
         photos= result.scalars().all()
         # print('crud return:', photos, type(photos))
         return photos
     
 
+    #리뷰별 대표사진 id 일괄 조회 - 피드용 {review_id: photo_id}
+    @staticmethod
+    async def get_first_ids_by_reviews(db:AsyncSession, review_ids:list[int]) -> dict[int,int]:
+        if not review_ids:
+            return {}
+        query = (select(Photo.review_id, func.min(Photo.id))
+                 .where(Photo.review_id.in_(review_ids))
+                 .group_by(Photo.review_id))
+        result = await db.execute(query)
+        return {review_id: photo_id for review_id, photo_id in result.all()}
+
     @staticmethod
     async def delete_by_id(db:AsyncSession, photo_id:int, user_id:int)->bool:
         photo = await db.get(Photo, photo_id)
         if not photo :        
             return False
         #photo_id를 입력한 photo객체의 삭제할 review_id를 Review테이블에서져와야함
-        review = await db.get(Review, photo.review_id) 
+        result = await db.execute(select(Review.user_id).where(Review.id == photo.review_id))
+        review_user_id = result.scalar_one_or_none()
         #검증기능 완료후 추가
-        # if not review or review.user_id != user_id:
+        # if review_user_id is None or review_user_id != user_id:
         #     return False
-        if not review:
+        if review_user_id is None:
             return False
         await db.delete(photo) #선택한 photo_id의 row삭제
         await db.flush()
@@ -1,9 +1,21 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.db.model import Review, Like, City
 from app.db.schema.review import ReviewCreate, ReviewUpdate
-from sqlalchemy import select, or_, desc, func,and_
-from sqlalchemy.orm import selectinload
+from sqlalchemy import select, or_, desc, func, and_, update, delete
+from sqlalchemy.orm import selectinload, noload
 from typing import Optional
+from app.core.pagination import decode_cursor, keyset_filter
+
+#피드/검색 목록 공통 로딩 옵션
+#댓글/사진/여행은 피드 로더에서 따로 일괄조회하므로 여기서는 로드하지 않음
+def feed_load_options():
+    return (
+        selectinload(Review.users),
+        selectinload(Review.city), # City 정보 Eager Loading
+        noload(Review.comments),
+        noload(Review.photos),
+        noload(Review.trip),
+    )
 
 
 class ReviewCrud:
@@ -44,24 +56,26 @@ class ReviewCrud:
         return db_review
     
     #reveiw-list 조회 trip에속한 리뷰만
+    #cursor가 있으면 (created_at, id) keyset 페이지네이션, 없으면 기존 offset 방식
+    #검색은 ReviewSearchCrud(전문검색 인덱스)에서 처리
     @staticmethod
     async def get_all(db:AsyncSession,                      
-                      search:Optional[str]=None,
                       limit:int=100,
-                      offset:int = 0
+                      offset:int = 0,
+                      cursor:Optional[str]=None
                       ):
         #데이터선택 
-        query = select(Review).options(
-            selectinload(Review.users),
-            selectinload(Review.city) # City 정보 Eager Loading
-        ).order_by(desc(Review.created_at))
+        query = (select(Review)
+                 .options(*feed_load_options())
+                 .order_by(desc(Review.created_at), desc(Review.id)))
 
-        #검색 기능 조건
-        if search:
-            query = select(Review).where(or_(Review.title.ilike(f'%{search.strip()}%'),
-                                    Review.content.ilike(f'%{search.strip()}%')))
         #페이지네이션
-        query = query.limit(limit).offset(offset)
+        if cursor:
+            created_at, review_id = decode_cursor(cursor)
+            query = query.where(keyset_filter(Review.created_at, Review.id, created_at, review_id))
+        else:
+            query = query.offset(offset)
+        query = query.limit(limit)
 
         result = await db.execute(query)
         return result.scalars().all() #rows=result.scalars().all()       
@@ -107,24 +121,42 @@ class LikeCrud:
         await db.flush()
         return like
     
+    #delete문의 rowcount로 실제 삭제여부 판단 - 동시 요청시 중복 차감 방지
     @staticmethod
     async def delete_id(db:AsyncSession, user_id:int, review_id:int):
         result = await db.execute(
-            select(Like).where(Like.user_id == user_id,
+            delete(Like).where(Like.user_id == user_id,
                                Like.review_id == review_id))
-        like = result.scalar_one_or_none()
+        return result.rowcount > 0
 
-        if like:
-            await db.delete(like)
-            await db.flush()
-            return True
-        return False
+    #좋아요 수 증감 - UPDATE review SET like_count = like_count + delta (원자적 갱신)
+    @staticmethod
+    async def add_count(db:AsyncSession, review_id:int, delta:int) -> int:
+        await db.execute(
+            update(Review)
+            .where(Review.id == review_id)
+            .values(like_count=Review.like_count + delta))
+        return await LikeCrud.get_count(db, review_id)
 
-    #좋아요 개수 조회
-    #(user_id,review_id)
+    #좋아요 개수 조회 - likes 집계 대신 review.like_count 컬럼을 읽음
     @staticmethod
-    async def count_by_review(db:AsyncSession, review_id:int):
-        result = await db.execute(select(func.count()).select_from(Like).where(Like.review_id == review_id))                                       
-        return result.scalar_one() or 0
+    async def get_count(db:AsyncSession, review_id:int) -> int:
+        result = await db.execute(select(Review.like_count).where(Review.id == review_id))
+        return result.scalar_one_or_none() or 0
+
+    #좋아요 수 재계산 - likes 테이블 기준으로 어긋난 review.like_count만 보정, 보정된 리뷰 수 반환
+    @staticmethod
+    async def reconcile_counts(db:AsyncSession) -> int:
+        actual = (select(func.count())
+                  .select_from(Like)
+                  .where(Like.review_id == Review.id)
+                  .correlate(Review)
+                  .scalar_subquery())
+        result = await db.execute(
+            update(Review)
+            .where(Review.like_count != actual)
+            .values(like_count=actual)
+            .execution_options(synchronize_session=False))
+        return result.rowcount
 
 
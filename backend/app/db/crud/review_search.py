@@ -0,0 +1,101 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.db.model import Review
+from app.db.crud.review import feed_load_options
+from app.core.pagination import encode_rank_cursor, decode_rank_cursor, keyset_filter
+from sqlalchemy import select, or_, desc, text, cast, false, Integer, Float, literal
+from sqlalchemy.dialects.mysql import match
+from typing import Optional
+
+#리뷰 전문검색
+# - MySQL : review(title, content) FULLTEXT 인덱스 (ngram 파서 - 한글 2-gram), MATCH ... AGAINST 관련도 점수
+# - SQLite: FTS5 가상테이블, bm25 점수 (로컬/테스트용)
+#           3글자 이상 검색어는 review_fts (trigram - 부분일치)
+#           2글자 이하 단어가 있으면 review_fts_word (unicode61 - 단어 접두어 일치, '서울' -> 서울, 서울에서, 서울은 ...)
+# 인덱스/트리거 DDL은 app/db/model/review.py 참고
+# 결과는 관련도 점수 구간 내림차순 + id 내림차순, (점수 구간, id) 커서 페이지네이션
+#
+# 커서는 실수 점수 대신 정수 구간(score x SCORE_SCALE 정수부)을 사용 - 실수 비교는 쿼리마다 값이 미세하게 달라질 수 있음
+# 같은 구간 안에서는 id 순이므로 점수가 거의 같은 리뷰끼리는 관련도보다 최신순에 가깝게 정렬됨
+# 한계: 점수는 전체 리뷰 통계(단어 빈도)로 계산되므로 페이지를 넘기는 사이 리뷰가 추가/수정되면
+#       다른 리뷰의 점수 구간도 바뀌어 일부 결과가 빠지거나 중복될 수 있음 (관련도 스냅샷을 따로 두지 않음)
+
+#trigram 토크나이저는 3글자 미만 검색어를 인덱스로 찾지 못함
+FTS5_MIN_TERM = 3
+#점수 구간 크기 - 소수 넷째 자리까지 구분
+SCORE_SCALE = 10000
+
+
+def score_bucket(score):
+    return cast(score * SCORE_SCALE, Integer)
+
+
+class ReviewSearchCrud:
+    @staticmethod
+    async def search(db:AsyncSession,
+                     term:str,
+                     limit:int=100,
+                     offset:int=0,
+                     cursor:Optional[str]=None) -> tuple[list[Review], Optional[str]]:
+        term = term.strip()
+        dialect = db.bind.dialect.name
+        if dialect == 'mysql':
+            score = match(Review.title, Review.content, against=term)
+            query = select(Review).where(score > 0)
+        elif dialect == 'sqlite':
+            query, score = ReviewSearchCrud._sqlite_query(term)
+        else:
+            #전문검색 인덱스가 없는 DB - 점수 없이 부분일치
+            score = literal(0.0)
+            query = select(Review).where(
+                or_(Review.title.ilike(f'%{term}%'), Review.content.ilike(f'%{term}%')))
+
+        bucket = score_bucket(score)
+        query = (query.add_columns(bucket.label('score_bucket'))
+                 .options(*feed_load_options())
+                 .order_by(desc(bucket), desc(Review.id)))
+
+        #페이지네이션
+        if cursor:
+            last_bucket, review_id = decode_rank_cursor(cursor)
+            query = query.where(keyset_filter(bucket, Review.id, last_bucket, review_id))
+        else:
+            query = query.offset(offset)
+        query = query.limit(limit)
+
+        result = await db.execute(query)
+        rows = result.all()
+        reviews = [row[0] for row in rows]
+
+        next_cursor = None
+        if len(rows) == limit:
+            last_review, last_bucket = rows[-1]
+            next_cursor = encode_rank_cursor(int(last_bucket), last_review.id)
+        return reviews, next_cursor
+
+    #FTS5 MATCH 쿼리 - 단어마다 따옴표로 감싸 AND 검색 (특수문자가 FTS 문법으로 해석되지 않게)
+    @staticmethod
+    def _sqlite_query(term:str):
+        words = term.split()
+        if not words:
+            score = literal(0.0)
+            return select(Review).where(false()), score
+
+        if all(len(word) >= FTS5_MIN_TERM for word in words):
+            table = 'review_fts'
+            fts_query = ' '.join(_fts_phrase(word) for word in words)
+        else:
+            #짧은 단어(한글 2글자 등)는 trigram으로 찾을 수 없으므로 단어 접두어 인덱스 사용
+            table = 'review_fts_word'
+            fts_query = ' '.join(_fts_phrase(word) + '*' for word in words)
+
+        fts = (text(f"SELECT rowid AS id, -bm25({table}) AS score "
+                    f"FROM {table} WHERE {table} MATCH :fts_query")
+               .bindparams(fts_query=fts_query)
+               .columns(id=Integer, score=Float)
+               .subquery('fts'))
+        query = select(Review).join(fts, fts.c.id == Review.id)
+        return query, fts.c.score
+
+
+def _fts_phrase(word:str) -> str:
+    return '"' + word.replace('"', '""') + '"'
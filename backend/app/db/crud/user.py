@@ -8,8 +8,7 @@ from typing import Optional , List
 async def create_user(db: AsyncSession, username: str, email: str, hashed_password: str) -> User:
     user = User(username=username, email=email, password=hashed_password)
     db.add(user)
-    await db.commit()
-    await db.refresh(user)
+    await db.flush()
     return user
 
 #이메일로 유저 조회
@@ -48,8 +47,7 @@ async def update_user(db: AsyncSession,
     if hashed_password is not None:
         user.password = hashed_password
 
-    await db.commit()
-    await db.refresh(user)
+    await db.flush()
     
     return user
 
@@ -62,7 +60,7 @@ async def delete_user(db:AsyncSession, user_id:str) -> bool:
       return False  
 
     await db.delete(user)
-    await db.commit()
+    await db.flush()
     return True
 
 #모든 유저 조회
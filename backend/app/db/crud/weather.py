@@ -1,26 +1,67 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.db.model import Weather
+from app.db.model import Weather, City, CityWeather
 from app.db.schema.weather import WeatherCreate
-from sqlalchemy import select, or_, desc, func,and_
+from sqlalchemy import select, or_, desc, func,and_, delete
 from typing import Optional
 from datetime import datetime, timedelta
 import json
+import zlib
+
+#날씨 응답은 공백 없는 JSON을 zlib 압축해서 저장 (One Call 응답 기준 원문의 1/5 ~ 1/8 크기)
+def encode_weather(weather_data: dict) -> bytes:
+    return zlib.compress(json.dumps(weather_data, ensure_ascii=False, separators=(',', ':')).encode(), 6)
+
+#payload(압축) 또는 이전 방식 weather_info(JSON 문자열)에서 dict 복원
+def decode_weather(payload: Optional[bytes], weather_info: Optional[str] = None) -> dict:
+    if payload is not None:
+        return json.loads(zlib.decompress(payload))
+    return json.loads(weather_info)
+
+
 class WeatherCrud:
     @staticmethod
     async def create(db: AsyncSession,
+                        city_id: int,
                         weather_data: dict,
                     ):
-        # 수정 : Weather 모델에는 weather_info와 date만 존재하므로
-        # city_name, lat, lon 필드는 제거
-        weather_info=json.dumps(weather_data)
         new_weather = Weather(
-            weather_info = weather_info,
+            city_id = city_id,
+            payload = encode_weather(weather_data),
             date = datetime.utcnow(),
         )
         db.add(new_weather)
         await db.flush()
         return new_weather
-    
+
+    #도시이름으로 가장 최신 날씨 (dict, 저장시각) - since를 주면 그 이후 저장된 것만, 없으면 None
+    #cities.city_name / weather(city_id, date) 인덱스만 타는 쿼리 한 번
     @staticmethod
-    async def delete_old_weather(db:AsyncSession):
-        pass
\ No newline at end of file
+    async def get_latest(db: AsyncSession, city_name: str, since: Optional[datetime] = None) -> Optional[tuple[dict, datetime]]:
+        query = (select(Weather.payload, Weather.weather_info, Weather.date)
+                 .join(City, City.id == Weather.city_id)
+                 .where(City.city_name == city_name)
+                 .order_by(desc(Weather.date))
+                 .limit(1))
+        if since is not None:
+            query = query.where(Weather.date >= since)
+        result = await db.execute(query)
+        row = result.first()
+        if row is None:
+            return None
+        return decode_weather(row.payload, row.weather_info), row.date
+
+    #before 이전에 저장된 날씨를 id 순으로 최대 limit개 삭제, 삭제한 행 수 반환
+    #한 번에 지우는 양을 제한해 락/undo log가 커지지 않게 함 (커밋은 호출하는 쪽에서 청크마다)
+    #city_weathers는 FK CASCADE에 맡기지 않고 같은 id 범위로 먼저 삭제
+    @staticmethod
+    async def delete_old_chunk(db:AsyncSession, before:datetime, limit:int) -> int:
+        result = await db.execute(select(Weather.id)
+                                  .where(Weather.date < before)
+                                  .order_by(Weather.id)
+                                  .limit(limit))
+        weather_ids = list(result.scalars().all())
+        if not weather_ids:
+            return 0
+        await db.execute(delete(CityWeather).where(CityWeather.weather_id.in_(weather_ids)))
+        await db.execute(delete(Weather).where(Weather.id.in_(weather_ids)))
+        return len(weather_ids)
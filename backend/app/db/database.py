@@ -1,19 +1,39 @@
+import logging
+from typing import Callable
+
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.orm import declarative_base, sessionmaker, Session
+from sqlalchemy import BigInteger, Integer, TIMESTAMP, event
+from sqlalchemy.dialects import sqlite
 from app.core.settings import settings
+from app.core import db_pool
 
+logger = logging.getLogger(__name__)
 
-async_engine = create_async_engine(settings.database_url, echo=False)
+# 풀 크기/timeout/recycle/pre-ping은 Settings(DB_POOL_*)에서, 대기시간/사용량은 /internal/db/pool 에서 확인
+async_engine = create_async_engine(settings.database_url, echo=False, **db_pool.pool_options(settings.database_url))
+db_pool.instrument(async_engine)
 
 
+# expire_on_commit=False : 커밋 후에도 객체 값을 그대로 사용 (응답 만들 때 다시 SELECT 하지 않음)
 AsyncsessionLocal = sessionmaker(
-    autocommit = False, autoflush=False, bind=async_engine, class_=AsyncSession
+    autocommit = False, autoflush=False, expire_on_commit=False, bind=async_engine, class_=AsyncSession
 )
 
 Base=declarative_base()
 
+# BIGINT PK 타입 - SQLite(로컬/테스트)는 INTEGER PRIMARY KEY여야 자동증가되므로 variant 지정
+BigIntPK = BigInteger().with_variant(Integer, "sqlite")
+
+# server_default(now) TIMESTAMP 타입 - SQLite는 CURRENT_TIMESTAMP가 초 단위 문자열로 저장되므로
+# 바인딩 값도 같은 형식으로 맞춰야 커서 페이지네이션의 created_at 비교가 정확함
+TimestampType = TIMESTAMP().with_variant(
+    sqlite.DATETIME(storage_format="%(year)04d-%(month)02d-%(day)02d %(hour)02d:%(minute)02d:%(second)02d"),
+    "sqlite")
+
 
 # 수정된 get_db 함수
+# 요청 하나 = 트랜잭션 하나 (unit of work) : CRUD 함수는 flush만 하고, 커밋은 요청이 끝날 때 여기서 한 번
 async def get_db():
     async with AsyncsessionLocal() as session:
         try:
@@ -23,5 +43,30 @@ async def get_db():
             await session.rollback() # 오류 발생 시 DB 작업을 취소합니다.
             raise                # 오류를 다시 발생시켜 FastAPI가 인지하게 합니다.
 
+
+# 커밋 후 실행할 작업 등록 - 메모리 캐시/인덱스(user_cache, city_index 등) 갱신용
+# 커밋은 요청이 끝날 때(get_db) 한 번이므로 서비스에서 바로 갱신하면 커밋 전에 다른 요청이 이전 값을 다시 캐시하거나,
+# 커밋이 실패해도 메모리에는 반영된 채로 남음 -> 커밋이 성공한 뒤에만 실행하고, 롤백되면 버림
+AFTER_COMMIT_KEY = "after_commit"
+
+def after_commit(db: AsyncSession, fn: Callable[[], None]):
+    db.sync_session.info.setdefault(AFTER_COMMIT_KEY, []).append(fn)
+
+
+@event.listens_for(Session, "after_commit")
+def _run_after_commit(session: Session):
+    for fn in session.info.pop(AFTER_COMMIT_KEY, ()):
+        try:
+            fn()
+        except Exception:
+            # 이미 커밋되었으므로 요청은 실패시키지 않음 (캐시는 TTL/주기 작업으로 맞춰짐)
+            logger.exception("after-commit callback failed")
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_after_commit(session: Session, previous_transaction):
+    if not previous_transaction.nested:
+        session.info.pop(AFTER_COMMIT_KEY, None)
+
 #DB연결 경로 확인 (추후삭제)
 print("DB URL:", settings.database_url)
\ No newline at end of file
@@ -1,12 +1,14 @@
-from app.db.database import Base
+from app.db.database import Base, BigIntPK
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import String, BigInteger, ForeignKey
+from sqlalchemy import String, BigInteger, ForeignKey, Index
 from typing import Optional
 
 class ChecklistItem(Base):
     __tablename__ = "checklist_item"
+    # 여행별 체크리스트 (요약의 진행도 집계)
+    __table_args__ = (Index('ix_checklist_item_trip_id', 'trip_id'),)
 
-    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True, index=True) 
+    id: Mapped[int] = mapped_column(BigIntPK, primary_key=True, autoincrement=True, index=True) 
     trip_id: Mapped[Optional[int]] = mapped_column(ForeignKey("trip.id"), nullable=True)  # 수정됨 : trip_day에서 trip으로 연결 수정 
     item_name: Mapped[str] = mapped_column(String(255), nullable=False)  
     is_checked: Mapped[bool] = mapped_column(nullable=False, default=False)  
@@ -1,13 +1,15 @@
-from app.db.database import Base
+from app.db.database import Base, BigIntPK
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import String, BigInteger, Float
+from sqlalchemy import String, BigInteger, Float, UniqueConstraint
 from typing import Optional
 
 class City(Base):
     __tablename__ = "cities"
+    # 도시 일괄추가 upsert 키 (같은 도시가 중복 저장되지 않게)
+    __table_args__ = (UniqueConstraint('city_name', 'country', name='uq_cities_city_name_country'),)
 
-    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True, index=True) 
-    city_name: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)  
+    id: Mapped[int] = mapped_column(BigIntPK, primary_key=True, autoincrement=True, index=True) 
+    city_name: Mapped[Optional[str]] = mapped_column(String(255), nullable=True, index=True)  # 날씨 조회시 도시이름 검색
     ko_name: Mapped[Optional[str]] = mapped_column(String(100), nullable=False)
     country: Mapped[Optional[str]] = mapped_column(String(100), nullable=False)
     ko_country: Mapped[Optional[str]] = mapped_column(String(100), nullable=False)
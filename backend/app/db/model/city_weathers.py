@@ -1,9 +1,11 @@
 from app.db.database import Base
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Index
 
 class CityWeather(Base):
     __tablename__ = "city_weathers"
+    # 날씨 삭제시 weather_id로 조회 (PK는 city_id가 앞)
+    __table_args__ = (Index('ix_city_weathers_weather_id', 'weather_id'),)
 
     city_id: Mapped[int] = mapped_column(ForeignKey("cities.id"), primary_key=True)  
     weather_id: Mapped[int] = mapped_column(ForeignKey("weather.id", ondelete="CASCADE"), primary_key=True)  
@@ -1,17 +1,19 @@
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import BigInteger,String, Text, TIMESTAMP, func, ForeignKey
-from ..database import Base
+from sqlalchemy import BigInteger,String, Text, TIMESTAMP, func, ForeignKey, Index
+from ..database import Base, TimestampType
 from typing import Optional, List
 from datetime import datetime
 
 class Comment(Base):
     __tablename__ = 'comments'
+    # 리뷰별 댓글 keyset 페이지네이션/피드 댓글 조회용
+    __table_args__ = (Index('ix_comments_review_id_created_at_id', 'review_id', 'created_at', 'id'),)
 
     id:Mapped[int] = mapped_column(primary_key=True, index=True)
     user_id:Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     review_id:Mapped[int] = mapped_column(ForeignKey("review.id", ondelete="CASCADE"), nullable=False)
     content:Mapped[str] = mapped_column(Text)
-    created_at: Mapped[Optional[datetime]] = mapped_column(TIMESTAMP, server_default=func.now())
+    created_at: Mapped[Optional[datetime]] = mapped_column(TimestampType, server_default=func.now())
 
 # # FOREIGN KEY (user_id) REFERENCES users(id) on delete cascade,
     users = relationship("User", back_populates="comments", lazy="selectin")
@@ -1,5 +1,5 @@
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import BigInteger,String, Text, TIMESTAMP, func, ForeignKey
+from sqlalchemy import BigInteger,String, Text, TIMESTAMP, func, ForeignKey, LargeBinary, Index
 from sqlalchemy.dialects.mysql import LONGBLOB
 from ..database import Base
 from datetime import datetime
@@ -7,13 +7,26 @@ from typing import Optional
 
 class Photo(Base):
     __tablename__ ='photos'
+    # 리뷰별 사진 조회용
+    __table_args__ = (Index('ix_photos_review_id', 'review_id'),)
 
     id:Mapped[int] = mapped_column(primary_key=True, index=True)
     review_id:Mapped[int] = mapped_column(ForeignKey("review.id", ondelete="CASCADE"), nullable=False) #
     filename:Mapped[str] = mapped_column(String(255),nullable=False)
-    data:Mapped[bytes] = mapped_column(LONGBLOB,nullable=False)
+    # 이전 방식(DB 저장) 사진만 값이 있음 - 새 사진은 blob store에 저장하고 NULL (migrate_photo_blobs.py로 이전)
+    # deferred: Photo를 조회해도 data는 읽지 않음 (리뷰/사진 목록에서 blob이 메모리에 올라오지 않게)
+    #           원본 전송(PhotoCrud.get_data)에서만 따로 조회
+    data:Mapped[Optional[bytes]] = mapped_column(LargeBinary().with_variant(LONGBLOB, 'mysql'),nullable=True, deferred=True) # SQLite(로컬/테스트)는 BLOB
     content_type:Mapped[str] =mapped_column(String(50),nullable=False)
+    # blob store 키 (파일 내용 SHA-256 hex) / 파일 크기(byte)
+    sha256:Mapped[Optional[str]] = mapped_column(String(64), nullable=True, index=True)
+    size:Mapped[Optional[int]] = mapped_column(nullable=True)
+    # 원본 이미지 표시 크기(px, EXIF 회전 반영) - 업로드/이전할 때 저장, 이미지가 아니면 NULL
+    # 축소본 생성 예정인지 판단할 때 원본을 열지 않도록 (app/core/derivatives.py derivative_pending)
+    width:Mapped[Optional[int]] = mapped_column(nullable=True)
+    height:Mapped[Optional[int]] = mapped_column(nullable=True)
     created_at: Mapped[Optional[datetime]] = mapped_column(TIMESTAMP, server_default=func.now()) 
     
     # FOREIGN KEY (review_id) REFERENCES review(id) ON DELETE CASCADE
-    review = relationship("Review", back_populates="photos",lazy='selectin')
\ No newline at end of file
+    # 사진 조회시 리뷰(+리뷰의 댓글/사진 전체)를 같이 읽지 않도록 자동 로딩하지 않음 - 필요하면 review_id로 조회
+    review = relationship("Review", back_populates="photos",lazy='raise_on_sql')
\ No newline at end of file
@@ -1,4 +1,4 @@
-from app.db.database import Base
+from app.db.database import Base, BigIntPK
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy import String, BigInteger, ForeignKey
 from typing import Optional
@@ -6,7 +6,7 @@ from typing import Optional
 class Place(Base):
     __tablename__ = "places"
 
-    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True, index=True) 
+    id: Mapped[int] = mapped_column(BigIntPK, primary_key=True, autoincrement=True, index=True) 
     city_id: Mapped[int] = mapped_column(ForeignKey("cities.id"), nullable=False) 
     place_name: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)  
     type_id: Mapped[int] = mapped_column(ForeignKey("travel_types.id"), nullable=False) 
@@ -1,12 +1,14 @@
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import BigInteger,String, Text, TIMESTAMP, func, ForeignKey
-from ..database import Base
+from sqlalchemy import BigInteger,String, Text, TIMESTAMP, func, ForeignKey, Index, DDL, event
+from ..database import Base, TimestampType
 from typing import Optional, List
 from datetime import datetime
 
 
 class Review(Base):
     __tablename__ ='review'
+    # 피드 keyset 페이지네이션용 (created_at DESC, id DESC)
+    __table_args__ = (Index('ix_review_created_at_id', 'created_at', 'id'),)
 
     id:Mapped[int] = mapped_column(primary_key=True, index=True)
     user_id:Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
@@ -16,7 +18,9 @@ class Review(Base):
     title:Mapped[str] = mapped_column(String(255),nullable=False)
     content:Mapped[str] = mapped_column(Text, nullable=False)
     rating:Mapped[int] = mapped_column(nullable=False)
-    created_at: Mapped[Optional[datetime]] = mapped_column(TIMESTAMP, server_default=func.now())
+    # 좋아요 수 비정규화 컬럼 - LikeService.toggle에서 좋아요 insert/delete와 같은 트랜잭션으로 증감
+    like_count:Mapped[int] = mapped_column(nullable=False, default=0, server_default='0')
+    created_at: Mapped[Optional[datetime]] = mapped_column(TimestampType, server_default=func.now())
     
     users = relationship("User", back_populates="review", lazy="selectin")  #     
     trip = relationship("Trip", back_populates="review", lazy="selectin") 
@@ -25,9 +29,41 @@ class Review(Base):
     likes = relationship("Like", back_populates="review", cascade="all, delete-orphan")
     photos = relationship("Photo", back_populates="review", lazy="selectin", cascade="all, delete-orphan")
 
+# 리뷰 전문검색 인덱스 (검색 쿼리는 app/db/crud/review_search.py)
+# MySQL: ngram 파서 FULLTEXT 인덱스 - 한글처럼 띄어쓰기만으로 나눌 수 없는 텍스트도 2-gram으로 색인
+event.listen(Review.__table__, 'after_create', DDL(
+    "CREATE FULLTEXT INDEX ft_review_title_content ON review (title, content) WITH PARSER ngram"
+).execute_if(dialect='mysql'))
+
+# SQLite(로컬/테스트): review를 원본으로 하는 FTS5 외부 컨텐츠 테이블 + 동기화 트리거
+# - review_fts      : trigram 토크나이저 (3글자 이상 부분일치)
+# - review_fts_word : unicode61 토크나이저 (단어 접두어 일치 - trigram으로 못 찾는 한글 2글자 검색어용)
+def sqlite_fts_statements(table: str, tokenize: str) -> tuple[str, ...]:
+    return (
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {table} USING fts5("
+        f"title, content, content='review', content_rowid='id', tokenize='{tokenize}')",
+        f"CREATE TRIGGER IF NOT EXISTS {table}_ai AFTER INSERT ON review BEGIN "
+        f"INSERT INTO {table}(rowid, title, content) VALUES (new.id, new.title, new.content); END",
+        f"CREATE TRIGGER IF NOT EXISTS {table}_ad AFTER DELETE ON review BEGIN "
+        f"INSERT INTO {table}({table}, rowid, title, content) VALUES ('delete', old.id, old.title, old.content); END",
+        f"CREATE TRIGGER IF NOT EXISTS {table}_au AFTER UPDATE OF title, content ON review BEGIN "
+        f"INSERT INTO {table}({table}, rowid, title, content) VALUES ('delete', old.id, old.title, old.content); "
+        f"INSERT INTO {table}(rowid, title, content) VALUES (new.id, new.title, new.content); END",
+    )
+
+SQLITE_FTS_TABLES = (("review_fts", "trigram"), ("review_fts_word", "unicode61"))
+
+for _table, _tokenize in SQLITE_FTS_TABLES:
+    for _statement in sqlite_fts_statements(_table, _tokenize):
+        event.listen(Review.__table__, 'after_create', DDL(_statement).execute_if(dialect='sqlite'))
+    event.listen(Review.__table__, 'before_drop',
+                 DDL(f"DROP TABLE IF EXISTS {_table}").execute_if(dialect='sqlite'))
+
 #like
 class Like(Base):
     __tablename__ ='likes'
+    # 리뷰별 좋아요 조회/집계용 (PK는 user_id가 앞)
+    __table_args__ = (Index('ix_likes_review_id', 'review_id'),)
     # primary key(user_id,review_id) 복합키 - 좋아요 중복방지
     user_id:Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), primary_key=True, nullable=False)
     review_id:Mapped[int]= mapped_column(ForeignKey("review.id", ondelete="CASCADE"), primary_key=True ,nullable=False)
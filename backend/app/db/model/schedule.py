@@ -1,19 +1,22 @@
-from app.db.database import Base
+from app.db.database import Base, BigIntPK
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import String, BigInteger, Time, ForeignKey
+from sqlalchemy import String, BigInteger, Time, ForeignKey, Index
 from datetime import datetime, time
 from typing import Optional
 
 class Schedule(Base):
     __tablename__ = "schedule"
+    # 일자별 세부 일정 (표시 순서대로)
+    __table_args__ = (Index('ix_schedule_trip_day_id_position', 'trip_day_id', 'position'),)
 
-    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True, index=True) 
+    id: Mapped[int] = mapped_column(BigIntPK, primary_key=True, autoincrement=True, index=True) 
     trip_day_id: Mapped[Optional[int]] = mapped_column(ForeignKey("trip_day.id"), nullable=True)  
     place_id: Mapped[Optional[int]] = mapped_column(ForeignKey("places.id"), nullable=True)  
     schedule_content: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)  
     start_time: Mapped[Optional[time]] = mapped_column(Time, nullable=True)  
     end_time: Mapped[Optional[time]] = mapped_column(Time, nullable=True)  
     schedule_datetime: Mapped[datetime] = mapped_column(nullable=False)  
+    position: Mapped[int] = mapped_column(nullable=False, default=0, server_default="0")  # 일자 안에서의 표시 순서
 
     trip_day = relationship("TripDay", back_populates="schedule")
     place = relationship("Place", back_populates="schedule")
@@ -26,6 +29,7 @@ class Schedule(Base):
 #     start_time TIME,                        
 #     end_time TIME,                          
 #     schedule_datetime DATETIME NOT NULL,    -- 추가됨: 수정본 date
+#     position INT NOT NULL DEFAULT 0,        -- 추가됨: 일자 안에서의 표시 순서 (일괄 수정 API)
 #     FOREIGN KEY (trip_day_id) REFERENCES trip_day(id) ON DELETE CASCADE,
 #     FOREIGN KEY (place_id) REFERENCES places(id) ON DELETE SET NULL
 # );
\ No newline at end of file
@@ -1,4 +1,4 @@
-from app.db.database import Base
+from app.db.database import Base, BigIntPK
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy import String, BigInteger
 from typing import Optional
@@ -6,7 +6,7 @@ from typing import Optional
 class TravelType(Base):
     __tablename__ = "travel_types"
 
-    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True, index=True) 
+    id: Mapped[int] = mapped_column(BigIntPK, primary_key=True, autoincrement=True, index=True) 
     type_name: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)  
 
     place = relationship("Place", back_populates="travel_types")
@@ -1,13 +1,15 @@
-from app.db.database import Base
+from app.db.database import Base, BigIntPK
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import String, BigInteger, ForeignKey
+from sqlalchemy import String, BigInteger, ForeignKey, Index
 from datetime import datetime
 from typing import Optional, List
 
 class Trip(Base):
     __tablename__ = "trip"
+    # 사용자별 여행 목록/요약(시작일 순), 다가오는 여행 조회용
+    __table_args__ = (Index('ix_trip_user_id_start_date', 'user_id', 'start_date'),)
 
-    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True, index=True) 
+    id: Mapped[int] = mapped_column(BigIntPK, primary_key=True, autoincrement=True, index=True) 
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
     title: Mapped[str] = mapped_column(String(100), nullable=False)  
     start_date: Mapped[datetime] = mapped_column(nullable=False)  
@@ -1,12 +1,14 @@
 # app/db/model/trip_city.py
 from app.db.database import Base
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import ForeignKey, DateTime, Integer
+from sqlalchemy import ForeignKey, DateTime, Integer, Index
 from datetime import datetime
 
 # 11/2 추가 (나영일): Trip과 City 간의 다대다 관계를 위한 연결 테이블 모델
 class TripCity(Base):
     __tablename__ = "trip_cities"
+    # 여행별 도시 목록 (첫 도시 = 시작일이 가장 빠른 도시)
+    __table_args__ = (Index('ix_trip_cities_trip_id_start_date', 'trip_id', 'start_date'),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     start_date: Mapped[datetime] = mapped_column(DateTime)
@@ -1,12 +1,14 @@
-from app.db.database import Base
+from app.db.database import Base, BigIntPK
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import BigInteger, ForeignKey
+from sqlalchemy import BigInteger, ForeignKey, Index
 from datetime import datetime
 
 class TripDay(Base):
     __tablename__ = "trip_day"
+    # 여행별 일자 (n일차 순)
+    __table_args__ = (Index('ix_trip_day_trip_id_day_sequence', 'trip_id', 'day_sequence'),)
 
-    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True, index=True) 
+    id: Mapped[int] = mapped_column(BigIntPK, primary_key=True, autoincrement=True, index=True) 
     trip_id: Mapped[int] = mapped_column(ForeignKey("trip.id"), nullable=False) 
     # 11/2 수정(나영일) : day_date (절대 날짜) 삭제, day_sequence(일차)만 저장 
     day_sequence: Mapped[int] = mapped_column(nullable=False)  # n일차 표시용
@@ -1,14 +1,22 @@
-from app.db.database import Base
+from app.db.database import Base, BigIntPK
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import BigInteger, TEXT, DateTime
+from sqlalchemy import BigInteger, TEXT, DateTime, ForeignKey, Index, LargeBinary
+from sqlalchemy.dialects.mysql import MEDIUMBLOB
 from datetime import datetime, timezone
 from typing import Optional
 
 class Weather(Base):
     __tablename__ = "weather"
+    # 도시별 최신 날씨 조회용 (city_id, date DESC) - WeatherCrud.get_fresh
+    __table_args__ = (Index('ix_weather_city_id_date', 'city_id', 'date'),)
 
-    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True, index=True) 
+    id: Mapped[int] = mapped_column(BigIntPK, primary_key=True, autoincrement=True, index=True) 
+    # 이전 방식(JSON 문자열) 행만 값이 있음 - 새 행은 payload에 저장
     weather_info: Mapped[Optional[str]] = mapped_column(TEXT, nullable=True)  # LONGTEXT 대체
+    # 조회한 도시 - city_weathers를 거치지 않고 바로 최신 날씨를 찾기 위해 (이전 행은 NULL)
+    city_id: Mapped[Optional[int]] = mapped_column(ForeignKey("cities.id", ondelete="CASCADE"), nullable=True)
+    # One Call 응답 JSON을 zlib 압축한 값 (app/db/crud/weather.py encode/decode)
+    payload: Mapped[Optional[bytes]] = mapped_column(LargeBinary().with_variant(MEDIUMBLOB, 'mysql'), nullable=True)
     date: Mapped[datetime] = mapped_column(DateTime(timezone=True),
                                            default=lambda: datetime.now(timezone.utc),nullable=False)  
 
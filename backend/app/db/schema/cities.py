@@ -1,5 +1,5 @@
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import BaseModel, Field
+from typing import List, Optional
 
 class CityBase(BaseModel):
     city_name: Optional[str] = None
@@ -17,4 +17,17 @@ class CityInDB(CityBase):
     id: int
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+# 가까운 도시 조회 결과 - 기준 지점과의 거리(km)
+class CityNearby(CityInDB):
+    distance_km: float
+
+# 여러 지점 가까운 도시 일괄 조회
+class GeoPoint(BaseModel):
+    lat: float = Field(..., ge=-90, le=90)
+    lon: float = Field(..., ge=-180, le=180)
+
+class CityNearBatchRequest(BaseModel):
+    points: List[GeoPoint] = Field(..., max_length=1000)
+    k: int = Field(5, ge=1, le=50)
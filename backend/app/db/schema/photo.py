@@ -15,6 +15,8 @@ class PhotoCreate(PhotoBase):
 class PhotoInDB(PhotoBase):
     photo_id:int = Field(None,alias="id")
     review_id:int
+    width: Optional[int] = None
+    height: Optional[int] = None
     created_at: Optional[datetime]
 
     class Config:
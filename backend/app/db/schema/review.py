@@ -38,7 +38,7 @@ class SafeUser(BaseModel):
     
 class ReviewRead(ReviewInDB):        
         username: str | None = None #JOIN 후 None삭제
-        like_count: int = 0 #출력 전용 필드, DB/ORM없음 ,count()로 계산 ->조회전용
+        like_count: int = 0 #review.like_count 컬럼 (좋아요 토글시 갱신)
         # trip_id: int
         city_id: int
         city_name: str
@@ -59,7 +59,7 @@ class LikeCreate(BaseModel):
 #Like응답 (user_id는 JWT에서 추출)
 class LikeResponse(BaseModel):
      review_id: int
-     like_count: int  #출력 전용 필드, DB/ORM없음 ,count()로 계산->좋아요토글
+     like_count: int  #review.like_count 컬럼 ->좋아요토글
      liked: bool               #버튼 클릭시 최신값 업데이트
 
   
\ No newline at end of file
@@ -1,6 +1,7 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from datetime import time, datetime
-from typing import Optional
+from typing import List, Optional
+from app.db.schema.places import PlaceInDB
 
 class ScheduleBase(BaseModel):
     schedule_content: Optional[str] = None
@@ -23,6 +24,30 @@ class ScheduleInDB(ScheduleBase):
     trip_day_id: int
     place_id: Optional[int] = None
     schedule_datetime: datetime
+    position: int = 0
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+# 여행 전체 조회(/trips/{trip_id}/full)용 : 장소 정보 포함
+class ScheduleWithPlace(ScheduleInDB):
+    place: Optional[PlaceInDB] = None
+
+
+# 일자별 세부 일정 일괄 수정(/trips/days/{trip_day_id}/schedules/batch)용
+# position: 적용 후 일정 목록에서의 위치 (생략하면 맨 뒤)
+class ScheduleBatchCreate(ScheduleBase):
+    place_id: Optional[int] = None
+    schedule_datetime: datetime
+    position: Optional[int] = Field(None, ge=0)
+
+class ScheduleBatchUpdate(ScheduleUpdate):
+    id: int
+
+# 처리 순서: 삭제 -> 수정 -> 순서 변경(order) -> 추가
+# order: 기존 일정 id를 원하는 순서로 (빠진 일정은 기존 순서대로 뒤에 붙음)
+class ScheduleBatch(BaseModel):
+    creates: List[ScheduleBatchCreate] = []
+    updates: List[ScheduleBatchUpdate] = []
+    deletes: List[int] = []
+    order: Optional[List[int]] = None
@@ -2,7 +2,8 @@ from pydantic import BaseModel, Field
 from datetime import datetime, date
 from typing import List, Optional
 from app.db.schema.trip_city import TripCityCreate, TripCityUpdate, TripCityInDB
-from app.db.schema.trip_day import TripDayInDB
+from app.db.schema.trip_day import TripDayInDB, TripDayWithSchedules
+from app.db.schema.checklist_item import ChecklistItemInDB
 
 # 11/2 수정 (나영일): city_id 대신 '도시 박스' 배열을 받는다.
 # 이 필드는 Trip 생성/수정 시 항상 필요하다.
@@ -27,4 +28,24 @@ class TripInDB(TripBase):
     trip_cities: List[TripCityInDB] = []
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+# 여행 전체 조회(/trips/{trip_id}/full)용 : 도시 + 일자별 세부 일정(장소 포함) + 체크리스트를 한 번에
+class TripFull(TripInDB):
+    days: List[TripDayWithSchedules] = Field(default=[], validation_alias="trip_day")
+    checklist_items: List[ChecklistItemInDB] = Field(default=[], validation_alias="checklist_item")
+
+
+# 여행 요약(/trips/user/{user_id}/summary)용 : 홈 화면 목록에 필요한 값만
+class TripSummary(BaseModel):
+    id: int
+    title: str
+    start_date: date
+    end_date: Optional[date] = None
+    first_city_name: Optional[str] = None
+    day_count: int = 0
+    checklist_total: int = 0
+    checklist_checked: int = 0
+
+    class Config:
+        from_attributes = True
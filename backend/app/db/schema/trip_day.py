@@ -1,5 +1,7 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from datetime import date
+from typing import List
+from app.db.schema.schedule import ScheduleWithPlace
 
 # 11/2 수정(나영일): day_date(절대 날짜) 필드 삭제
 class TripDayBase(BaseModel):
@@ -13,4 +15,8 @@ class TripDayInDB(TripDayBase):
     trip_id: int
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+# 여행 전체 조회(/trips/{trip_id}/full)용 : 세부 일정 포함 (모델 관계 이름은 schedule)
+class TripDayWithSchedules(TripDayInDB):
+    schedules: List[ScheduleWithPlace] = Field(default=[], validation_alias="schedule")
@@ -1,7 +1,7 @@
 from fastapi import APIRouter
 from . import review, comment, like, photo
 from . import city_router, trip_router, weather
-from . import user
+from . import user, internal
 
 router = APIRouter()
 # #1.기능별 등록               1,2,3 중에 골라주세요
@@ -18,7 +18,7 @@ router = APIRouter()
 #     router.include_router(module.router)
 
 # 2. 통합
-planit = [user,city_router,trip_router,review,comment,like,photo,weather]
+planit = [user,city_router,trip_router,review,comment,like,photo,weather,internal]
 for module in planit:
     router.include_router(module.router)
 
@@ -1,11 +1,10 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, status, UploadFile, File, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List
+from typing import List, Optional
 from app.db.database import get_db
 from app.services.city_service import CityService
-from app.db.schema.cities import CityCreate, CityInDB
+from app.db.schema.cities import CityCreate, CityInDB, CityNearby, CityNearBatchRequest
 from app.db.schema.places import PlaceCreate, PlaceInDB
-from sqlalchemy import select, func
 city_service = CityService()
 router = APIRouter(prefix="/cities", tags=["Cities & Places"])
 
@@ -44,6 +43,25 @@ async def delete_place(place_id: int, db: AsyncSession = Depends(get_db)):
 async def create_city(city: CityCreate, db: AsyncSession = Depends(get_db)):
     return await city_service.create_city(db, city)
 
+# 도시 검색(Read) - 자동완성, 메모리 인덱스 조회 (DB 접근 없음) -> /{city_id}보다 먼저 등록
+@router.get("/search", response_model=List[CityInDB])
+async def search_cities(q: str = Query(..., min_length=1), limit: int = Query(10, ge=1, le=50)):
+    return await city_service.search_cities(q, limit)
+
+# 가까운 도시 조회(Read) - 좌표 인덱스 조회 (DB 접근 없음) -> /{city_id}보다 먼저 등록
+# radius_km: 반경(km) 안의 도시만 / 없으면 가장 가까운 k개
+@router.get("/near", response_model=List[CityNearby])
+async def get_nearby_cities(lat: float = Query(..., ge=-90, le=90),
+                            lon: float = Query(..., ge=-180, le=180),
+                            k: int = Query(10, ge=1, le=100),
+                            radius_km: Optional[float] = Query(None, gt=0)):
+    return await city_service.get_nearby_cities(lat, lon, k, radius_km)
+
+# 여러 지점의 가까운 도시 일괄 조회 - 지점 순서대로 목록 반환
+@router.post("/near/batch", response_model=List[List[CityNearby]])
+async def get_nearby_cities_batch(body: CityNearBatchRequest):
+    return await city_service.get_nearby_cities_batch(body.points, body.k)
+
 # 도시 조회(Read)
 @router.get("/{city_id}", response_model=CityInDB)
 async def get_city(city_id: int, db: AsyncSession = Depends(get_db)):
@@ -64,22 +82,9 @@ async def get_city_by_name(city_name: str, db: AsyncSession = Depends(get_db)):
 async def delete_city(city_id: int, db: AsyncSession = Depends(get_db)):
     return await city_service.delete_city(db, city_id)
 
-import pandas as pd
-from app.db.model.cities import City
-#도시 일괄추가(from xlsx)
+#도시 일괄추가(xlsx/csv 업로드, 없으면 기본 cities_list_ko.xlsx)
+#(city_name, country) 기준 upsert라 다시 실행해도 중복이 생기지 않음 - 읽은/반영한/건너뛴 행 수 반환
 @router.post('/init')
-async def init(db:AsyncSession=Depends(get_db)):
-        count = await db.scalar(select(func.count()).select_from(City))
-        if count == 0:
-            df = pd.read_excel("cities_list_ko.xlsx")
-            for _, row in df.iterrows():
-                db.add(City(
-                    city_name=row["name"],
-                    lat=row["lat"],
-                    lon=row["lon"],
-                    country=row["country"],
-                    ko_name=row["ko_name"],
-                    ko_country=row["ko_country"]
-                ))
-            await db.commit()
-        return {'msg':'도시 목록 추가완료'}
\ No newline at end of file
+async def init(file: Optional[UploadFile] = File(None)):
+    stats = await city_service.import_cities(file)
+    return {'msg':'도시 목록 추가완료', **stats}
@@ -1,4 +1,5 @@
-from fastapi import APIRouter, Depends, Request, Query
+from fastapi import APIRouter, Depends, Request, Query, Response
+from app.core.pagination import NEXT_CURSOR_HEADER, next_cursor
 from app.db.database import get_db
 from app.db.model import Comment
 from app.db.schema.comment import CommentCreate, CommentRead, CommentUpdate
@@ -18,17 +19,25 @@ async def create_comment(review_data:CommentCreate,
     return await CommentService.create(db,review_data,user_id,review_id)
 
 #get_list - 댓글없으면 빈배열 반환
+#cursor: 이전 응답의 X-Next-Cursor 헤더값 (있으면 offset 무시), 마지막 페이지면 헤더 없음
 @router.get('/', response_model=list[CommentRead])
 async def comment_list(review_id:int,
+                       response:Response,
                        db:AsyncSession=Depends(get_db),
                        serach:str|None=Query(None,min_length=1),
                        limit:int = Query(10,ge=1,le=30),
-                       offset:int = Query(0,ge=0)):
-    return await CommentService.get_all_comment(db=db,
+                       offset:int = Query(0,ge=0),
+                       cursor:str|None=Query(None)):
+    comments = await CommentService.get_all_comment(db=db,
                                                review_id=review_id,
                                                search=serach,
                                                limit=limit,
-                                               offset=offset)                                       
+                                               offset=offset,
+                                               cursor=cursor)
+    cursor_value = next_cursor(comments, limit)
+    if cursor_value:
+        response.headers[NEXT_CURSOR_HEADER] = cursor_value
+    return comments
     
 #get_comment_from_id
 @router.get('/{comment_id}', response_model=CommentRead)
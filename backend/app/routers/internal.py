@@ -0,0 +1,13 @@
+from fastapi import APIRouter, Depends
+from app.core import db_pool
+from app.core.security import verify_internal_token
+from app.db.database import async_engine
+
+
+# 내부용 API - 모두 X-Internal-Token 헤더 필요 (settings.internal_api_token, 설정하지 않으면 403)
+router = APIRouter(prefix="/internal", tags=["Internal"], dependencies=[Depends(verify_internal_token)])
+
+# DB 연결 풀 상태/대기시간 조회 - 값은 이 워커(프로세스) 기준
+@router.get("/db/pool", description="DB 연결 풀 상태")
+async def get_db_pool_stats():
+    return db_pool.stats(async_engine)
@@ -4,6 +4,7 @@ from app.db.database import get_db
 from app.db.schema.review import LikeResponse 
 from app.services import LikeService
 from app.services.review import get_current_user_id
+from app.core.security import verify_internal_token
 
 router = APIRouter(prefix='/reviews',tags=['Like'])
 
@@ -20,3 +21,10 @@ async def get_likes(review_id:int,
                     user_id:int|None = Depends(get_current_user_id),
                     db:AsyncSession=Depends(get_db)):
     return await LikeService.count_likes(db,review_id,user_id)
+
+#좋아요 수 보정 (내부 API 토큰 필요) - likes 집계와 review.like_count가 어긋난 리뷰만 갱신
+#리뷰 전체를 집계하는 무거운 작업이므로 X-Internal-Token 헤더 없이는 403
+@router.post('/likes/reconcile', description='review.like_count 재계산',
+             dependencies=[Depends(verify_internal_token)])
+async def reconcile_likes(db:AsyncSession=Depends(get_db)):
+    return await LikeService.reconcile_counts(db)
@@ -1,6 +1,6 @@
 from fastapi import APIRouter, UploadFile, File
-from fastapi import  UploadFile, File, Depends
-from fastapi.responses import StreamingResponse
+from fastapi import  UploadFile, File, Depends, Query, Request, Response
+from fastapi.responses import StreamingResponse, FileResponse
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -8,7 +8,8 @@ from app.db.database import get_db
 from app.services.photo import PhotoService
 from app.db.schema.photo import PhotoRead
 from app.services.review import get_current_user_id
-import io
+from app.core.blob_store import get_blob_store
+from app.core.derivatives import pick_derivative, derivative_pending
 
 
 router = APIRouter(prefix='/reviews/{review_id}/photos',tags=['Photo'])
@@ -34,15 +35,74 @@ async def get_one_photo(review_id:int,photo_id:int,db:AsyncSession=Depends(get_d
     db_photo = await PhotoService.get_photo(db,review_id,photo_id)
     return db_photo
 
+# 사진은 업로드 후 바뀌지 않으므로(내용 해시가 키) 1년 캐시 + immutable
+PHOTO_CACHE_CONTROL = "public, max-age=31536000, immutable"
+# 축소본 생성 전에 원본으로 대신 보낸 응답 - 매번 재검증 (축소본이 생기면 ETag가 바뀌어 200)
+PHOTO_PENDING_CACHE_CONTROL = "no-cache"
+
+#If-None-Match 헤더에 etag가 있는지 (약한 비교 - W/ 접두어 무시)
+def etag_matches(if_none_match:str|None, etag:str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == '*':
+        return True
+    return any(tag.strip().removeprefix('W/') == etag for tag in if_none_match.split(','))
+
+def photo_cache_headers(etag:str, final:bool=True) -> dict:
+    return {"ETag": etag, "Cache-Control": PHOTO_CACHE_CONTROL if final else PHOTO_PENDING_CACHE_CONTROL}
+
+#이전 방식 사진 ETag - 등록시각까지 넣어 삭제 후 id가 재사용돼도 겹치지 않게
+def legacy_photo_etag(db_photo) -> str:
+    if db_photo.created_at is None:
+        return f'"photo-{db_photo.id}"'
+    return f'"photo-{db_photo.id}-{int(db_photo.created_at.timestamp())}"'
+
 # 클릭시 이미지 원본 보여주기
+# blob store에 있는 사진은 저장소에서 바로 전송 (Range 요청은 FileResponse가 206으로 처리)
+# 이전 방식(DB 저장) 사진은 data 컬럼에서 전송
+# size: 필요한 너비(px) - 그 이상인 축소본 중 가장 작은 것을 전송 (없으면 원본)
+#       축소본이 아직 생성 전이면 원본을 보내되 캐시하지 않음 (no-cache, ETag도 원본 것)
+#       생성이 실패했거나 원본 크기를 모르면 원본이 최종 응답 (저장된 너비/실패 표시만 확인, 이미지를 열지 않음)
+# ETag는 내용 해시(sha256) 기반, If-None-Match가 일치하면 파일/blob을 읽지 않고 304
+# 이전 방식 사진은 해시가 없으므로 id/등록시각으로 ETag를 만들어 304 판단에 data를 읽지 않음
 @router.get('/{photo_id}/raw', response_model=PhotoRead)
-async def get_photo_raw(review_id:int, photo_id:int, db:AsyncSession=Depends(get_db)):
-    db_photo = await PhotoService.get_photo(db,review_id,photo_id)
+async def get_photo_raw(review_id:int, photo_id:int,
+                        request:Request,
+                        size:int|None=Query(None,ge=1),
+                        db:AsyncSession=Depends(get_db)):
+    db_photo = await PhotoService.get_photo_meta(db,review_id,photo_id)
+    if_none_match = request.headers.get('if-none-match')
 
     # 저장된 파일 확장자에 따라 mime-type 설정 (content_type)
-    return StreamingResponse(io.BytesIO(db_photo.data),
-                             media_type=db_photo.content_type
-                             )
+    if db_photo.sha256:
+        store = get_blob_store()
+        etag = f'"{db_photo.sha256}"'
+        path = store.local_path(db_photo.sha256)
+        media_type = db_photo.content_type
+        final = True
+        if size:
+            derivative = pick_derivative(db_photo.sha256, size)
+            if derivative:
+                path, media_type, width = derivative
+                etag = f'"{db_photo.sha256}-w{width}"'
+            else:
+                final = not derivative_pending(db_photo.sha256, size, db_photo.width)
+
+        headers = photo_cache_headers(etag, final)
+        if etag_matches(if_none_match, etag):
+            return Response(status_code=304, headers=headers)
+        if path is not None:
+            return FileResponse(path, media_type=media_type, headers=headers)
+        return StreamingResponse(store.open(db_photo.sha256),
+                                 media_type=media_type, headers=headers)
+
+    # 이전 방식(DB 저장) 사진 - 사진은 수정되지 않으므로 id(+등록시각)가 내용을 대신함 (migrate_photo_blobs.py로 이전 권장)
+    headers = photo_cache_headers(legacy_photo_etag(db_photo))
+    if etag_matches(if_none_match, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    data = await PhotoService.get_photo_data(db,photo_id)
+    return Response(content=data, media_type=db_photo.content_type, headers=headers)
+
 # 올린이미지 삭제
 @router.delete('/{photo_id}', description='Delete Photo')
 async def delete_photo(photo_id:int,                       
@@ -1,4 +1,5 @@
-from fastapi import APIRouter, Depends, Query, UploadFile, File,Form
+from fastapi import APIRouter, Depends, Query, UploadFile, File,Form, Response
+from app.core.pagination import NEXT_CURSOR_HEADER, next_cursor
 from app.db.database import get_db
 from app.db.schema.review import ReviewCreate, ReviewRead, ReviewUpdate, oneReviewRead
 from app.services import ReviewService,PhotoService
@@ -41,20 +42,35 @@ async def create_review(trip_id:int,
 
 #Read
 #리뷰리스트
+#cursor: 이전 응답의 X-Next-Cursor 헤더값 (있으면 offset 무시), 마지막 페이지면 헤더 없음
+#serach가 있으면 전문검색 관련도순 (커서도 검색 결과 전용)
 @router.get('/', response_model=list[ReviewRead])
-async def review_list(trip_id:int|None=None,
+async def review_list(response:Response,
+                       trip_id:int|None=None,
                        db:AsyncSession=Depends(get_db),
                        serach:str|None=Query(None,min_length=1),
                        limit:int = Query(100,ge=1),
-                       offset:int = Query(0,ge=0)):
+                       offset:int = Query(0,ge=0),
+                       cursor:str|None=Query(None)):
     try:
-        return await ReviewService.get_all_review( db=db,
-                                               trip_id=trip_id,
-                                               search=serach,
-                                               limit=limit,
-                                               offset=offset)
+        if serach:
+            reviews, cursor_value = await ReviewService.search_review(db=db,
+                                                                      search=serach,
+                                                                      limit=limit,
+                                                                      offset=offset,
+                                                                      cursor=cursor)
+        else:
+            reviews = await ReviewService.get_all_review( db=db,
+                                                   trip_id=trip_id,
+                                                   limit=limit,
+                                                   offset=offset,
+                                                   cursor=cursor)
+            cursor_value = next_cursor(reviews, limit)
     except Exception as e:
         raise e
+    if cursor_value:
+        response.headers[NEXT_CURSOR_HEADER] = cursor_value
+    return reviews
    
 #상세보기
 @router.get('/{review_id}', response_model=oneReviewRead)
@@ -1,12 +1,13 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List
+from typing import List, Literal, Optional
+from app.core.pagination import NEXT_CURSOR_HEADER
 from app.db.database import get_db
 from app.services.trip_service import TripService
-from app.db.schema.trip import TripCreate, TripUpdate, TripInDB
-from app.db.schema.trip_day import TripDayCreate, TripDayInDB
+from app.db.schema.trip import TripCreate, TripUpdate, TripInDB, TripFull, TripSummary
+from app.db.schema.trip_day import TripDayCreate, TripDayInDB, TripDayWithSchedules
 from app.db.schema.trip_city import TripCityCreate, TripCityUpdate, TripCityInDB
-from app.db.schema.schedule import ScheduleCreate, ScheduleUpdate, ScheduleInDB
+from app.db.schema.schedule import ScheduleCreate, ScheduleUpdate, ScheduleInDB, ScheduleBatch
 from app.db.schema.checklist_item import ChecklistItemCreate, ChecklistItemUpdate, ChecklistItemInDB
 
 trip_service = TripService()
@@ -25,6 +26,11 @@ async def create_trip(trip: TripCreate, db: AsyncSession = Depends(get_db)):
 async def get_next_trip_with_city(user_id: int, db: AsyncSession = Depends(get_db)):
     return await trip_service.get_next_trip_with_city(db, user_id)
 
+# 여행 전체 조회(Read) : 도시 + 일자별 세부 일정(장소 포함) + 체크리스트를 한 번에
+@router.get("/{trip_id}/full", response_model=TripFull)
+async def get_trip_full(trip_id: int, db: AsyncSession = Depends(get_db)):
+    return await trip_service.get_trip_full(db, trip_id)
+
 # 여행 조회(Read)
 @router.get("/{trip_id}", response_model=TripInDB)
 async def get_trip(trip_id: int, db: AsyncSession = Depends(get_db)):
@@ -35,6 +41,20 @@ async def get_trip(trip_id: int, db: AsyncSession = Depends(get_db)):
 async def get_trips_by_user(user_id: int, db: AsyncSession = Depends(get_db)):
     return await trip_service.get_trips_by_user(db, user_id)
 
+# 특정 사용자의 여행 요약 목록(Read) : 첫 도시, 일수, 체크리스트 진행도만 (홈 화면용)
+# period: upcoming(가까운 순) / past / all(최근 순)
+# cursor: 이전 응답의 X-Next-Cursor 헤더값, 마지막 페이지면 헤더 없음
+@router.get("/user/{user_id}/summary", response_model=List[TripSummary])
+async def get_trip_summaries(user_id: int, response: Response,
+                             period: Literal["upcoming", "past", "all"] = "all",
+                             limit: int = Query(20, ge=1, le=100),
+                             cursor: Optional[str] = Query(None),
+                             db: AsyncSession = Depends(get_db)):
+    summaries, cursor_value = await trip_service.get_trip_summaries(db, user_id, period, limit, cursor)
+    if cursor_value:
+        response.headers[NEXT_CURSOR_HEADER] = cursor_value
+    return summaries
+
 # 여행 수정(Update)
 @router.put("/{trip_id}", response_model=TripInDB)
 async def update_trip(trip_id: int, trip_update: TripUpdate, db: AsyncSession = Depends(get_db)):
@@ -93,6 +113,11 @@ async def update_schedule(schedule_id: int, schedule_update: ScheduleUpdate, db:
 async def delete_schedule(schedule_id: int, db: AsyncSession = Depends(get_db)):
     return await trip_service.delete_schedule(db, schedule_id)
 
+# 세부 일정 일괄 수정 : 추가/수정/삭제/순서 변경을 한 번에 적용하고 일자의 세부 일정 전체를 반환
+@router.post("/days/{trip_day_id}/schedules/batch", response_model=TripDayWithSchedules)
+async def batch_update_schedules(trip_day_id: int, batch: ScheduleBatch, db: AsyncSession = Depends(get_db)):
+    return await trip_service.batch_update_schedules(db, trip_day_id, batch)
+
 # 4. 체크리스트 항목(ChecklistItem) 관련 API 엔드포인트
 
 # 체크리스트 항목 생성(Create)
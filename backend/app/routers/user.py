@@ -2,13 +2,11 @@ from fastapi import APIRouter, Depends, HTTPException,status
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.db.database import get_db
 from app.db.schema.user import UserCreate, UserResponse, UserLogin, UserUpdate, Token,UserBase
-from app.services.user import register_user,login_user,delete_user,get_user, update_user, read_all_user
-from app.db.model.user import User as UserModel
+from app.services.user import register_user,login_user,delete_user,get_user, update_user, read_all_user, get_current_user_by_id, CurrentUser
 from typing import Annotated , List
 from jose import JWTError
 from app.core.jwt import verify_access_token
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
-from app.db.crud import user as user_crud
 
 
 router = APIRouter(prefix='/users',tags=['User'])
@@ -17,7 +15,8 @@ DB_Dependency = Annotated[AsyncSession, Depends(get_db)]
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/users/login")
 
 
-async def get_current_user(db: DB_Dependency, token: str = Depends(oauth2_scheme)) -> UserModel:
+# 토큰 검증 후 사용자 정보는 캐시(app/services/user.py user_cache)에서 조회 - 캐시에 있으면 DB 조회 없음
+async def get_current_user(db: DB_Dependency, token: str = Depends(oauth2_scheme)) -> CurrentUser:
     try:
         payload = verify_access_token(token)
         user_id_str: str = payload.get("sub") # 토큰에서 사용자 ID(sub) 추출
@@ -43,7 +42,7 @@ async def get_current_user(db: DB_Dependency, token: str = Depends(oauth2_scheme
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    user = await user_crud.get_user_by_id(db, user_id)
+    user = await get_current_user_by_id(db, user_id)
     
     if user is None:
         # 토큰은 유효하지만 DB에 해당 유저가 없는 경우 (삭제된 계정)
@@ -56,7 +55,7 @@ async def get_current_user(db: DB_Dependency, token: str = Depends(oauth2_scheme
     return user
 
 
-Auth_Dependency = Annotated[UserModel, Depends(get_current_user)]
+Auth_Dependency = Annotated[CurrentUser, Depends(get_current_user)]
 
 
 @router.post("/login", response_model=Token)
@@ -102,7 +101,7 @@ async def del_user(db : DB_Dependency, current_user: Auth_Dependency):
 async def upd_user(
         user_data: UserUpdate, # 클라이언트가 보낸 수정 데이터
         db: DB_Dependency,
-        current_user: Auth_Dependency # 현재 로그인된 사용자 정보 (UserModel 인스턴스)
+        current_user: Auth_Dependency # 현재 로그인된 사용자 정보 (CurrentUser)
     ):
     
     mod_user = await update_user(
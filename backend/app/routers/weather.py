@@ -1,6 +1,7 @@
-from fastapi import APIRouter, Depends, status, HTTPException
+from fastapi import APIRouter, BackgroundTasks, Depends, status, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
+from app.core.security import verify_internal_token
 from app.db.database import get_db
 from app.db.model import City
 from app.services.weather import WeatherService
@@ -16,11 +17,16 @@ async def get_weather_by_city_url(city:str,db:AsyncSession=Depends(get_db)):
     res = await WeatherService.get_weather(db,city)   #front axios 변수 res
     return  res
 
-# 30일 지난 데이터 삭제 (관리자 의존성 추가 가능) Weather.created_at기준 30일
-@router.delete("/delete-old-weather", description="30일지난 데이터 삭제")
-async def cleanup_weather(db:AsyncSession=Depends(get_db)):
-    result = await WeatherService.delete_old_weather(db)
-    return result
+# 30일 지난 데이터 삭제 Weather.date기준 30일
+# 스케줄러가 주기적으로 실행 (main.py) - 수동 실행용 (내부 API 토큰 필요, 없으면 403)
+# 청크 사이에 쉬면서 오래 걸리므로 백그라운드로 시작만 하고 202 응답 / 이미 삭제 중이면 409
+@router.delete("/delete-old-weather", description="30일지난 데이터 삭제",
+               status_code=status.HTTP_202_ACCEPTED, dependencies=[Depends(verify_internal_token)])
+async def cleanup_weather(background_tasks:BackgroundTasks):
+    if WeatherService.purge_running():
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail='이미 삭제 작업이 실행 중입니다')
+    background_tasks.add_task(WeatherService.delete_old_weather)
+    return {"msg":"오래된 날씨 삭제 시작"}
 
 #city_id 기반으로 조회 :  여행계획trip에서  # {city_id}가 위에있으면 error
 @router.get("/{city_id}")
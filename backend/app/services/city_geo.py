@@ -0,0 +1,134 @@
+#도시 좌표(lat/lon) 공간 인덱스 - 가까운 도시 / 반경 내 도시 조회
+#위경도 격자(cell_deg도 단위)에 도시를 나눠 담고, 질의 지점의 반경을 덮는 격자만 골라 NumPy로 haversine 거리 계산
+#반경 -> 위경도 범위 변환은 구면 경계상자(bounding box) 공식 사용 (극/날짜변경선 근처도 누락 없음)
+#city_index와 같이 서버 시작/도시 추가·삭제/일괄추가/주기 작업에서 갱신 (app/services/city_index.py)
+import math
+from typing import Iterable, Optional
+
+import numpy as np
+
+EARTH_RADIUS_KM = 6371.0088
+#지구 반대편까지 거리 - 이 반경이면 모든 도시 포함
+MAX_DISTANCE_KM = math.pi * EARTH_RADIUS_KM
+
+
+#벡터화 haversine 거리(km) - 인자는 도(degree) 단위, NumPy 브로드캐스팅 규칙을 따름
+def haversine_km(lat1, lon1, lat2, lon2) -> np.ndarray:
+    lat1, lon1, lat2, lon2 = (np.radians(np.asarray(value, dtype=np.float64)) for value in (lat1, lon1, lat2, lon2))
+    a = (np.sin((lat2 - lat1) / 2) ** 2
+         + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2)
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+class CityGeoIndex:
+    def __init__(self, cities: Iterable = (), cell_deg: float = 1.0):
+        self.cell_deg = cell_deg
+        self._build({city.id: city for city in cities})
+
+    #좌표가 있는 도시만 배열로, 격자 {(위도칸, 경도칸): 배열 위치 목록}
+    def _build(self, cities: dict):
+        located = [city for city in cities.values() if city.lat is not None and city.lon is not None]
+        lat = np.array([city.lat for city in located], dtype=np.float64)
+        lon = np.array([city.lon for city in located], dtype=np.float64)
+        cells: dict[tuple[int, int], list[int]] = {}
+        for row, key in enumerate(zip(self._lat_cell(lat).tolist(), self._lon_cell(lon).tolist())):
+            cells.setdefault(key, []).append(row)
+        #검색 중에 교체되어도 한 번에 바뀌도록 참조만 바꿈
+        self._cities, self._located, self._lat, self._lon = cities, located, lat, lon
+        self._cells = {key: np.array(rows, dtype=np.intp) for key, rows in cells.items()}
+
+    def _lat_cell(self, lat):
+        return np.floor((np.asarray(lat) + 90.0) / self.cell_deg).astype(int)
+
+    def _lon_cell(self, lon):
+        return np.floor((np.asarray(lon) + 180.0) / self.cell_deg).astype(int)
+
+    def __len__(self) -> int:
+        return len(self._located)
+
+    def replace(self, cities: Iterable):
+        self._build({city.id: city for city in cities})
+
+    def add(self, city):
+        self._build({**self._cities, city.id: city})
+
+    def remove(self, city_id: int):
+        cities = dict(self._cities)
+        if cities.pop(city_id, None) is not None:
+            self._build(cities)
+
+    #반경 안의 도시가 들어있을 수 있는 배열 위치 (격자 단위 후보)
+    def _candidates(self, lat: float, lon: float, radius_km: float) -> np.ndarray:
+        if len(self._located) == 0:
+            return np.empty(0, dtype=np.intp)
+        angular = radius_km / EARTH_RADIUS_KM
+        lat_min, lat_max = lat - math.degrees(angular), lat + math.degrees(angular)
+        if lat_min <= -90 or lat_max >= 90 or angular >= math.pi / 2:
+            #극을 포함하면 모든 경도
+            lon_ranges = [(-180.0, 180.0)]
+            lat_min, lat_max = max(lat_min, -90.0), min(lat_max, 90.0)
+        else:
+            delta = math.degrees(math.asin(min(1.0, math.sin(angular) / math.cos(math.radians(lat)))))
+            lon_min, lon_max = lon - delta, lon + delta
+            if lon_min < -180:
+                lon_ranges = [(lon_min + 360, 180.0), (-180.0, lon_max)]
+            elif lon_max > 180:
+                lon_ranges = [(lon_min, 180.0), (-180.0, lon_max - 360)]
+            else:
+                lon_ranges = [(lon_min, lon_max)]
+
+        lat_cells = range(int(self._lat_cell(lat_min)), int(self._lat_cell(lat_max)) + 1)
+        lon_cells = [range(int(self._lon_cell(low)), int(self._lon_cell(high)) + 1) for low, high in lon_ranges]
+        if len(lat_cells) * sum(len(cells) for cells in lon_cells) >= len(self._cells):
+            #덮는 격자가 도시가 있는 격자보다 많으면 전체 검사가 더 빠름
+            return np.arange(len(self._located), dtype=np.intp)
+        found = [self._cells[(i, j)] for i in lat_cells for cells in lon_cells for j in cells
+                 if (i, j) in self._cells]
+        return np.concatenate(found) if found else np.empty(0, dtype=np.intp)
+
+    #반경(km) 안의 도시를 가까운 순으로 [(도시, 거리km)]
+    def within(self, lat: float, lon: float, radius_km: float, limit: Optional[int] = None) -> list[tuple[object, float]]:
+        rows = self._candidates(lat, lon, radius_km)
+        if rows.size == 0:
+            return []
+        distances = haversine_km(lat, lon, self._lat[rows], self._lon[rows])
+        inside = distances <= radius_km
+        rows, distances = rows[inside], distances[inside]
+        order = np.argsort(distances, kind="stable")
+        if limit is not None:
+            order = order[:limit]
+        return [(self._located[rows[i]], float(distances[i])) for i in order]
+
+    #가장 가까운 k개 [(도시, 거리km)] - 반경을 넓혀가며 k개 이상 찾으면 그 안에서 정렬 (정확한 결과)
+    def nearest(self, lat: float, lon: float, k: int = 10, max_radius_km: float = MAX_DISTANCE_KM) -> list[tuple[object, float]]:
+        radius = min(50.0, max_radius_km)
+        while True:
+            result = self.within(lat, lon, radius, limit=k)
+            if len(result) >= k or radius >= max_radius_km:
+                return result
+            radius = min(radius * 4, max_radius_km)
+
+    #여러 지점의 가장 가까운 k개를 한 번에 - (도시 목록, 거리km) 지점별 리스트
+    #지점 x 도시 거리행렬을 chunk 단위로 계산 (메모리 제한)
+    def nearest_batch(self, lats, lons, k: int = 10, chunk: int = 256) -> list[list[tuple[object, float]]]:
+        lats = np.asarray(lats, dtype=np.float64)
+        lons = np.asarray(lons, dtype=np.float64)
+        total = len(self._located)
+        k = min(k, total)
+        results: list[list[tuple[object, float]]] = []
+        if k == 0:
+            return [[] for _ in range(len(lats))]
+        for start in range(0, len(lats), chunk):
+            block = haversine_km(lats[start:start + chunk, None], lons[start:start + chunk, None],
+                                 self._lat[None, :], self._lon[None, :])
+            top = np.argpartition(block, k - 1, axis=1)[:, :k]
+            top_dist = np.take_along_axis(block, top, axis=1)
+            order = np.argsort(top_dist, axis=1, kind="stable")
+            top = np.take_along_axis(top, order, axis=1)
+            top_dist = np.take_along_axis(top_dist, order, axis=1)
+            for rows, distances in zip(top, top_dist):
+                results.append([(self._located[row], float(dist)) for row, dist in zip(rows, distances)])
+        return results
+
+
+city_geo_index = CityGeoIndex()
@@ -0,0 +1,139 @@
+#도시 자동완성용 메모리 인덱스
+#ko_name / city_name / ko_country / country로 접두어, 부분일치, 한글 초성(ㅅㅇ -> 서울) 검색
+#서버 시작시(main.py lifespan) DB에서 한 번 읽어 만들고, 도시 추가/삭제/일괄추가시 갱신 (좌표 인덱스 city_geo도 같이)
+#워커(프로세스)마다 따로 가지므로 다른 워커의 변경은 주기 작업(city-index-refresh)으로 반영
+import logging
+from bisect import bisect_left
+from itertools import islice
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+from sqlalchemy import select
+
+from app.db.database import AsyncsessionLocal
+from app.db.model.cities import City
+from app.services.city_geo import city_geo_index
+
+logger = logging.getLogger(__name__)
+
+CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+HANGUL_START, HANGUL_END = 0xAC00, 0xD7A3
+
+#필드 순위 - 도시명이 국가명보다 먼저
+NAME_FIELD, COUNTRY_FIELD = 0, 1
+#일치 순위 - 전체일치 > 접두어 > 부분일치
+EXACT, PREFIX, SUBSTRING = 0, 1, 2
+
+
+def normalize(text: Optional[str]) -> str:
+    return "".join((text or "").lower().split())
+
+
+#한글 음절을 초성으로 (그 외 문자는 그대로)
+def to_choseong(text: str) -> str:
+    return "".join(CHOSEONG[(ord(ch) - HANGUL_START) // 588] if HANGUL_START <= ord(ch) <= HANGUL_END else ch
+                   for ch in text)
+
+
+def is_choseong_query(query: str) -> bool:
+    return all(ch in CHOSEONG for ch in query)
+
+
+#CityInDB 응답에 그대로 쓸 수 있는 읽기 전용 도시 정보
+@dataclass(frozen=True)
+class CityEntry:
+    id: int
+    city_name: Optional[str]
+    ko_name: Optional[str]
+    country: Optional[str]
+    ko_country: Optional[str]
+    is_domestic: Optional[bool]
+    lat: Optional[float]
+    lon: Optional[float]
+
+    @classmethod
+    def from_city(cls, city: City) -> "CityEntry":
+        return cls(id=city.id, city_name=city.city_name, ko_name=city.ko_name, country=city.country,
+                   ko_country=city.ko_country, is_domestic=city.is_domestic, lat=city.lat, lon=city.lon)
+
+
+class CityIndex:
+    def __init__(self, cities: Iterable[CityEntry] = ()):
+        self._build({city.id: city for city in cities})
+
+    #정렬된 (검색키, 필드순위, 도시id) 목록 - 접두어 검색은 bisect, 부분일치는 전체 순회
+    def _build(self, cities: dict[int, CityEntry]):
+        keys, choseong_keys = [], []
+        for city in cities.values():
+            for value, field in ((city.ko_name, NAME_FIELD), (city.city_name, NAME_FIELD),
+                                 (city.ko_country, COUNTRY_FIELD), (city.country, COUNTRY_FIELD)):
+                key = normalize(value)
+                if key:
+                    keys.append((key, field, city.id))
+            for value, field in ((city.ko_name, NAME_FIELD), (city.ko_country, COUNTRY_FIELD)):
+                key = to_choseong(normalize(value))
+                if key:
+                    choseong_keys.append((key, field, city.id))
+        keys.sort()
+        choseong_keys.sort()
+        #검색 중에 교체되어도 한 번에 바뀌도록 참조만 바꿈
+        self._cities, self._keys, self._choseong_keys = cities, keys, choseong_keys
+
+    def __len__(self) -> int:
+        return len(self._cities)
+
+    def all(self) -> list[CityEntry]:
+        return list(self._cities.values())
+
+    def replace(self, cities: Iterable[CityEntry]):
+        self._build({city.id: city for city in cities})
+
+    def add(self, city: CityEntry):
+        self._build({**self._cities, city.id: city})
+
+    def remove(self, city_id: int):
+        cities = dict(self._cities)
+        if cities.pop(city_id, None) is not None:
+            self._build(cities)
+
+    #검색어가 초성으로만 되어 있으면 초성 검색, 아니면 이름/국가 검색
+    #순위: 전체일치 > 접두어 > 부분일치, 같으면 도시명 > 국가명, 이름이 짧은 순
+    def search(self, query: str, limit: int = 10) -> list[CityEntry]:
+        query = normalize(query)
+        if not query:
+            return []
+        keys = self._choseong_keys if is_choseong_query(query) else self._keys
+        best: dict[int, tuple[int, int]] = {}
+
+        def consider(city_id: int, rank: tuple[int, int]):
+            if rank < best.get(city_id, (SUBSTRING + 1, 0)):
+                best[city_id] = rank
+
+        start = bisect_left(keys, (query,))
+        for key, field, city_id in islice(keys, start, None):
+            if not key.startswith(query):
+                break
+            consider(city_id, (EXACT if key == query else PREFIX, field))
+        if len(best) < limit:
+            for key, field, city_id in keys:
+                if query in key and not key.startswith(query):
+                    consider(city_id, (SUBSTRING, field))
+
+        cities = self._cities
+        ranked = sorted(best, key=lambda city_id: (best[city_id], len(cities[city_id].ko_name or ""),
+                                                   cities[city_id].ko_name or "", city_id))
+        return [cities[city_id] for city_id in ranked[:limit]]
+
+
+city_index = CityIndex()
+
+
+#DB의 전체 도시로 인덱스(이름 + 좌표) 다시 생성 - 서버 시작/도시 일괄추가 후/주기 작업
+async def rebuild_city_index() -> dict:
+    async with AsyncsessionLocal() as db:
+        result = await db.execute(select(City))
+        entries = [CityEntry.from_city(city) for city in result.scalars().all()]
+    city_index.replace(entries)
+    city_geo_index.replace(entries)
+    logger.info("city index rebuilt: %d cities", len(entries))
+    return {"cities": len(entries)}
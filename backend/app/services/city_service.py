@@ -1,4 +1,4 @@
-from fastapi import HTTPException, status
+from fastapi import HTTPException, status, UploadFile
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 
@@ -7,14 +7,23 @@ from app.db.model.cities import City
 from app.db.model.places import Place
 from app.db.schema.cities import CityCreate
 from app.db.schema.places import PlaceCreate
+from app.core import city_import
+from app.services.city_index import city_index, CityEntry, rebuild_city_index
+from app.services.city_geo import city_geo_index
+from app.db.schema.cities import CityNearby
+from app.db.database import after_commit
+from dataclasses import asdict
 
 class CityService:
 
     ## 1. 도시(City) 관련 서비스 메서드
     
     # 도시 생성(Create) - 관리자용
+    # 메모리 인덱스는 커밋이 성공한 뒤에 반영 (커밋 실패시 없는 도시가 검색되지 않게)
     async def create_city(self, db: AsyncSession, city: CityCreate) -> City:
         new_city = await crud_city.create_city(db, city)
+        entry = CityEntry.from_city(new_city)
+        after_commit(db, lambda: (city_index.add(entry), city_geo_index.add(entry)))
         return new_city
     
     # 도시 조회(Read)
@@ -31,18 +40,58 @@ class CityService:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="도시를 찾을 수 없습니다.")
         return city
     
+    # 도시 검색(Read) - 자동완성용, DB 대신 메모리 인덱스(app/services/city_index.py)에서 조회
+    # 이름/국가 접두어·부분일치, 한글 초성(ㅅㅇ) 검색
+    async def search_cities(self, query: str, limit: int = 10) -> List[CityEntry]:
+        return city_index.search(query, limit)
+
+    # 가까운 도시 조회(Read) - 메모리 좌표 인덱스(app/services/city_geo.py)
+    # radius_km를 주면 반경 안에서 가까운 순 최대 k개, 없으면 가장 가까운 k개
+    async def get_nearby_cities(self, lat: float, lon: float, k: int = 10,
+                                radius_km: Optional[float] = None) -> List[CityNearby]:
+        if radius_km is not None:
+            found = city_geo_index.within(lat, lon, radius_km, limit=k)
+        else:
+            found = city_geo_index.nearest(lat, lon, k)
+        return [CityNearby(**asdict(city), distance_km=round(distance, 3)) for city, distance in found]
+
+    # 여러 지점의 가까운 도시 일괄 조회(Read) - 지점별 목록
+    async def get_nearby_cities_batch(self, points: list, k: int = 5) -> List[List[CityNearby]]:
+        found = city_geo_index.nearest_batch([point.lat for point in points], [point.lon for point in points], k)
+        return [[CityNearby(**asdict(city), distance_km=round(distance, 3)) for city, distance in nearby]
+                for nearby in found]
+
     # 모든 도시 조회(Read) - 사용자 선택용
     async def get_all_cities(self, db: AsyncSession) -> List[City]:
         cities = await crud_city.get_all_cities(db)
         return cities
     
-    # 도시 삭제(Delete) - 관리자용
+    # 도시 삭제(Delete) - 관리자용, 메모리 인덱스는 커밋 후 반영
     async def delete_city(self, db: AsyncSession, city_id: int) -> Optional[City]:
         deleted_city = await crud_city.delete_city(db, city_id)
         if not deleted_city:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="도시를 찾을 수 없습니다.")
+        after_commit(db, lambda: (city_index.remove(city_id), city_geo_index.remove(city_id)))
         return deleted_city
     
+    # 도시 일괄추가(Upsert) - 관리자용, 파일이 없으면 기본 도시목록(cities_list_ko.xlsx)
+    async def import_cities(self, file: Optional[UploadFile] = None) -> dict:
+        if file is None:
+            rows = city_import.read_xlsx_rows(str(city_import.DEFAULT_CITY_FILE))
+        else:
+            filename = file.filename or ""
+            if not filename.lower().endswith((".xlsx", ".csv")):
+                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="xlsx 또는 csv 파일만 가능합니다.")
+            rows = city_import.read_rows(file.file, filename)
+        # 손상/잘린 파일, 인코딩 오류는 city_import에서 ValueError(파일/행 위치 포함)로 올라옴
+        try:
+            stats = await city_import.import_cities(rows)
+        except (KeyError, ValueError) as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"도시 파일을 읽을 수 없습니다: {e}")
+        finally:
+            await rebuild_city_index() # 오류 전에 커밋된 배치도 반영
+        return stats
+
     ## 2. 장소(Place) 관련 서비스 메서드
     
     # 장소 생성(Create)
@@ -38,8 +38,9 @@ class CommentService:
                       review_id:int,
                       search:Optional[str]=None,
                       limit:int=10,
-                      offset:int = 0):
-        db_comment = await CommentCrud.get_all(db,review_id,search,limit,offset)
+                      offset:int = 0,
+                      cursor:Optional[str]=None):
+        db_comment = await CommentCrud.get_all(db,review_id,search,limit,offset,cursor)
         if not db_comment:
             return []
         for comment in db_comment:
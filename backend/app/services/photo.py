@@ -1,27 +1,42 @@
 from fastapi import HTTPException,status, UploadFile, File
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.db.model import Photo, Review
+from app.db.model import Review
 from app.db.crud import PhotoCrud
-from sqlalchemy import select
+from app.core.blob_store import get_blob_store
+from app.core.derivatives import schedule_derivatives, image_size
+from starlette.concurrency import run_in_threadpool
 
 
 class PhotoService:
     #사진생성 Create
     @staticmethod
     async def create_image(db:AsyncSession,review_id:int,user_id:int,file:UploadFile):
-        result = await db.execute(select(Review).where(Review.id == review_id))
-        db_review = result.scalars().first()
-        if not db_review:
+        #작성자만 필요하므로 리뷰 전체(댓글/사진 관계 포함)를 읽지 않음
+        result = await db.execute(select(Review.user_id).where(Review.id == review_id))
+        review_user_id = result.scalar_one_or_none()
+        if review_user_id is None:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail='리뷰가 존재하지 않습니다')
-        if db_review.user_id != user_id:
+        if review_user_id != user_id:
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail='본인이 작성한 리뷰에만 업로드가능')
         contents = await file.read()  #업로드된 파일을 읽어옴
+        #파일은 blob store(SHA-256 키)에 저장 - 파일 쓰기는 스레드풀에서
+        sha256 = await run_in_threadpool(get_blob_store().put, contents)
+        is_image = bool(file.content_type and file.content_type.startswith('image/'))
+        #원본 크기는 업로드할 때 한 번만 읽어 저장 (이미지 헤더만 읽음)
+        dimensions = await run_in_threadpool(image_size, contents) if is_image else None
+        width, height = dimensions or (None, None)
         db_photo = await PhotoCrud.create(db=db,
                                           review_id=review_id,                                                                              
                                           filename=file.filename,
                                           content_type=file.content_type,
-                                          data=contents)
+                                          sha256=sha256,
+                                          size=len(contents),
+                                          width=width,
+                                          height=height)
+        #축소본(썸네일) 생성은 프로세스 풀에 맡기고 기다리지 않음
+        if is_image:
+            schedule_derivatives(sha256)
         
         await db.flush()
         await db.refresh(db_photo)        
@@ -30,33 +45,39 @@ class PhotoService:
     #사진 리스트 조회 Read
     @staticmethod
     async def get_all_photo(db:AsyncSession,review_id:int):
-        result = await db.execute(select(Review).where(Review.id == review_id))
-        db_review = result.scalars().first()
-        if not db_review:
+        result = await db.execute(select(Review.id).where(Review.id == review_id))
+        if result.scalar_one_or_none() is None:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail='리뷰가 존재하지 않습니다')
         db_photo = await PhotoCrud.get_all(db,review_id)
         if not db_photo: 
             return [] #등록사진 없으면 빈배열
-        print(db_photo)
         return db_photo      
         
-    #사진 단일 조회(대표이미지/원본조회) 
+    #사진 단일 조회(대표이미지/원본조회) - 메타데이터만 (get_photo_meta)
     @staticmethod
     async def get_photo(db:AsyncSession,review_id:int,photo_id:int):  
-        #리뷰 존재여부
-        result = await db.execute(select(Review).where(Review.id == review_id))
-        db_review = result.scalars().first()
-        if not db_review:
+        return await PhotoService.get_photo_meta(db,review_id,photo_id)
+    
+    #원본 전송용 메타데이터 조회 - data(LONGBLOB)는 읽지 않음
+    #사진을 먼저 찾고, 없을 때만 리뷰 존재여부를 확인해 에러 메시지 구분
+    @staticmethod
+    async def get_photo_meta(db:AsyncSession,review_id:int,photo_id:int):
+        db_photo = await PhotoCrud.get_meta(db,review_id,photo_id)
+        if db_photo:
+            return db_photo
+        result = await db.execute(select(Review.id).where(Review.id == review_id))
+        if result.scalar_one_or_none() is None:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail='리뷰가 존재하지 않습니다')
-        #사진 검증        
-        query = select(Photo).where(Photo.id == photo_id,
-                                    Photo.review_id == review_id)        
-        result = await db.execute(query)
-        db_photo = result.scalar_one_or_none()
-        if not db_photo:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND,detail='사진이 존재하지 않습니다')
+
+    #이전 방식(DB 저장) 사진 바이트 조회
+    @staticmethod
+    async def get_photo_data(db:AsyncSession,photo_id:int) -> bytes:
+        data = await PhotoCrud.get_data(db,photo_id)
+        if data is None:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND,detail='사진이 존재하지 않습니다')
-        return db_photo
-    
+        return data
+
     #사진 삭제 Delete
     @staticmethod
     async def delete_photo_by_id(db:AsyncSession,photo_id:int,user_id:int)->bool:
@@ -2,7 +2,8 @@ from fastapi import HTTPException,status, UploadFile, File
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.db.model import Review,Like,Trip,City, Photo, TripCity
 from app.db.schema.review import ReviewCreate, ReviewUpdate, LikeResponse, ReviewRead
-from app.db.crud import ReviewCrud, LikeCrud, crud_trip
+from app.db.schema.comment import CommentRead
+from app.db.crud import ReviewCrud, ReviewSearchCrud, LikeCrud, CommentCrud, PhotoCrud, crud_trip
 from app.routers.user import Auth_Dependency
 from sqlalchemy import select
 from typing import Optional
@@ -19,10 +20,6 @@ def add_username(review:Review):
     else:
         raise HTTPException(status_code=404,detail='작성자 정보 없음')
     return review
-#like_count 
-async def add_likecounts(db:AsyncSession,review:Review):           
-    review.like_count=await LikeCrud.count_by_review(db,review.id)
-    return review
 #get currnet id -> 가능하면 user쪽으로 이전 (trip, city 생성시에도 쓸 수 있게)
 async def get_current_user_id(currnet_user:Auth_Dependency):
     user_id = currnet_user.id
@@ -35,6 +32,42 @@ def add_city_name(review:Review):
     else: 
         raise HTTPException(status_code=404, detail='(add_city_name) 도시정보없음')
     return review
+#photo_url - size가 있으면 해당 너비 이상의 축소본 URL
+def make_photo_url(review_id:int, photo_id:int, size:Optional[int]=None) -> str:
+    # return f'{settings.backend_url}/reviews/{review_id}/photos/{photo_id}/raw'
+    url = f'http://localhost:8081/reviews/{review_id}/photos/{photo_id}/raw'
+    return f'{url}?size={size}' if size else url
+
+#피드 조립 - 앞쪽 댓글/대표사진을 리뷰 개수와 상관없이 고정 횟수의 그룹 쿼리로 가져와 메모리에서 합침
+#review.comments(relationship)에 잘라낸 목록을 대입하면 delete-orphan으로 나머지 댓글이 삭제되므로 응답 모델을 직접 만든다
+async def build_review_feed(db:AsyncSession, reviews:list[Review], comment_limit:int=10) -> list[ReviewRead]:
+    review_ids = [review.id for review in reviews]
+    comments_by_review = await CommentCrud.get_first_by_reviews(db, review_ids, comment_limit)
+    photo_ids = await PhotoCrud.get_first_ids_by_reviews(db, review_ids)
+
+    feed = []
+    for review in reviews:
+        add_username(review)
+        add_city_name(review)
+        comments = [CommentRead.model_validate(add_username(comment))
+                    for comment in comments_by_review.get(review.id, [])]
+        photo_id = photo_ids.get(review.id)
+        feed.append(ReviewRead(
+            review_id=review.id,
+            user_id=review.user_id,
+            trip_id=review.trip_id,
+            title=review.title,
+            content=review.content,
+            rating=review.rating,
+            created_at=review.created_at,
+            username=review.username,
+            like_count=review.like_count,
+            city_id=review.city_id,
+            city_name=review.city_name,
+            comments=comments,
+            photo_url=make_photo_url(review.id, photo_id, settings.feed_photo_size) if photo_id else None,
+        ))
+    return feed
 
 #리뷰
 class ReviewService:
@@ -79,40 +112,26 @@ class ReviewService:
     @staticmethod
     async def get_all_review(db:AsyncSession,
                       trip_id:Optional[int],
-                      search:Optional[str]=None,
                       limit:int=100,
-                      offset:int = 0):
-        db_review = await ReviewCrud.get_all(db,search,limit,offset)
-        #orm 반환용 / user주입 / like_count 초기값
-        
+                      offset:int = 0,
+                      cursor:Optional[str]=None):
+        db_review = await ReviewCrud.get_all(db,limit,offset,cursor)
         if not db_review:
             return []
-        for review in db_review:
-            add_username(review)
-            add_city_name(review)
-            await add_likecounts(db,review)  
-            review_id=review.id
-            # print("reviewid:",review_id)
-
-            #comments []            
-            comments=await CommentService.get_all_comment(db,review_id, None, 10, 0)
-            if comments:
-                for comment in comments:
-                    add_username(comment)
-            review.comments = comments or []
-
-            #photo_url
-            photo_result =await db.execute(select(Photo.id).where(Photo.review_id==review.id))
-            db_photo_id = photo_result.scalar()
-            # print("db_photos\.id:",db_photo_id)
-            if db_photo_id:         
-                    # review.photo_url=f'{settings.backend_url}/reviews/{review_id}/photos/{db_photo_id}/raw'
-                    review.photo_url=f'http://localhost:8081/reviews/{review_id}/photos/{db_photo_id}/raw'
-                    # print("photo_url:",review.photo_url)
-            else:
-                review.photo_url=None                
+        #리뷰마다 댓글/사진을 따로 조회하던 N+1 대신 일괄 조회
+        return await build_review_feed(db, db_review)
 
-        return db_review
+    #리뷰 검색 - 전문검색 인덱스 관련도순, (리뷰목록, 다음 커서) 반환
+    @staticmethod
+    async def search_review(db:AsyncSession,
+                            search:str,
+                            limit:int=100,
+                            offset:int=0,
+                            cursor:Optional[str]=None):
+        db_review, next_cursor = await ReviewSearchCrud.search(db,search,limit,offset,cursor)
+        if not db_review:
+            return [], None
+        return await build_review_feed(db, db_review), next_cursor
 
     #review_id로 개별조회
     @staticmethod
@@ -128,8 +147,7 @@ class ReviewService:
         add_username(db_review)
         #city_name
         add_city_name(db_review)
-        #like_count       
-        await add_likecounts(db,db_review)
+        #like_count - review.like_count 컬럼 그대로 사용
         #photo_url, photo_id 추가
         photo_result =await db.execute(select(Photo.id).where(Photo.review_id==db_review.id))
         db_photo_id = photo_result.scalar()
@@ -198,28 +216,37 @@ class ReviewService:
 #좋아요(Like)
 class LikeService:
     # 좋아요 토글 - 한 게시글당 한번
+    # 좋아요 insert/delete와 review.like_count 증감을 같은 트랜잭션에서 처리 (get_db에서 commit)
     @staticmethod
     async def toggle(db:AsyncSession, user_id:Optional[int], review_id:int):
         if await LikeCrud.exists(db,user_id,review_id):
-            await LikeCrud.delete_id(db,user_id,review_id)
-            await db.flush()
+            deleted = await LikeCrud.delete_id(db,user_id,review_id)
             liked = False
+            delta = -1 if deleted else 0
         else:
             await LikeCrud.create(db,user_id,review_id)
-            await db.flush()
             liked = True
-        
-        count = await LikeCrud.count_by_review(db,review_id)
+            delta = 1
+
+        if delta:
+            count = await LikeCrud.add_count(db,review_id,delta)
+        else:
+            count = await LikeCrud.get_count(db,review_id)
         return LikeResponse(review_id=review_id,like_count=count,liked=liked)
                              #like_count = 좋아요 갯수, liked= 로그인한 유저 좋아요 토글
     #로그인 안해도 조회
     @staticmethod 
     async def count_likes(db:AsyncSession, review_id:int, user_id:int|None=None):        
-        count = await LikeCrud.count_by_review(db,review_id)
+        count = await LikeCrud.get_count(db,review_id)
         liked=False
        
         if user_id:
             liked = await LikeCrud.exists(db,user_id,review_id)
        
         return LikeResponse(review_id=review_id,like_count=count,liked=liked)
-                             
+
+    #좋아요 수 정합성 보정 - likes 테이블 기준으로 review.like_count 재계산
+    @staticmethod
+    async def reconcile_counts(db:AsyncSession):
+        fixed = await LikeCrud.reconcile_counts(db)
+        return {"msg":"좋아요 수 보정 완료", "fixed": fixed}
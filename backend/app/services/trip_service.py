@@ -4,8 +4,9 @@ from sqlalchemy import text, select
 from sqlalchemy.orm import selectinload
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
-from datetime import timedelta
+from datetime import datetime, timedelta, time
 from app.db.crud import crud_trip, crud_city
+from app.core.pagination import next_cursor
 from app.db.model.trip import Trip
 from app.db.model.trip_day import TripDay
 from app.db.model.trip_city import TripCity
@@ -14,10 +15,24 @@ from app.db.model.checklist_item import ChecklistItem
 from app.db.schema.trip import TripCreate, TripUpdate
 from app.db.schema.trip_day import TripDayCreate
 from app.db.schema.trip_city import TripCityCreate, TripCityUpdate
-from app.db.schema.schedule import ScheduleCreate, ScheduleUpdate
+from app.db.schema.schedule import ScheduleCreate, ScheduleUpdate, ScheduleBatch
 from app.db.schema.checklist_item import ChecklistItemCreate, ChecklistItemUpdate
 from datetime import date
 
+# DATETIME 컬럼 값(datetime)과 요청 값(date)을 같은 기준으로 비교
+def to_date(value):
+    return value.date() if isinstance(value, datetime) else value
+
+# 여행 기간(일) - 종료일이 없으면 None
+def trip_duration(start_date, end_date) -> Optional[int]:
+    if start_date is None or end_date is None:
+        return None
+    return (to_date(end_date) - to_date(start_date)).days + 1
+
+# 세부 일정 표시 순서 : position -> 시작 시간 (시간 없는 일정은 뒤로) -> id
+def schedule_order(schedule: Schedule):
+    return (schedule.position, schedule.start_time is None, schedule.start_time or time.min, schedule.id)
+
 class TripService:
 
     ## 1. 여행(Trip) 관련 서비스 메서드
@@ -55,12 +70,11 @@ class TripService:
             for i in range(1, duration_days + 1)
         ]
 
-        # 5. 모든 객체(Trip, TripCity, TripDay)를 DB에 추가
+        # 5. 모든 객체(Trip, TripCity, TripDay)를 DB에 추가 (커밋은 요청이 끝날 때 get_db에서)
         try:
             db.add(new_trip)
-            await db.flush()    # 커밋 전에 flush하여 ID를 먼저 가져옴
-            new_trip_id = new_trip.id   # 만료되지 않은 객체에서 ID를 안전하게 저장
-            await db.commit()   # 트랜잭션 최종 커밋
+            await db.flush()    # flush하여 ID를 먼저 가져옴
+            new_trip_id = new_trip.id
         except Exception as e:
             await db.rollback()
             raise HTTPException(status_code=500, detail=f"DB Error on create: {e}")
@@ -78,11 +92,29 @@ class TripService:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="여행을 찾을 수 없습니다.")
         return trip
     
+    # 여행 전체 조회(Read) - 일자는 day_sequence, 세부 일정은 표시 순서(schedule_order)대로
+    async def get_trip_full(self, db: AsyncSession, trip_id: int) -> Trip:
+        trip = await crud_trip.get_trip_full(db, trip_id)
+        if not trip:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="여행을 찾을 수 없습니다.")
+        trip.trip_cities.sort(key=lambda x: (x.start_date, x.id))
+        trip.trip_day.sort(key=lambda x: x.day_sequence)
+        for day in trip.trip_day:
+            day.schedule.sort(key=schedule_order)
+        trip.checklist_item.sort(key=lambda x: x.id)
+        return trip
+    
     # 특정 사용자의 모든 여행 조회(Read)
     async def get_trips_by_user(self, db: AsyncSession, user_id: int) -> List[Trip]:
         trips = await crud_trip.get_trips_by_user(db, user_id)
         return trips
     
+    # 특정 사용자의 여행 요약 목록(Read) - (요약 목록, 다음 페이지 커서)
+    async def get_trip_summaries(self, db: AsyncSession, user_id: int, period: str = "all",
+                                 limit: int = 20, cursor: Optional[str] = None):
+        rows = await crud_trip.get_trip_summaries(db, user_id, period, date.today(), limit, cursor)
+        return rows, next_cursor(rows, limit, sort_attr="start_date")
+    
     # 11/2 추가(나영일)
     async def get_trip_cities_by_trip_id(self, db: AsyncSession, trip_id: int) -> List[TripCity]:
         trip_cities = await crud_trip.get_trip_cities(db, trip_id)
@@ -90,64 +122,73 @@ class TripService:
 
     # 여행 수정(Update) 
     # 11/2 수정(나영일) : 서비스에서 모든 로직 처리
+    # 보낸 필드만 반영하고, 바뀐 TripCity / 늘거나 줄어든 TripDay만 bulk 문으로 처리 (제목만 바꾸면 trip 한 행만 UPDATE)
     async def update_trip(self, db: AsyncSession, trip_id: int, trip_update: TripUpdate) -> Optional[Trip]:
         
-        # 1. 원본 Trip을 'trip_day'와 'trip_cities' 모두와 함께 로드
-        db_trip = await crud_trip.get_trip_with_relations(db, trip_id)
+        # 1. 원본 Trip만 로드 (trip_cities / trip_day는 필요할 때만 따로 조회)
+        db_trip = await db.get(Trip, trip_id)
 
         if not db_trip:
             raise HTTPException(status_code=404, detail="Trip not found")
 
         # 2. 날짜 변경 감지를 위해 이전 기간을 계산
-        old_duration_days = (db_trip.end_date - db_trip.start_date).days + 1
+        old_duration_days = trip_duration(db_trip.start_date, db_trip.end_date)
         
-        # 3. Trip의 기본 정보(제목, 시작/종료일) 업데이트
+        # 3. Trip의 기본 정보(제목, 시작/종료일) 중 보낸 필드만, 값이 바뀐 경우에만 업데이트
         # 시작일이 바뀌어도 'trip_days'는 건드리지 않습니다.
-        db_trip.title = trip_update.title
-        db_trip.start_date = trip_update.start_date
-        db_trip.end_date = trip_update.end_date
+        update_data = trip_update.model_dump(exclude_unset=True, exclude={"trip_cities"})
+        for key, value in update_data.items():
+            if to_date(getattr(db_trip, key)) != to_date(value):
+                setattr(db_trip, key, value)
         
-        # 4. TripCity 목록 교체 (cascade가 처리)
-        db_trip.trip_cities = [
-            TripCity(
-                city_id=city.city_id,
-                start_date=city.start_date,
-                end_date=city.end_date
-            ) for city in trip_update.trip_cities
-        ]
+        try:
+            # 4. TripCity 목록 비교 후 바뀐 행만 반영 (trip_cities를 보내지 않으면 그대로)
+            if trip_update.trip_cities is not None:
+                await self._reconcile_trip_cities(db, trip_id, trip_update.trip_cities)
 
-        # 5. 새로운 기간 계산
-        new_duration_days = (db_trip.end_date - db_trip.start_date).days + 1
+            # 5. 기간이 바뀌었으면 뒤쪽 TripDay만 삭제(세부 일정 포함) / 추가
+            new_duration_days = trip_duration(db_trip.start_date, db_trip.end_date)
+            if old_duration_days and new_duration_days and new_duration_days != old_duration_days:
+                await crud_trip.resize_trip_days(db, trip_id, old_duration_days, new_duration_days)
 
-        # 6. 기간 변경 로직 수행
-        if new_duration_days < old_duration_days:
-            # Case 1: 기간 축소
-            # 새 기간보다 큰 'day_sequence'를 가진 TripDay를 목록에서 제거
-            # cascade="all, delete-orphan"이 DB에서 이들을 삭제함
-            db_trip.trip_day = [
-                day for day in db_trip.trip_day 
-                if day.day_sequence <= new_duration_days
-            ]
-            
-        elif new_duration_days > old_duration_days:
-            # Case 2: 기간 연장
-            # 기존 기간 이후부터 새 기간까지 빈 TripDay 객체를 추가
-            for i in range(old_duration_days + 1, new_duration_days + 1):
-                db_trip.trip_day.append(
-                    TripDay(day_sequence=i)
-                )
-        
-        # 7. 모든 변경사항을 한 번에 커밋
-        try:
-            db.add(db_trip)
-            await db.commit()
-            await db.refresh(db_trip)
-            await db.refresh(db_trip, attribute_names=['trip_cities', 'trip_day'])
+            # 6. Trip 기본 정보 flush (커밋은 요청이 끝날 때 get_db에서)
+            await db.flush()
         except Exception as e:
             await db.rollback()
             raise HTTPException(status_code=500, detail=f"DB Error: {e}")
         
-        return db_trip
+        # 새로 추가된 TripCity의 City까지 채워서 반환
+        return await crud_trip.get_trip_with_relations(db, trip_id)
+
+    # TripCity 비교 : (city_id, 시작일, 종료일)이 같은 기존 행은 그대로 두고
+    # 남은 것 중 city_id가 같은 행은 날짜만 UPDATE, 나머지는 DELETE / INSERT
+    async def _reconcile_trip_cities(self, db: AsyncSession, trip_id: int, trip_cities: List[TripCityUpdate]):
+        unmatched = {}  # (city_id, 시작일, 종료일) -> 기존 TripCity id 목록
+        for row_id, city_id, start_date, end_date in await crud_trip.get_trip_city_rows(db, trip_id):
+            unmatched.setdefault((city_id, to_date(start_date), to_date(end_date)), []).append(row_id)
+
+        added = []
+        for city in trip_cities:
+            row_ids = unmatched.get((city.city_id, city.start_date, city.end_date))
+            if row_ids:
+                row_ids.pop(0)
+            else:
+                added.append(city)
+
+        removed = {}  # city_id -> 짝이 없는 기존 TripCity id 목록
+        for (city_id, _, _), row_ids in unmatched.items():
+            removed.setdefault(city_id, []).extend(row_ids)
+
+        updates, creates = [], []
+        for city in added:
+            row_ids = removed.get(city.city_id)
+            if row_ids:
+                updates.append({"id": row_ids.pop(0), "start_date": city.start_date, "end_date": city.end_date})
+            else:
+                creates.append({"trip_id": trip_id, **city.model_dump()})
+        deletes = [row_id for row_ids in removed.values() for row_id in row_ids]
+
+        await crud_trip.apply_trip_city_changes(db, trip_id, deletes, updates, creates)
     
     # 여행 삭제(Delete)
     async def delete_trip(self, db: AsyncSession, trip_id: int) -> Optional[Trip]:
@@ -155,7 +196,7 @@ class TripService:
         if not db_trip:
             raise HTTPException(status_code=404, detail="Trip not found")
         await db.delete(db_trip)
-        await db.commit()
+        await db.flush()
         return
     
     ## 2. 일자별 여행 계획(TripDay) 관련 서비스 메서드
@@ -209,6 +250,61 @@ class TripService:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="세부 일정을 찾을 수 없습니다.")
         return deleted_schedule
     
+    # 세부 일정 일괄 수정 - 추가/수정/삭제/순서 변경을 한 트랜잭션으로 적용하고 일자 상태를 반환
+    # 처리 순서: 삭제 -> 수정 -> 순서 변경(order) -> 추가, 적용 후 position은 0부터 다시 매김
+    async def batch_update_schedules(self, db: AsyncSession, trip_day_id: int, batch: ScheduleBatch) -> TripDay:
+        trip_day = await crud_trip.get_trip_day(db, trip_day_id)
+        if not trip_day:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="일자별 여행 계획을 찾을 수 없습니다.")
+
+        current = dict(await crud_trip.get_schedule_positions(db, trip_day_id))
+        deletes = set(batch.deletes)
+        remaining = [schedule_id for schedule_id in current if schedule_id not in deletes]
+        update_ids = [item.id for item in batch.updates]
+
+        unknown = (deletes | set(update_ids) | set(batch.order or [])) - set(current)
+        if unknown:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND,
+                                detail=f"이 일자의 세부 일정이 아닙니다: {sorted(unknown)}")
+        if len(update_ids) != len(set(update_ids)) or deletes & set(update_ids):
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="같은 세부 일정을 두 번 수정/삭제할 수 없습니다.")
+        if batch.order is not None and (len(batch.order) != len(set(batch.order)) or deletes & set(batch.order)):
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="순서(order)에 중복되거나 삭제할 일정이 있습니다.")
+
+        # 최종 순서 : order에 있는 일정 -> 나머지 기존 일정 -> 새 일정 (position 지정시 그 자리에)
+        in_order = set(batch.order or [])
+        ordered = list(batch.order or []) + [schedule_id for schedule_id in remaining if schedule_id not in in_order]
+        creates = [None] * len(batch.creates)
+        for index, item in sorted(enumerate(batch.creates),
+                                  key=lambda x: (x[1].position is None, x[1].position or 0)):
+            values = item.model_dump(exclude={"position"})
+            values["trip_day_id"] = trip_day_id
+            creates[index] = values
+            if item.position is None:
+                ordered.append(values)
+            else:
+                ordered.insert(min(item.position, len(ordered)), values)
+
+        updates = {item.id: {"id": item.id, **item.model_dump(exclude_unset=True, exclude={"id"})}
+                   for item in batch.updates}
+        for position, entry in enumerate(ordered):
+            if isinstance(entry, dict):
+                entry["position"] = position
+            elif current[entry] != position:
+                updates.setdefault(entry, {"id": entry})["position"] = position
+
+        try:
+            await crud_trip.apply_schedule_batch(db, trip_day_id, list(deletes),
+                                                 [values for values in updates.values() if len(values) > 1],
+                                                 creates)
+        except Exception as e:
+            await db.rollback()
+            raise HTTPException(status_code=500, detail=f"DB Error: {e}")
+
+        trip_day = await crud_trip.get_trip_day_with_schedules(db, trip_day_id)
+        trip_day.schedule.sort(key=schedule_order)
+        return trip_day
+    
     ## 4. 체크리스트 항목(ChecklistItem) 관련 서비스 메서드
 
     # 체크리스트 항목 생성(Create)
@@ -253,10 +349,7 @@ class TripService:
         
         # 1. 오늘 날짜 이후로 가장 가까운 'Trip'을 먼저 찾습니다.
         today = date.today()
-        stmt = select(Trip).where(
-            Trip.user_id == user_id,
-            Trip.start_date >= today
-        ).order_by(Trip.start_date.asc()).limit(1) # ASC (오름차순)
+        stmt = crud_trip.upcoming_trips_stmt(today, user_id=user_id).limit(1) # 시작일 ASC (오름차순)
         
         result = await db.execute(stmt)
         next_trip = result.scalars().first()
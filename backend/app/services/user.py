@@ -1,10 +1,63 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, status
-from app.core.security import hash_password, verify_password
+from app.core.security import hash_password_async, verify_and_update_password_async
 from app.core.jwt import create_access_token
 from datetime import datetime
 from app.db.crud import user as user_crud
 from app.db.schema.user import UserUpdate
+from app.db.model.user import User
+from app.core.cache import TTLCache
+from app.core.settings import settings
+from app.db.database import after_commit
+from dataclasses import dataclass
+
+
+#인증된 사용자 정보 (get_current_user 결과) - 요청마다 DB에서 User를 읽지 않도록 캐시에 보관
+@dataclass(frozen=True)
+class CurrentUser:
+    id: int
+    username: str
+    email: str
+    group_id: int
+
+    @classmethod
+    def from_user(cls, user: User) -> "CurrentUser":
+        return cls(id=user.id, username=user.username, email=user.email, group_id=user.group_id)
+
+
+#{user_id: CurrentUser} - 수정/삭제시 invalidate_user로 제거
+#워커(프로세스)마다 따로 가지므로 다른 워커에는 최대 user_cache_ttl초 동안 이전 정보가 남을 수 있음
+user_cache = TTLCache(maxsize=settings.user_cache_size, ttl=settings.user_cache_ttl)
+#invalidate_user 호출 횟수 - DB를 읽는 동안 무효화가 있었으면 읽은 값(이전 정보일 수 있음)을 캐시하지 않음
+_invalidations = 0
+
+
+def invalidate_user(user_id: int):
+    global _invalidations
+    _invalidations += 1
+    user_cache.delete(user_id)
+
+
+#수정/삭제 요청에서 호출 - 지금 한 번, 커밋이 끝난 뒤 한 번 더
+#(커밋 전에 다른 요청이 이전 행을 읽어 캐시하면 커밋 후 무효화로 지움)
+def invalidate_user_on_commit(db: AsyncSession, user_id: int):
+    invalidate_user(user_id)
+    after_commit(db, lambda: invalidate_user(user_id))
+
+
+#토큰의 사용자 id로 사용자 정보 조회 - 캐시에 있으면 DB 조회 없음, 없는 사용자면 None
+async def get_current_user_by_id(db: AsyncSession, user_id: int) -> CurrentUser | None:
+    current_user = user_cache.get(user_id)
+    if current_user is not None:
+        return current_user
+    invalidations = _invalidations
+    user = await user_crud.get_user_by_id(db, user_id)
+    if user is None:
+        return None
+    current_user = CurrentUser.from_user(user)
+    if invalidations == _invalidations:
+        user_cache.set(user_id, current_user)
+    return current_user
 
 
 #회원가입
@@ -25,14 +78,20 @@ async def register_user(db: AsyncSession, username: str, email: str, password: s
             detail="Username already taken"
         )
 
-    hashed_pw = hash_password(password)
+    hashed_pw = await hash_password_async(password)
     return await user_crud.create_user(db, username, email, hashed_pw)
 
 #로근인
 async def login_user(db: AsyncSession, email: str, password: str) -> str | None:
     user = await user_crud.get_user_by_email(db, email)
-    if not user or not verify_password(password, user.password):
+    if not user:
+        return None
+    verified, new_hash = await verify_and_update_password_async(password, user.password)
+    if not verified:
         return None
+    if new_hash:
+        # bcrypt 설정(rounds)이 바뀌었으면 새 설정으로 다시 해시해 저장
+        await user_crud.update_user(db, user_id=user.id, hashed_password=new_hash)
 
     return create_access_token(data={"sub": str(user.id)})
 
@@ -57,6 +116,7 @@ async def read_all_user(db: AsyncSession):
 #유저 삭제 
 async def delete_user(db: AsyncSession, user_id: int):
     is_deleted = await user_crud.delete_user(db, user_id)
+    invalidate_user_on_commit(db, user_id)
     if not is_deleted:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -68,7 +128,7 @@ async def delete_user(db: AsyncSession, user_id: int):
 async def update_user(db: AsyncSession, user_id: int ,user_data:UserUpdate):
     hashed_password = None
     if user_data.password:
-        hashed_password = hash_password(user_data.password)
+        hashed_password = await hash_password_async(user_data.password)
 
     updated_user = await user_crud.update_user(
         db,
@@ -77,6 +137,7 @@ async def update_user(db: AsyncSession, user_id: int ,user_data:UserUpdate):
         email=user_data.email,
         hashed_password=hashed_password
     )
+    invalidate_user_on_commit(db, user_id)
 
     if not updated_user:
         raise HTTPException(
@@ -9,18 +9,54 @@ from sqlalchemy import select
 from typing import Optional
 from sqlalchemy import select, or_, desc, func, delete
 from app.core.settings import settings
-from datetime import datetime, timedelta
-import httpx
-import json
+from app.core.cache import TTLCache, SingleFlight
+from app.core.http import get_http_client, UpstreamUnavailable
+from app.db.crud import crud_trip
+from app.db.database import AsyncsessionLocal, after_commit
+from datetime import datetime, timedelta, date
+import asyncio
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+#DB에 저장된 날씨를 재사용하는 시간
+WEATHER_FRESH_FOR = timedelta(hours=3)
+
+#DB 캐시 앞단의 메모리 캐시 {도시이름: 날씨} - 항목 유효시간은 DB 저장시각 기준 남은 시간
+weather_cache = TTLCache(maxsize=settings.weather_cache_size, ttl=settings.weather_cache_ttl)
+#같은 도시를 동시에 요청하면 한 요청만 DB/외부 api 조회 (중복 호출/중복 Weather 저장 방지)
+weather_flight = SingleFlight()
+#오래된 날씨 삭제는 워커(프로세스)마다 한 번에 하나만 (스케줄러 주기 작업/수동 실행이 겹치지 않게)
+weather_purge_lock = asyncio.Lock()
+
+
 class WeatherService:
     #외부 api 호출 후 DB저장 기초호출만구현//
     #  DB저장후 3시간 이내 재요청시 저장된값 DB에서 호출추가(외부호출누수 방지) 
+    #0메모리 캐시 확인 (없으면 도시별로 한 요청만 아래 과정 진행)
     #1도시조회
     #2db캐시확인 조건분기(3h이상 3h 미만)
     #3 city_name / get city_id join / 외부 api호출
     @staticmethod
     async def get_weather(db:AsyncSession,city:str):
-        #도시 조회
+        data = weather_cache.get(city)
+        if data is not None:
+            return data
+        return await weather_flight.do(city, lambda: WeatherService._load_weather(db, city))
+
+    #fresh_for: 이 시간 이내에 저장된 날씨만 재사용 (미리 조회할 때는 더 짧게 줘서 만료 전에 갱신)
+    @staticmethod
+    async def _load_weather(db:AsyncSession,city:str,fresh_for:timedelta=WEATHER_FRESH_FOR):
+        # 1. DB 캐시 조회 - 도시이름으로 weather(city_id, date) 인덱스를 바로 조회 (쿼리 1번)
+        since = datetime.utcnow() - fresh_for
+        cached = await WeatherCrud.get_latest(db, city, since)
+        if cached:
+            data, fetched_at = cached
+            WeatherService._remember(city, data, fetched_at)
+            return data
+
+        # 2. 캐시가 없으면 도시 조회 (좌표)
         result = await db.execute(select(City).where(City.city_name==city))
         db_city = result.scalars().first() #도시정보
 
@@ -28,32 +64,9 @@ class WeatherService:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail='도시없음')
         lat = db_city.lat
         lon = db_city.lon
-
-        # -----------------------------------------------------------------
-        # [수정] 캐시 조회 로직 (M2M Join 사용)
-        # -----------------------------------------------------------------
-        three_hours_ago = datetime.utcnow() - timedelta(hours=3)
-        
-        # 2. City -> CityWeather -> Weather 순으로 조인하여 최신 날씨 탐색
-        stmt = select(Weather).join(
-            CityWeather, Weather.id == CityWeather.weather_id
-        ).where(
-            CityWeather.city_id == db_city.id,  # 이 도시(city_id)의 날씨 중
-            Weather.date >= three_hours_ago     # 3시간 이내의 날씨
-        ).order_by(desc(Weather.date)).limit(1) # 가장 최신 것
         
-        cached_result = await db.execute(stmt)
-        db_weather = cached_result.scalars().first() # 가장 최신의 유효한 캐시
-
-        # 3. 캐시 유효성 검사
-        if db_weather:
-            # 캐시가 있으면 DB 데이터를 파싱하여 반환
-            print("db에서나간날씨id:",db_weather.id)
-            return json.loads(db_weather.weather_info)
-        
-        # 4. 캐시가 없으면 외부 API 호출
-        print(f"Fetching new weather from API for {city}") # 디버깅용
-        url = "https://api.openweathermap.org/data/3.0/onecall"
+        # 3. 외부 API 호출 (공용 클라이언트 - 연결 재사용/타임아웃/재시도/회로 차단기)
+        logger.info("Fetching new weather from API for %s", city)
         params = {
             "lat": lat,
             "lon": lon,
@@ -62,31 +75,102 @@ class WeatherService:
             "lang": 'kr'
         }
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, params=params)
+        try:
+            response = await get_http_client().get(settings.openweather_url, params=params)
+        except UpstreamUnavailable as exc:
+            # 외부 API 장애 - 오래되었더라도 마지막으로 저장된 날씨로 응답
+            logger.warning("weather upstream unavailable for %s: %s", city, exc)
+            stale = await WeatherCrud.get_latest(db, city)
+            if stale is None:
+                raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                                    detail='날씨 정보를 가져올 수 없습니다. 잠시 후 다시 시도해주세요')
+            return stale[0]
 
-            if response.status_code != 200:
-                # API 호출 실패 시
-                raise HTTPException(status_code=response.status_code, detail=response.json())
-                
-            data=response.json()
+        if response.status_code != 200:
+            # API 호출 실패 시 (키 오류 등 재시도해도 안 되는 응답)
+            raise HTTPException(status_code=response.status_code, detail=response.json())
+            
+        data=response.json()
 
-        # Weather 테이블에 새 데이터 저장
-        new_weather = await WeatherCrud.create(db=db, weather_data=data)
+        # Weather 테이블에 새 데이터 저장 (압축 payload)
+        new_weather = await WeatherCrud.create(db=db, city_id=db_city.id, weather_data=data)
             
-        # city_weather 중간테이블 저장
+        # city_weather 중간테이블 저장 (City.city_weathers 관계 유지용)
         db.add(CityWeather(city_id=db_city.id, weather_id=new_weather.id))
 
-        await db.commit()        
+        fetched_at = new_weather.date
+        await db.flush() # 커밋은 요청이 끝날 때 get_db에서 (미리 조회는 prefetch_upcoming에서)
 
+        # 메모리 캐시는 커밋이 성공한 뒤에 채움 - 롤백되면 저장되지 않은 날씨가 캐시에 남지 않게
+        # (같이 기다리던 요청에는 외부 API 응답을 그대로 돌려줌 - 저장 여부와 관계없이 유효한 날씨)
+        after_commit(db, lambda: WeatherService._remember(city, data, fetched_at))
         return data
+
+    #다가오는 여행(weather_prefetch_days일 이내 시작) 도시의 날씨 미리 조회 - 스케줄러 주기 작업 (main.py)
+    #남은 유효시간이 weather_prefetch_lead초 미만이면 만료 전에 새로 받아 사용자 조회는 항상 캐시에서 처리
+    #요청 세션과 별개로 도시마다 세션을 열고 커밋, 동시 외부 호출은 weather_prefetch_concurrency개까지
+    @staticmethod
+    async def prefetch_upcoming():
+        today = date.today()
+        async with AsyncsessionLocal() as db:
+            cities = await crud_trip.get_upcoming_city_names(
+                db, today, today + timedelta(days=settings.weather_prefetch_days))
+
+        fresh_for = WEATHER_FRESH_FOR - timedelta(seconds=settings.weather_prefetch_lead)
+        semaphore = asyncio.Semaphore(settings.weather_prefetch_concurrency)
+
+        async def refresh(city:str):
+            async with semaphore:
+                async with AsyncsessionLocal() as db:
+                    await weather_flight.do(city, lambda: WeatherService._load_weather(db, city, fresh_for))
+                    await db.commit()
+
+        results = await asyncio.gather(*[refresh(city) for city in cities], return_exceptions=True)
+        failed = 0
+        for city, result in zip(cities, results):
+            if isinstance(result, Exception):
+                failed += 1
+                logger.warning("weather prefetch failed for %s: %r", city, result)
+        return {"cities": len(cities), "failed": failed}
+
+    #메모리 캐시에 저장 - DB 캐시가 만료되는 시각까지만 유지
+    @staticmethod
+    def _remember(city:str, data:dict, fetched_at:datetime):
+        remaining = fetched_at.replace(tzinfo=None) + WEATHER_FRESH_FOR - datetime.utcnow()
+        weather_cache.set(city, data, ttl=remaining.total_seconds())
         
     #delete
+    #weather_retention_days일 지난 날씨를 weather_retention_chunk개씩 나눠 삭제 - 청크마다 커밋하고 잠시 쉼
+    #요청 세션과 별개로 청크마다 세션을 열어 사용 (스케줄러 주기 작업 / 관리용 API에서 호출)
+    #이미 삭제 중이면 기다리지 않고 건너뜀
     @staticmethod
-    async def delete_old_weather(db:AsyncSession):
-        expired_date = datetime.utcnow() - timedelta(days=30)
-        await db.execute(delete(Weather).where(Weather.date < expired_date))
-        await db.commit()
-        return {"msg":"30일 지난 데이터 삭제 완료"}
-        
-            
+    def purge_running() -> bool:
+        return weather_purge_lock.locked()
+
+    @staticmethod
+    async def delete_old_weather():
+        if weather_purge_lock.locked():
+            logger.info("weather purge already running, skipped")
+            return {"msg":"이미 삭제 작업이 실행 중", "skipped":True}
+        async with weather_purge_lock:
+            return await WeatherService._purge_old_weather()
+
+    @staticmethod
+    async def _purge_old_weather():
+        expired_date = datetime.utcnow() - timedelta(days=settings.weather_retention_days)
+        started = time.perf_counter()
+        deleted = 0
+        chunks = 0
+        while True:
+            async with AsyncsessionLocal() as db:
+                count = await WeatherCrud.delete_old_chunk(db, expired_date, settings.weather_retention_chunk)
+                await db.commit()
+            deleted += count
+            chunks += 1
+            if count < settings.weather_retention_chunk:
+                break
+            await asyncio.sleep(settings.weather_retention_pause)
+        return {"msg":f"{settings.weather_retention_days}일 지난 데이터 삭제 완료",
+                "deleted":deleted,
+                "chunks":chunks,
+                "elapsed":round(time.perf_counter() - started, 3)}
@@ -0,0 +1,34 @@
+#도시 목록(xlsx/csv)을 cities 테이블에 일괄 추가하는 스크립트
+#backend 디렉터리에서 실행
+#   python import_cities.py                          # 기본 cities_list_ko.xlsx
+#   python import_cities.py world_cities.csv --batch-size 5000
+#파일 헤더: name, lat, lon, country, ko_name, ko_country
+#(city_name, country) 기준 upsert라 중간에 멈추거나 여러 번 실행해도 중복이 생기지 않음
+import argparse
+import asyncio
+
+from app.db import model
+from app.db.database import async_engine
+from app.core import city_import
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="도시 목록 일괄 추가 (xlsx/csv)")
+    parser.add_argument("path", nargs="?", default=str(city_import.DEFAULT_CITY_FILE))
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    def progress(stats: dict):
+        print(f"{stats['read']} rows read, {stats['upserted']} upserted, "
+              f"{stats['skipped']} skipped ({stats['elapsed']:.1f}s)")
+
+    try:
+        rows = city_import.read_rows(args.path, args.path)
+        stats = await city_import.import_cities(rows, args.batch_size, progress)
+        print(f"Done: {stats}")
+    finally:
+        await async_engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -5,17 +5,40 @@ from app.db import model
 from app.db.database import async_engine, Base
 
 from app.routers import router
+from app.core import derivatives, http, security
+from app.core.scheduler import scheduler, PeriodicJob
+from app.core.settings import settings
+from app.services.weather import WeatherService
+from app.services.city_index import rebuild_city_index
 
 from dotenv import load_dotenv
 
 load_dotenv(dotenv_path=".env")
 
-# 로드시 테이블 자동생성
+# 스키마는 alembic 마이그레이션으로 관리 (alembic upgrade head)
+# AUTO_CREATE_TABLES=true 일 때만 로드시 테이블 자동생성 (로컬/테스트용)
 @asynccontextmanager
 async def lifespan(app:FastAPI):
-    async with async_engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    if settings.auto_create_tables:
+        async with async_engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+    await rebuild_city_index() # 도시 자동완성 메모리 인덱스
+    derivatives.start_executor() # 사진 축소본 생성용 프로세스 풀
+    http.start_http_client() # 외부 API(OpenWeather) 공용 클라이언트
+    # 주기 작업 (app/core/scheduler.py)
+    if settings.weather_prefetch_enabled:
+        scheduler.add(PeriodicJob("weather-prefetch", settings.weather_prefetch_interval,
+                                  WeatherService.prefetch_upcoming, initial_delay=5))
+    scheduler.add(PeriodicJob("city-index-refresh", settings.city_index_refresh_interval,
+                              rebuild_city_index, initial_delay=settings.city_index_refresh_interval))
+    scheduler.add(PeriodicJob("weather-retention", settings.weather_retention_interval,
+                              WeatherService.delete_old_weather, initial_delay=60))
+    scheduler.start()
     yield
+    await scheduler.stop()
+    await http.close_http_client()
+    security.shutdown_executor()
+    derivatives.shutdown_executor()
     await async_engine.dispose()
 
 app = FastAPI(lifespan=lifespan)
@@ -27,6 +50,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"], # 커서 페이지네이션 다음 페이지 헤더
 )
 
 #라우터 등록
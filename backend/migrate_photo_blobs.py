@@ -0,0 +1,148 @@
+#photos.data(LONGBLOB)에 저장된 기존 사진을 blob store로 이전하는 스크립트
+#backend 디렉터리에서 실행
+#   python migrate_photo_blobs.py                  # 100장씩 이전
+#   python migrate_photo_blobs.py --batch-size 500
+#   python migrate_photo_blobs.py --gc             # 어떤 사진도 참조하지 않는 저장소 파일 삭제
+#   python migrate_photo_blobs.py --derivatives    # 축소본이 없는 사진의 축소본 생성
+#   python migrate_photo_blobs.py --dimensions     # 원본 크기(width/height)가 없는 사진의 크기 저장
+#배치마다 커밋하므로 중간에 멈춰도 다시 실행하면 남은 사진부터 이어서 처리
+import argparse
+import asyncio
+import time
+
+from sqlalchemy import select, update
+
+from app.core import derivatives
+from app.core.blob_store import get_blob_store
+from app.db import model
+from app.db.database import AsyncsessionLocal, async_engine
+from app.db.model import Photo
+
+
+async def migrate(batch_size: int):
+    store = get_blob_store()
+    last_id = 0
+    moved = 0
+    started = time.perf_counter()
+
+    while True:
+        # 1. 아직 이전하지 않은 사진을 id 순으로 batch_size만큼 조회
+        async with AsyncsessionLocal() as db:
+            result = await db.execute(
+                select(Photo.id, Photo.data, Photo.content_type)
+                .where(Photo.sha256.is_(None),
+                       Photo.data.is_not(None),
+                       Photo.id > last_id)
+                .order_by(Photo.id)
+                .limit(batch_size))
+            rows = result.all()
+            if not rows:
+                break
+
+            # 2. 저장소에 쓰고, DB에는 해시/크기(이미지는 너비/높이도)만 남기고 data 비우기
+            for photo_id, data, content_type in rows:
+                sha256 = await asyncio.to_thread(store.put, data)
+                width, height = await _dimensions(data, content_type)
+                await db.execute(
+                    update(Photo)
+                    .where(Photo.id == photo_id)
+                    .values(sha256=sha256, size=len(data), width=width, height=height, data=None))
+            await db.commit()
+
+        last_id = rows[-1][0]
+        moved += len(rows)
+        print(f"{moved} photos moved (last id {last_id}, {time.perf_counter() - started:.1f}s)")
+
+    print(f"Done: {moved} photos moved in {time.perf_counter() - started:.1f}s")
+
+
+async def _dimensions(data: bytes, content_type: str | None) -> tuple[int | None, int | None]:
+    if not (content_type or "").startswith("image/"):
+        return None, None
+    return await asyncio.to_thread(derivatives.image_size, data) or (None, None)
+
+
+#blob store로 옮긴 뒤 크기를 모르는 사진 (width 컬럼 추가 전에 업로드/이전된 사진)
+async def fill_dimensions(batch_size: int):
+    store = get_blob_store()
+    last_id = 0
+    filled = 0
+    while True:
+        async with AsyncsessionLocal() as db:
+            result = await db.execute(
+                select(Photo.id, Photo.sha256, Photo.content_type)
+                .where(Photo.sha256.is_not(None),
+                       Photo.width.is_(None),
+                       Photo.content_type.like("image/%"),
+                       Photo.id > last_id)
+                .order_by(Photo.id)
+                .limit(batch_size))
+            rows = result.all()
+            if not rows:
+                break
+            for photo_id, sha256, content_type in rows:
+                with store.open(sha256) as blob:
+                    data = await asyncio.to_thread(blob.read)
+                width, height = await _dimensions(data, content_type)
+                if width is not None:
+                    await db.execute(update(Photo).where(Photo.id == photo_id).values(width=width, height=height))
+                    filled += 1
+            await db.commit()
+        last_id = rows[-1][0]
+    print(f"Dimensions stored for {filled} photos")
+
+
+async def gc():
+    store = get_blob_store()
+    async with AsyncsessionLocal() as db:
+        result = await db.execute(select(Photo.sha256).where(Photo.sha256.is_not(None)).distinct())
+        referenced = set(result.scalars().all())
+
+    removed = 0
+    for key in list(store.keys()):
+        if key not in referenced:
+            store.delete(key)
+            removed += 1
+    print(f"{removed} unreferenced blobs removed")
+
+
+async def make_derivatives():
+    async with AsyncsessionLocal() as db:
+        result = await db.execute(
+            select(Photo.sha256)
+            .where(Photo.sha256.is_not(None), Photo.content_type.like("image/%"))
+            .distinct())
+        keys = result.scalars().all()
+
+    derivatives.start_executor()
+    try:
+        jobs = [derivatives.schedule_derivatives(key) for key in keys]
+        results = await asyncio.gather(*[job for job in jobs if job is not None], return_exceptions=True)
+    finally:
+        derivatives.shutdown_executor()
+    failed = sum(isinstance(result, Exception) for result in results)
+    print(f"Derivatives checked for {len(keys)} photos ({failed} failed)")
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="photos.data -> blob store 이전")
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument("--gc", action="store_true", help="참조 없는 저장소 파일 삭제")
+    parser.add_argument("--derivatives", action="store_true", help="축소본 생성")
+    parser.add_argument("--dimensions", action="store_true", help="원본 크기 저장")
+    args = parser.parse_args()
+    try:
+        if args.gc:
+            await gc()
+        elif args.derivatives:
+            await make_derivatives()
+        elif args.dimensions:
+            await fill_dimensions(args.batch_size)
+        else:
+            await migrate(args.batch_size)
+    finally:
+        await async_engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,39 @@
+#테스트 공통 설정 - backend 디렉터리에서 `pytest` 로 실행
+#앱 설정(.env)이 없어도 돌도록 필수 환경변수를 채우고, DB는 임시 디렉터리의 SQLite 파일 사용
+#(app 모듈은 import 시점에 settings/엔진을 만들므로 이 파일에서 먼저 환경변수를 지정)
+import os
+import tempfile
+
+_tmp_dir = tempfile.mkdtemp(prefix="planit-test-")
+os.environ.setdefault("DB_USER", "test")
+os.environ.setdefault("DB_PASSWORD", "test")
+os.environ.setdefault("DB_NAME", "test")
+os.environ.setdefault("SECRET_KEY", "test-secret")
+os.environ.setdefault("ALGORITHM", "HS256")
+os.environ.setdefault("ACCESS_TOKEN_EXPIRE_MINUTES", "60")
+os.environ.setdefault("openweather_api_key", "test")
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{_tmp_dir}/planit-test.db"
+os.environ["BLOB_STORE_ROOT"] = os.path.join(_tmp_dir, "media")
+
+import pytest
+
+from app.db import model  # 모든 모델을 Base.metadata에 등록
+from app.db.database import AsyncsessionLocal, Base, async_engine
+from app import routers  # noqa: F401 - main.py와 같은 순서로 import (routers <-> services 순환 import)
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+#테스트마다 빈 테이블을 만들고 끝나면 삭제 (FTS5 테이블/트리거도 모델 DDL 이벤트로 같이 생성)
+@pytest.fixture
+async def db(anyio_backend):
+    async with async_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with AsyncsessionLocal() as session:
+        yield session
+    async with async_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+    await async_engine.dispose()
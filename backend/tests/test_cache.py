@@ -0,0 +1,112 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from app.core import cache as cache_module
+from app.core.cache import SingleFlight, TTLCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache_module, "time", SimpleNamespace(monotonic=lambda: now[0]))
+    return now
+
+
+def test_ttl_cache_expires_entries(clock):
+    cache = TTLCache(maxsize=10, ttl=60)
+    cache.set("a", 1)
+    clock[0] += 59
+    assert cache.get("a") == 1
+    clock[0] += 1
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_ttl_cache_per_item_ttl_is_capped_by_default(clock):
+    cache = TTLCache(maxsize=10, ttl=60)
+    cache.set("short", 1, ttl=5)
+    cache.set("long", 2, ttl=600)
+    cache.set("expired", 3, ttl=0)
+    clock[0] += 6
+    assert cache.get("short") is None
+    assert cache.get("long") == 2
+    assert cache.get("expired") is None
+    clock[0] += 60
+    assert cache.get("long") is None
+
+
+def test_ttl_cache_evicts_least_recently_used(clock):
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1 and cache.get("c") == 3
+
+
+def test_ttl_cache_delete_and_clear():
+    cache = TTLCache(maxsize=10, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.delete("a")
+    cache.delete("missing")
+    assert cache.get("a") is None and len(cache) == 1
+    cache.clear()
+    assert len(cache) == 0
+
+
+@pytest.mark.anyio
+async def test_single_flight_shares_one_call():
+    flight = SingleFlight()
+    calls = 0
+
+    async def load():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return calls
+
+    results = await asyncio.gather(*[flight.do("seoul", load) for _ in range(5)])
+    assert results == [1] * 5
+    assert calls == 1
+    assert await flight.do("seoul", load) == 2  # 끝난 뒤에는 새로 실행
+
+
+@pytest.mark.anyio
+async def test_single_flight_propagates_errors_to_waiters():
+    flight = SingleFlight()
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise ValueError("upstream down")
+
+    results = await asyncio.gather(*[flight.do("busan", fail) for _ in range(3)], return_exceptions=True)
+    assert all(isinstance(result, ValueError) for result in results)
+
+
+@pytest.mark.anyio
+async def test_single_flight_retries_when_leader_is_cancelled():
+    flight = SingleFlight()
+    started = asyncio.Event()
+    calls = 0
+
+    async def load():
+        nonlocal calls
+        calls += 1
+        started.set()
+        await asyncio.sleep(0.05)
+        return "data"
+
+    leader = asyncio.create_task(flight.do("jeju", load))
+    await started.wait()
+    follower = asyncio.create_task(flight.do("jeju", load))
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    assert await follower == "data"
+    assert calls == 2
+    with pytest.raises(asyncio.CancelledError):
+        await leader
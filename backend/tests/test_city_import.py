@@ -0,0 +1,57 @@
+import io
+import zipfile
+
+import pytest
+from fastapi import HTTPException, UploadFile
+
+from app.core import city_import
+from app.core.settings import BASE_DIR
+from app.services.city_service import CityService
+
+HEADER = "name,lat,lon,country,ko_name,ko_country\n"
+
+
+def upload(name: str, data: bytes) -> UploadFile:
+    return UploadFile(file=io.BytesIO(data), filename=name)
+
+
+def test_normalize_row_skips_incomplete_rows():
+    row = {"name": " Seoul ", "lat": "37.5", "lon": "127", "country": "KR", "ko_name": "서울", "ko_country": "대한민국"}
+    assert city_import.normalize_row(row) == {"city_name": "Seoul", "lat": 37.5, "lon": 127.0, "country": "KR",
+                                              "ko_name": "서울", "ko_country": "대한민국"}
+    assert city_import.normalize_row({**row, "ko_name": ""}) is None
+    assert city_import.normalize_row({**row, "lat": "north"}) is None
+
+
+def test_csv_rows_are_read_with_bom():
+    data = ("﻿" + HEADER + "Busan,35.1,129.0,KR,부산,대한민국\n").encode()
+    assert [row["name"] for row in city_import.read_csv_rows(io.BytesIO(data))] == ["Busan"]
+
+
+def zip_without_workbook() -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        archive.writestr("hello.txt", "not a workbook")
+    return buffer.getvalue()
+
+
+@pytest.mark.parametrize("name, data, message", [
+    ("cities.xlsx", b"not a zip file", "xlsx 파일을 열 수 없습니다"),
+    ("cities.xlsx", (BASE_DIR / "cities_list_ko.xlsx").read_bytes()[:4096], "xlsx 파일을 열 수 없습니다"),
+    ("cities.xlsx", zip_without_workbook(), "xlsx 파일을 열 수 없습니다"),
+    ("cities.csv", (HEADER + "Seoul,37.5,127,KR,서울,대한민국\n").encode() + b"\xff\xfe,1,2\n", "csv 파일 3행"),
+])
+@pytest.mark.anyio
+async def test_unreadable_files_are_400(db, name, data, message):
+    with pytest.raises(HTTPException) as exc_info:
+        await CityService().import_cities(upload(name, data))
+    assert exc_info.value.status_code == 400
+    assert message in exc_info.value.detail
+
+
+@pytest.mark.anyio
+async def test_csv_import_upserts_and_rebuilds_index(db):
+    data = (HEADER + "Seoul,37.5,127,KR,서울,대한민국\nSeoul,37.6,127,KR,서울,대한민국\n,,,,,\n").encode()
+    stats = await CityService().import_cities(upload("cities.csv", data))
+    assert (stats["read"], stats["upserted"], stats["skipped"]) == (3, 1, 1)
+    assert [city.lat for city in await CityService().search_cities("서울")] == [37.6]
@@ -0,0 +1,88 @@
+import pytest
+
+from app.db.schema.cities import CityCreate
+from app.services.city_index import CityEntry, CityIndex, city_index, is_choseong_query, to_choseong
+from app.services.city_service import CityService
+
+
+def entry(city_id, city_name, ko_name, country="KR", ko_country="대한민국"):
+    return CityEntry(id=city_id, city_name=city_name, ko_name=ko_name, country=country,
+                     ko_country=ko_country, is_domestic=country == "KR", lat=0.0, lon=0.0)
+
+
+@pytest.fixture
+def index():
+    return CityIndex([
+        entry(1, "Seoul", "서울"),
+        entry(2, "Suwon", "수원"),
+        entry(3, "Busan", "부산"),
+        entry(4, "Sapporo", "삿포로", "JP", "일본"),
+        entry(5, "Seosan", "서산"),
+    ])
+
+
+def names(cities):
+    return [city.ko_name for city in cities]
+
+
+def test_to_choseong():
+    assert to_choseong("서울") == "ㅅㅇ"
+    assert to_choseong("부산2") == "ㅂㅅ2"
+    assert is_choseong_query("ㅅㅇ")
+    assert not is_choseong_query("ㅅ울")
+
+
+def test_choseong_query_matches_prefix_before_substring(index):
+    assert names(index.search("ㅅㅇ")) == ["서울", "수원"]
+    #같은 순위는 이름이 짧은 순, 이름순
+    assert names(index.search("ㅅ")) == ["서산", "서울", "수원", "삿포로", "부산"]
+
+
+def test_choseong_query_matches_country(index):
+    assert names(index.search("ㅇㅂ")) == ["삿포로"]
+
+
+def test_exact_then_prefix_then_substring(index):
+    assert names(index.search("서")) == ["서산", "서울"]
+    assert names(index.search("산")) == ["부산", "서산"]
+    assert names(index.search("서산")) == ["서산"]
+
+
+def test_english_names_are_case_and_space_insensitive(index):
+    assert names(index.search(" SE ")) == ["서산", "서울"]
+    assert names(index.search("japan")) == []
+    assert names(index.search("jp")) == ["삿포로"]
+
+
+def test_limit_and_empty_query(index):
+    assert len(index.search("ㅅ", limit=2)) == 2
+    assert index.search("   ") == []
+
+
+def test_add_and_remove(index):
+    index.add(entry(6, "Seogwipo", "서귀포"))
+    assert "서귀포" in names(index.search("ㅅㄱ"))
+    index.remove(6)
+    index.remove(999)
+    assert names(index.search("ㅅㄱ")) == []
+    assert len(index) == 5
+
+
+@pytest.mark.anyio
+async def test_city_service_updates_index_only_after_commit(db):
+    city_index.replace([])
+    city = CityCreate(city_name="Daegu", ko_name="대구", country="KR", ko_country="대한민국", lat=35.87, lon=128.6)
+
+    await CityService().create_city(db, city)
+    assert city_index.search("대구") == []
+    await db.rollback()
+    assert city_index.search("대구") == []
+
+    created = await CityService().create_city(db, city)
+    await db.commit()
+    assert [found.id for found in city_index.search("ㄷㄱ")] == [created.id]
+
+    await CityService().delete_city(db, created.id)
+    assert len(city_index.search("대구")) == 1
+    await db.commit()
+    assert city_index.search("대구") == []
@@ -0,0 +1,68 @@
+import asyncio
+import io
+
+import pytest
+from PIL import Image
+
+from app.core import derivatives
+from app.core.blob_store import LocalBlobStore
+from app.core.settings import settings
+
+pytestmark = pytest.mark.anyio
+
+
+def png(width: int, height: int, orientation: int | None = None) -> bytes:
+    buffer = io.BytesIO()
+    exif = Image.Exif()
+    if orientation:
+        exif[0x0112] = orientation
+    Image.new("RGB", (width, height)).save(buffer, format="PNG", exif=exif)
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    store = LocalBlobStore(tmp_path)
+    monkeypatch.setattr(derivatives, "get_blob_store", lambda: store)
+    monkeypatch.setattr(settings, "photo_derivative_widths", [320, 640])
+    return store
+
+
+def test_image_size_reads_header_with_exif_rotation():
+    assert derivatives.image_size(png(800, 600)) == (800, 600)
+    assert derivatives.image_size(png(800, 600, orientation=6)) == (600, 800)
+    assert derivatives.image_size(b"not an image") is None
+
+
+def test_pending_uses_stored_width(store):
+    key = store.put(png(800, 600))
+    assert derivatives.derivative_pending(key, 300, 800)
+    #원본이 축소본보다 작거나 크기를 모르면 원본이 최종 응답
+    assert not derivatives.derivative_pending(key, 300, 320)
+    assert not derivatives.derivative_pending(key, 300, None)
+    assert not derivatives.derivative_pending(key, 1000, 800)
+
+
+async def test_failed_generation_is_final_until_rescheduled(store, monkeypatch):
+    key = store.put(png(800, 600))
+
+    #프로세스 풀이 없으면 생성하지 않으므로 실패로 표시
+    monkeypatch.setattr(derivatives, "_executor", None)
+    assert derivatives.schedule_derivatives(key) is None
+    assert not derivatives.derivative_pending(key, 300, 800)
+
+    future = asyncio.get_running_loop().create_future()
+    future.set_exception(OSError("broken"))
+    derivatives._set_failed(key, False)
+    derivatives._log_result(key, future)
+    assert not derivatives.derivative_pending(key, 300, 800)
+
+    derivatives._set_failed(key, False)
+    assert derivatives.derivative_pending(key, 300, 800)
+
+
+def test_delete_removes_marker(store):
+    key = store.put(png(10, 10))
+    derivatives._set_failed(key, True)
+    store.delete(key)
+    assert not store.marker_path(key, derivatives.FAILED_MARKER).exists()
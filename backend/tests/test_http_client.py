@@ -0,0 +1,107 @@
+import asyncio
+
+import httpx
+import pytest
+
+from app.core.http import CircuitBreaker, ResilientClient, UpstreamUnavailable
+
+pytestmark = pytest.mark.anyio
+
+URL = "http://upstream.test/onecall"
+
+
+#응답 목록을 차례로 돌려주는 stub 외부 API - int는 상태코드, 예외 클래스는 그 예외 발생
+class StubUpstream:
+    def __init__(self, *replies):
+        self.replies = list(replies)
+        self.calls = 0
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.calls += 1
+        reply = self.replies.pop(0) if len(self.replies) > 1 else self.replies[0]
+        if isinstance(reply, type) and issubclass(reply, Exception):
+            raise reply("stub failure", request=request)
+        return httpx.Response(reply, json={"status": reply})
+
+
+def make_client(upstream, retries=2, failures=3, reset=30.0):
+    client = httpx.AsyncClient(transport=httpx.MockTransport(upstream))
+    return ResilientClient(client, CircuitBreaker(failures, reset), retries=retries, backoff=0)
+
+
+async def test_retries_5xx_then_returns_success():
+    upstream = StubUpstream(503, 502, 200)
+    client = make_client(upstream)
+    response = await client.get(URL)
+    assert response.status_code == 200
+    assert upstream.calls == 3
+    assert client.breaker.failures == 0
+
+
+async def test_retries_timeouts_and_connection_errors():
+    upstream = StubUpstream(httpx.ReadTimeout, httpx.ConnectError, 200)
+    response = await make_client(upstream).get(URL)
+    assert response.status_code == 200
+    assert upstream.calls == 3
+
+
+async def test_client_errors_are_returned_without_retry():
+    upstream = StubUpstream(401)
+    response = await make_client(upstream).get(URL)
+    assert response.status_code == 401
+    assert upstream.calls == 1
+
+
+async def test_exhausted_retries_raise_and_count_one_failure():
+    upstream = StubUpstream(500)
+    client = make_client(upstream, retries=2)
+    with pytest.raises(UpstreamUnavailable):
+        await client.get(URL)
+    assert upstream.calls == 3
+    assert client.breaker.failures == 1
+    assert client.breaker.state == "closed"
+
+
+async def test_breaker_opens_and_short_circuits_calls():
+    upstream = StubUpstream(503)
+    client = make_client(upstream, retries=0, failures=2)
+    for _ in range(2):
+        with pytest.raises(UpstreamUnavailable):
+            await client.get(URL)
+    assert client.breaker.state == "open"
+
+    with pytest.raises(UpstreamUnavailable, match="circuit open"):
+        await client.get(URL)
+    assert upstream.calls == 2
+
+
+async def test_half_open_allows_one_probe_and_closes_on_success():
+    upstream = StubUpstream(503, 200)
+    client = make_client(upstream, retries=0, failures=1, reset=0.05)
+    with pytest.raises(UpstreamUnavailable):
+        await client.get(URL)
+    await asyncio.sleep(0.06)
+    assert client.breaker.state == "half-open"
+
+    assert client.breaker.allow()
+    assert not client.breaker.allow()  # 시험 요청 중에는 다른 요청 차단
+    await asyncio.sleep(0.06)
+
+    response = await client.get(URL)
+    assert response.status_code == 200
+    assert client.breaker.state == "closed"
+
+
+async def test_failed_probe_reopens_breaker():
+    upstream = StubUpstream(503)
+    client = make_client(upstream, retries=0, failures=1, reset=0.05)
+    with pytest.raises(UpstreamUnavailable):
+        await client.get(URL)
+    await asyncio.sleep(0.06)
+
+    with pytest.raises(UpstreamUnavailable, match="503"):
+        await client.get(URL)
+    assert client.breaker.state == "open"
+    with pytest.raises(UpstreamUnavailable, match="circuit open"):
+        await client.get(URL)
+    assert upstream.calls == 2
@@ -0,0 +1,46 @@
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import Column, Integer, DateTime, MetaData, Table
+from sqlalchemy.dialects import sqlite
+
+from app.core.pagination import (decode_cursor, decode_rank_cursor, encode_cursor, encode_rank_cursor,
+                                 keyset_filter, next_cursor)
+
+table = Table("t", MetaData(), Column("id", Integer), Column("created_at", DateTime))
+
+
+def test_cursor_round_trip():
+    created_at = datetime(2030, 1, 2, 3, 4, 5, 678000)
+    cursor = encode_cursor(created_at, 42)
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == (created_at, 42)
+
+
+def test_rank_cursor_round_trip():
+    assert decode_rank_cursor(encode_rank_cursor(12345, 7)) == (12345, 7)
+
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", "", encode_rank_cursor(1, 2) + "x", "WzFd"])
+def test_invalid_cursor_is_400(cursor):
+    with pytest.raises(HTTPException) as exc_info:
+        decode_cursor(cursor)
+    assert exc_info.value.status_code == 400
+
+
+def test_keyset_filter_descending_and_ascending():
+    compile_ = lambda clause: str(clause.compile(dialect=sqlite.dialect(), compile_kwargs={"literal_binds": True}))
+    descending = compile_(keyset_filter(table.c.created_at, table.c.id, datetime(2030, 1, 1), 5))
+    assert "t.created_at < '2030-01-01 00:00:00.000000'" in descending
+    assert "t.id < 5" in descending
+    ascending = compile_(keyset_filter(table.c.created_at, table.c.id, datetime(2030, 1, 1), 5, descending=False))
+    assert "t.created_at > " in ascending and "t.id > 5" in ascending
+
+
+def test_next_cursor_only_on_full_page():
+    rows = [SimpleNamespace(id=i, created_at=datetime(2030, 1, i)) for i in (3, 2, 1)]
+    assert next_cursor(rows[:2], limit=3) is None
+    assert next_cursor([], limit=3) is None
+    assert decode_cursor(next_cursor(rows, limit=3)) == (datetime(2030, 1, 1), 1)
@@ -0,0 +1,68 @@
+import pytest
+from sqlalchemy import update
+
+from app.core.pagination import decode_rank_cursor
+from app.db.crud.review_search import ReviewSearchCrud
+from app.db.model import Review
+
+pytestmark = pytest.mark.anyio
+
+
+async def add_reviews(db, *texts):
+    reviews = [Review(user_id=1, trip_id=1, city_id=1, title=title, content=content, rating=5)
+               for title, content in texts]
+    db.add_all(reviews)
+    await db.flush()
+    return [review.id for review in reviews]
+
+
+async def search_all(db, term, limit):
+    found, cursor, pages = [], None, 0
+    while True:
+        reviews, cursor = await ReviewSearchCrud.search(db, term, limit=limit, cursor=cursor)
+        found += [review.id for review in reviews]
+        pages += 1
+        if cursor is None:
+            return found, pages
+
+
+async def test_search_finds_substring_with_trigram_index(db):
+    ids = await add_reviews(db, ("부산 해운대 여행", "바다가 좋았다"), ("서울 여행", "경복궁 산책"))
+    reviews, _ = await ReviewSearchCrud.search(db, "해운대")
+    assert [review.id for review in reviews] == [ids[0]]
+
+
+async def test_two_syllable_hangul_uses_word_prefix_index(db):
+    ids = await add_reviews(db, ("서울에서 삼일", "맛집 투어"), ("부산 여행", "서울보다 따뜻"), ("제주", "바다"))
+    reviews, _ = await ReviewSearchCrud.search(db, "서울")
+    assert sorted(review.id for review in reviews) == sorted(ids[:2])
+
+    query, _ = ReviewSearchCrud._sqlite_query("서울")
+    assert "review_fts_word" in str(query)
+
+
+async def test_cursor_pages_cover_every_match_once(db):
+    ids = await add_reviews(db, *[(f"여행 기록 {i}", "여행 " * (i % 3 + 1)) for i in range(11)])
+    await add_reviews(db, ("관계없는 글", "내용"))
+
+    found, pages = await search_all(db, "여행", limit=4)
+    assert sorted(found) == sorted(ids)
+    assert len(found) == len(set(found))
+    assert pages == 3
+
+
+async def test_tied_scores_page_by_id_with_integer_cursor(db):
+    ids = await add_reviews(db, *[("서울 야경", "남산타워") for _ in range(5)])
+    _, cursor = await ReviewSearchCrud.search(db, "서울", limit=2)
+    bucket, row_id = decode_rank_cursor(cursor)
+    assert isinstance(bucket, int) and row_id == ids[3]
+
+    found, _ = await search_all(db, "서울", limit=2)
+    assert found == sorted(ids, reverse=True)
+
+
+async def test_index_follows_review_updates(db):
+    [review_id] = await add_reviews(db, ("강릉 바다", "커피거리"))
+    await db.execute(update(Review).where(Review.id == review_id).values(title="속초 바다"))
+    assert (await ReviewSearchCrud.search(db, "강릉"))[0] == []
+    assert [review.id for review in (await ReviewSearchCrud.search(db, "속초"))[0]] == [review_id]
@@ -0,0 +1,120 @@
+from datetime import date, datetime
+
+import pytest
+from sqlalchemy import event, select
+
+from app.db.crud import crud_trip
+from app.db.database import async_engine
+from app.db.model.schedule import Schedule
+from app.db.model.trip_city import TripCity
+from app.db.model.trip_day import TripDay
+from app.db.schema.trip import TripCreate, TripUpdate
+from app.db.schema.trip_city import TripCityUpdate
+from app.services.trip_service import TripService
+
+pytestmark = pytest.mark.anyio
+
+service = TripService()
+
+
+def city(city_id, start, end):
+    return TripCityUpdate(city_id=city_id, start_date=date(2030, 1, start), end_date=date(2030, 1, end))
+
+
+async def create_trip(db, days=3, cities=((1, 1, 2), (2, 3, 3))):
+    trip = await service.create_trip(db, TripCreate(
+        title="trip", start_date=date(2030, 1, 1), end_date=date(2030, 1, days), user_id=1,
+        trip_cities=[city(*values).model_dump() for values in cities]))
+    return trip.id
+
+
+async def trip_city_rows(db, trip_id):
+    return {(city_id, start.day, end.day): row_id
+            for row_id, city_id, start, end in await crud_trip.get_trip_city_rows(db, trip_id)}
+
+
+async def day_sequences(db, trip_id):
+    result = await db.execute(select(TripDay.day_sequence).where(TripDay.trip_id == trip_id)
+                              .order_by(TripDay.day_sequence))
+    return list(result.scalars())
+
+
+#실행된 SQL 문 첫 단어 (SELECT/INSERT/UPDATE/DELETE)
+@pytest.fixture
+def statements():
+    executed = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement.split()[0].upper())
+
+    event.listen(async_engine.sync_engine, "before_cursor_execute", record)
+    yield executed
+    event.remove(async_engine.sync_engine, "before_cursor_execute", record)
+
+
+async def test_unchanged_cities_issue_no_writes(db, statements):
+    trip_id = await create_trip(db)
+    before = await trip_city_rows(db, trip_id)
+    statements.clear()
+
+    await service._reconcile_trip_cities(db, trip_id, [city(2, 3, 3), city(1, 1, 2)])
+    assert statements == ["SELECT"]
+    assert await trip_city_rows(db, trip_id) == before
+
+
+async def test_changed_dates_update_rows_in_place(db):
+    trip_id = await create_trip(db)
+    before = await trip_city_rows(db, trip_id)
+
+    await service._reconcile_trip_cities(db, trip_id, [city(1, 1, 1), city(2, 2, 3)])
+    after = await trip_city_rows(db, trip_id)
+    assert after == {(1, 1, 1): before[(1, 1, 2)], (2, 2, 3): before[(2, 3, 3)]}
+
+
+async def test_added_and_removed_cities_insert_and_delete(db):
+    trip_id = await create_trip(db)
+    before = await trip_city_rows(db, trip_id)
+
+    await service._reconcile_trip_cities(db, trip_id, [city(1, 1, 2), city(3, 3, 3)])
+    after = await trip_city_rows(db, trip_id)
+    assert set(after) == {(1, 1, 2), (3, 3, 3)}
+    assert after[(1, 1, 2)] == before[(1, 1, 2)]
+
+
+async def test_duplicate_city_entries_are_matched_one_to_one(db):
+    trip_id = await create_trip(db, cities=((1, 1, 1), (1, 1, 1)))
+    await service._reconcile_trip_cities(db, trip_id, [city(1, 1, 1)])
+    rows = await crud_trip.get_trip_city_rows(db, trip_id)
+    assert len(rows) == 1
+
+
+async def test_shrinking_trip_removes_tail_days_and_their_schedules(db):
+    trip_id = await create_trip(db, days=4)
+    days = {day.day_sequence: day.id for day in await crud_trip.get_trip_days_by_trip(db, trip_id)}
+    db.add_all([Schedule(trip_day_id=days[sequence], schedule_content=f"day {sequence}",
+                         schedule_datetime=datetime(2030, 1, sequence)) for sequence in (1, 3, 4)])
+    await db.flush()
+
+    await crud_trip.resize_trip_days(db, trip_id, 4, 2)
+    assert await day_sequences(db, trip_id) == [1, 2]
+    result = await db.execute(select(Schedule.schedule_content))
+    assert list(result.scalars()) == ["day 1"]
+
+
+async def test_growing_trip_appends_days_and_keeps_existing(db):
+    trip_id = await create_trip(db, days=2)
+    kept = {day.id for day in await crud_trip.get_trip_days_by_trip(db, trip_id)}
+
+    await crud_trip.resize_trip_days(db, trip_id, 2, 5)
+    assert await day_sequences(db, trip_id) == [1, 2, 3, 4, 5]
+    assert kept <= {day.id for day in await crud_trip.get_trip_days_by_trip(db, trip_id)}
+
+
+async def test_update_trip_resizes_days_from_new_dates(db):
+    trip_id = await create_trip(db, days=3)
+    trip = await service.update_trip(db, trip_id, TripUpdate(end_date=date(2030, 1, 5)))
+    assert sorted(day.day_sequence for day in trip.trip_day) == [1, 2, 3, 4, 5]
+
+    trip = await service.update_trip(db, trip_id, TripUpdate(start_date=date(2030, 1, 4)))
+    assert sorted(day.day_sequence for day in trip.trip_day) == [1, 2]
+    assert {(c.city_id, c.start_date.day) for c in trip.trip_cities} == {(1, 1), (2, 3)}
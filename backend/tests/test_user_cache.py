@@ -0,0 +1,63 @@
+import pytest
+
+from app.db.crud import user as user_crud
+from app.db.database import AsyncsessionLocal
+from app.db.schema.user import UserUpdate
+from app.services import user as user_service
+from app.services.user import delete_user, get_current_user_by_id, update_user, user_cache
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def user_id(db):
+    user_cache.clear()
+    user = await user_crud.create_user(db, "a", "a@a.com", "hashed")
+    await db.commit()
+    yield user.id
+    user_cache.clear()
+
+
+async def test_cached_principal_skips_db(db, user_id, monkeypatch):
+    assert (await get_current_user_by_id(db, user_id)).username == "a"
+
+    async def fail(*args):
+        raise AssertionError("DB read on cache hit")
+    monkeypatch.setattr(user_crud, "get_user_by_id", fail)
+    assert (await get_current_user_by_id(db, user_id)).username == "a"
+
+
+async def test_concurrent_read_before_commit_is_evicted_after_commit(db, user_id):
+    await delete_user(db, user_id)
+
+    #커밋 전 다른 요청이 이전 행을 다시 읽어 캐시
+    async with AsyncsessionLocal() as other:
+        assert await get_current_user_by_id(other, user_id) is not None
+    assert user_cache.get(user_id) is not None
+
+    await db.commit()
+    assert user_cache.get(user_id) is None
+    async with AsyncsessionLocal() as other:
+        assert await get_current_user_by_id(other, user_id) is None
+
+
+async def test_rollback_discards_after_commit_callbacks(db, user_id):
+    await update_user(db, user_id, UserUpdate(username="b"))
+    await db.rollback()
+    assert db.sync_session.info.get("after_commit") is None
+
+    async with AsyncsessionLocal() as other:
+        assert (await get_current_user_by_id(other, user_id)).username == "a"
+
+
+async def test_read_overlapping_invalidation_is_not_cached(db, user_id, monkeypatch):
+    read = user_crud.get_user_by_id
+
+    async def read_then_invalidate(session, target_id):
+        user = await read(session, target_id)
+        user_service.invalidate_user(target_id)  # 읽는 도중 다른 요청이 수정
+        return user
+    monkeypatch.setattr(user_crud, "get_user_by_id", read_then_invalidate)
+
+    assert await get_current_user_by_id(db, user_id) is not None
+    assert user_cache.get(user_id) is None
@@ -0,0 +1,117 @@
+from datetime import datetime, timedelta
+
+import httpx
+import pytest
+from fastapi import FastAPI, HTTPException
+from sqlalchemy import update
+
+from app.core.http import CircuitBreaker, ResilientClient
+from app.core.settings import settings
+from app.db.crud import WeatherCrud
+from app.db.model import City, Weather
+from app.routers import weather as weather_router
+from app.services import weather as weather_service
+from app.services.weather import WeatherService, weather_cache, weather_purge_lock
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def upstream(monkeypatch):
+    replies = []
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        status = replies.pop(0) if len(replies) > 1 else replies[0]
+        return httpx.Response(status, json={"current": {"temp": 21.5}})
+
+    client = ResilientClient(httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+                             CircuitBreaker(5, 30.0), retries=1, backoff=0)
+    monkeypatch.setattr(weather_service, "get_http_client", lambda: client)
+    weather_cache.clear()
+    yield replies, calls
+    weather_cache.clear()
+
+
+async def add_city(db) -> City:
+    city = City(city_name="Seoul", ko_name="서울", country="KR", ko_country="대한민국", lat=37.56, lon=126.97)
+    db.add(city)
+    await db.flush()
+    return city
+
+
+async def test_fetches_and_stores_weather(db, upstream):
+    replies, calls = upstream
+    replies.append(200)
+    city = await add_city(db)
+
+    data = await WeatherService.get_weather(db, "Seoul")
+    assert data == {"current": {"temp": 21.5}}
+    assert calls[0].url.params["lat"] == str(city.lat)
+
+    #저장된 날씨와 메모리 캐시로 다시 조회하면 외부 호출 없음
+    assert (await WeatherCrud.get_latest(db, "Seoul"))[0] == data
+    assert await WeatherService.get_weather(db, "Seoul") == data
+    assert len(calls) == 1
+
+
+async def test_upstream_outage_falls_back_to_stale_weather(db, upstream):
+    replies, calls = upstream
+    replies.append(503)
+    city = await add_city(db)
+    stale = await WeatherCrud.create(db, city_id=city.id, weather_data={"current": {"temp": 3.0}})
+    await db.execute(update(Weather).where(Weather.id == stale.id)
+                     .values(date=datetime.utcnow() - timedelta(days=1)))
+
+    data = await WeatherService.get_weather(db, "Seoul")
+    assert data == {"current": {"temp": 3.0}}
+    assert len(calls) == 2  # 재시도 1번 후 실패
+
+
+async def test_upstream_outage_without_stored_weather_is_503(db, upstream):
+    replies, _ = upstream
+    replies.append(503)
+    await add_city(db)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await WeatherService.get_weather(db, "Seoul")
+    assert exc_info.value.status_code == 503
+
+
+async def test_memory_cache_is_filled_only_after_commit(db, upstream):
+    replies, _ = upstream
+    replies.append(200)
+    await add_city(db)
+    await db.commit()
+
+    #롤백되면 저장되지 않은 날씨가 메모리 캐시에 남지 않음
+    await WeatherService.get_weather(db, "Seoul")
+    assert weather_cache.get("Seoul") is None
+    await db.rollback()
+    assert weather_cache.get("Seoul") is None
+
+    await WeatherService.get_weather(db, "Seoul")
+    await db.commit()
+    assert weather_cache.get("Seoul") == {"current": {"temp": 21.5}}
+
+
+async def test_purge_is_skipped_while_another_is_running(db):
+    async with weather_purge_lock:
+        assert WeatherService.purge_running()
+        assert (await WeatherService.delete_old_weather())["skipped"]
+    assert (await WeatherService.delete_old_weather())["deleted"] == 0
+
+
+async def test_manual_purge_needs_internal_token(db, monkeypatch):
+    monkeypatch.setattr(settings, "internal_api_token", "secret")
+    app = FastAPI()
+    app.include_router(weather_router.router)
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        assert (await client.delete("/weather/delete-old-weather")).status_code == 403
+
+        headers = {"X-Internal-Token": "secret"}
+        assert (await client.delete("/weather/delete-old-weather", headers=headers)).status_code == 202
+        #이미 삭제 중이면 새로 시작하지 않음
+        async with weather_purge_lock:
+            assert (await client.delete("/weather/delete-old-weather", headers=headers)).status_code == 409
@@ -26,8 +26,16 @@ if os.path.exists("requirements.txt"):
 else:
     existing = set()
 
+# 개발/테스트 전용 패키지(requirements-dev.txt)는 앱 이미지에 설치되지 않도록 제외
+dev_only = set()
+if os.path.exists("requirements-dev.txt"):
+    with open("requirements-dev.txt", "r") as f:
+        dev_only = {line.split("==")[0].strip().lower() for line in f.read().splitlines()
+                    if line.strip() and not line.startswith(("-", "#"))}
+
 # 4. 새로 추가된 패키지 필터링
-new_packages = [pkg for pkg in installed if pkg not in existing]
+new_packages = [pkg for pkg in installed
+                if pkg not in existing and pkg.split("==")[0].lower() not in dev_only]
 
 # 5. requirements.txt 업데이트
 if new_packages: